@@ -0,0 +1,23 @@
+# Shared parameters for the asv-style benchmarks in this directory
+SIZES = [1, 100, 10_000, 1_000_000, 10_000_000]
+# Sizes for paths that build one Python object per element
+OBJECT_SIZES = [1, 100, 10_000, 100_000]
+YEARS = [-10_000, -214, 0, 214, 10_000]
+
+
+def date_array(size, year=214, consecutive=False):
+    """
+    MarsDateArray of size dates from year on: consecutive sols, or random
+    dates spread over 20 years (fixed seed).
+    """
+    import numpy as np
+
+    from mars_dtc import DarianCalendar, MarsDateArray
+
+    cal = DarianCalendar()
+    start = cal.to_ordinal(year, 1, 1)
+    if consecutive:
+        ordinals = start + np.arange(size, dtype="int64")
+    else:
+        ordinals = start + np.random.default_rng(0).integers(0, 20 * 669, size)
+    return MarsDateArray._simple_new(ordinals.astype("int64"), cal)
@@ -0,0 +1,128 @@
+"""
+Run the asv-style benchmarks without asv installed:
+
+    python -m benchmarks [--max-size N] [--filter TEXT] [--output FILE]
+
+time_* methods report the best per-call wall time over a few repeats and
+peakmem_* methods the peak traced allocation (tracemalloc) of one call.
+Parameter combinations whose "size"/"periods" exceed --max-size are skipped,
+as are those whose setup raises NotImplementedError (the asv convention).
+"""
+import argparse
+import importlib
+import inspect
+import itertools
+import pkgutil
+import sys
+import time
+import tracemalloc
+
+import benchmarks
+
+_SIZE_PARAMS = ("size", "periods")
+
+
+def _discover(pattern):
+    for info in pkgutil.iter_modules(benchmarks.__path__):
+        if not info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module(f"benchmarks.{info.name}")
+        for cls_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            for name in sorted(vars(cls)):
+                if name.startswith(("time_", "peakmem_")):
+                    label = f"{info.name}.{cls_name}.{name}"
+                    if pattern in label:
+                        yield label, cls, name
+
+
+def _param_grid(cls, max_size):
+    params = getattr(cls, "params", None)
+    if params is None:
+        yield ()
+        return
+    names = getattr(cls, "param_names", [])
+    for combo in itertools.product(*params):
+        too_big = any(
+            name in _SIZE_PARAMS and value > max_size for name, value in zip(names, combo)
+        )
+        if not too_big:
+            yield combo
+
+
+def _time(fn, args, budget=0.2):
+    # Calibrate the inner loop so each repeat takes roughly budget/3 seconds
+    start = time.perf_counter()
+    fn(*args)
+    once = time.perf_counter() - start
+    number = max(1, int(budget / 3 / once)) if once > 0 else 1000
+    best = once
+    for _ in range(3 if once < budget else 0):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn(*args)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def _peakmem(fn, args):
+    tracemalloc.start()
+    try:
+        fn(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _human_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def _human_bytes(n):
+    for unit in ("B", "KiB", "MiB"):
+        if n < 1024:
+            return f"{n:.4g} {unit}"
+        n /= 1024
+    return f"{n:.4g} GiB"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--max-size", type=int, default=1_000_000,
+                        help="skip parameter combinations larger than this (default 1e6)")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains TEXT")
+    parser.add_argument("--output", help="also append results to this file")
+    args = parser.parse_args(argv)
+
+    out = open(args.output, "a") if args.output else None
+    try:
+        for label, cls, method in _discover(args.filter):
+            for combo in _param_grid(cls, args.max_size):
+                bench = cls()
+                try:
+                    if hasattr(bench, "setup"):
+                        bench.setup(*combo)
+                except NotImplementedError:
+                    continue
+                fn = getattr(bench, method)
+                if method.startswith("time_"):
+                    result = _human_time(_time(fn, combo))
+                else:
+                    result = _human_bytes(_peakmem(fn, combo))
+                if hasattr(bench, "teardown"):
+                    bench.teardown(*combo)
+                line = f"{label}{list(combo) if combo else ''}: {result}"
+                print(line, flush=True)
+                if out:
+                    out.write(line + "\n")
+    finally:
+        if out:
+            out.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+import numpy as np
+
+from mars_dtc import MarsDate, MarsDateArray, MarsTimedelta, mars_date_range
+
+from . import OBJECT_SIZES, SIZES, date_array
+
+
+class Construction:
+    params = [OBJECT_SIZES]
+    param_names = ["size"]
+    timeout = 600
+
+    def setup(self, size):
+        arr = date_array(size)
+        self.dates = list(arr)
+        self.strings = [d.format("%Y-%m-%d") for d in self.dates]
+        self.ints = arr._ordinals.tolist()
+
+    def time_from_dates(self, size):
+        MarsDateArray(self.dates)
+
+    def time_from_strings(self, size):
+        MarsDateArray(self.strings)
+
+    def time_from_strings_vectorized(self, size):
+        MarsDateArray.from_strings(self.strings)
+
+    def time_from_ints(self, size):
+        MarsDateArray(self.ints)
+
+    def time_strptime(self, size):
+        MarsDateArray.strptime(self.strings, "%Y-%m-%d")
+
+    def peakmem_from_dates(self, size):
+        MarsDateArray(self.dates)
+
+
+class Operations:
+    params = [SIZES]
+    param_names = ["size"]
+    timeout = 600
+
+    def setup(self, size):
+        self.arr = date_array(size)
+        self.date = MarsDate(220, 1, 1)
+        self.indices = np.random.default_rng(1).integers(0, size, size)
+
+    def time_strftime(self, size):
+        self.arr.strftime("%Y/%m/%d")
+
+    def time_strftime_names(self, size):
+        self.arr.strftime("%A, %d %B %Y")
+
+    def time_isoformat(self, size):
+        self.arr.isoformat()
+
+    def time_add_timedelta(self, size):
+        self.arr + MarsTimedelta(5)
+
+    def time_compare(self, size):
+        self.arr < self.date
+
+    def time_take(self, size):
+        self.arr.take(self.indices)
+
+    def time_argsort(self, size):
+        self.arr.argsort()
+
+    def time_to_numpy(self, size):
+        self.arr.to_numpy()
+
+    def peakmem_strftime(self, size):
+        self.arr.strftime("%Y/%m/%d")
+
+
+class Boxing:
+    params = [OBJECT_SIZES]
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.arr = date_array(size)
+
+    def time_iterate(self, size):
+        for _ in self.arr:
+            pass
+
+    def time_floor_month(self, size):
+        self.arr.floor("month")
+
+    def peakmem_iterate(self, size):
+        list(self.arr)
+
+
+class DateRange:
+    params = [[1, 100, 10_000], ["sol", "month", "year"]]
+    param_names = ["periods", "freq"]
+    timeout = 600
+
+    def setup(self, periods, freq):
+        self.start = MarsDate(214, 1, 1)
+        step = {"sol": "add_sols", "month": "add_months", "year": "add_years"}[freq]
+        self.end = getattr(self.start, step)(periods - 1)
+
+    def time_mars_date_range(self, periods, freq):
+        mars_date_range(self.start, self.end, freq=freq)
+
+
+class Components:
+    params = [SIZES]
+    param_names = ["size"]
+    timeout = 600
+
+    def setup(self, size):
+        arr = date_array(size)
+        self.ordinals = arr._ordinals
+        self.years, self.months, self.sols = arr._calendar.from_ordinals(arr._ordinals)
+
+    def time_from_components(self, size):
+        MarsDateArray.from_components(self.years, self.months, self.sols)
+
+    def time_from_ordinals(self, size):
+        MarsDateArray.from_ordinals(self.ordinals)
+
+    def peakmem_from_components(self, size):
+        MarsDateArray.from_components(self.years, self.months, self.sols)
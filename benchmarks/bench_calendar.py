@@ -0,0 +1,44 @@
+import numpy as np
+
+from mars_dtc import DarianCalendar
+
+from . import SIZES, YEARS
+
+
+class ScalarConversion:
+    params = [YEARS]
+    param_names = ["year"]
+
+    def setup(self, year):
+        self.cal = DarianCalendar()
+        self.ordinal = self.cal.to_ordinal(year, 14, 20)
+
+    def time_to_ordinal(self, year):
+        self.cal.to_ordinal(year, 14, 20)
+
+    def time_from_ordinal(self, year):
+        self.cal.from_ordinal(self.ordinal)
+
+    def time_validate_date(self, year):
+        self.cal.validate_date(year, 24, 27)
+
+
+class ArrayConversion:
+    params = [SIZES, YEARS]
+    param_names = ["size", "year"]
+    timeout = 600
+
+    def setup(self, size, year):
+        self.cal = DarianCalendar()
+        start = self.cal.to_ordinal(year, 1, 1)
+        self.ordinals = start + np.arange(size, dtype="int64")
+        self.years, self.months, self.sols = self.cal.from_ordinals(self.ordinals)
+
+    def time_from_ordinals(self, size, year):
+        self.cal.from_ordinals(self.ordinals)
+
+    def time_to_ordinals(self, size, year):
+        self.cal.to_ordinals(self.years, self.months, self.sols)
+
+    def peakmem_from_ordinals(self, size, year):
+        self.cal.from_ordinals(self.ordinals)
@@ -0,0 +1,115 @@
+import io
+import pickle
+
+import mars_dtc
+
+from . import OBJECT_SIZES, SIZES, date_array
+
+
+class Serialization:
+    params = [SIZES, ["iso", "ordinal"]]
+    param_names = ["size", "representation"]
+    timeout = 600
+
+    def setup(self, size, representation):
+        self.arr = date_array(size, consecutive=True)
+        self.encoded = mars_dtc.encode_dates(self.arr, representation)
+
+    def time_encode(self, size, representation):
+        mars_dtc.encode_dates(self.arr, representation)
+
+    def time_decode(self, size, representation):
+        mars_dtc.decode_dates(self.encoded)
+
+    def time_write_ndjson(self, size, representation):
+        mars_dtc.write_ndjson(self.arr, io.StringIO(), representation=representation)
+
+    def peakmem_write_ndjson(self, size, representation):
+        mars_dtc.write_ndjson(self.arr, io.StringIO(), representation=representation)
+
+
+class YamlSerialization:
+    params = [OBJECT_SIZES]
+    param_names = ["size"]
+    timeout = 600
+
+    def setup(self, size):
+        self.arr = date_array(size, consecutive=True)
+        self.text = mars_dtc.dump_yaml(self.arr)
+
+    def time_dump_yaml(self, size):
+        mars_dtc.dump_yaml(self.arr)
+
+    def time_load_yaml(self, size):
+        mars_dtc.load_yaml(self.text)
+
+
+class Pickling:
+    params = [SIZES]
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.arr = date_array(size, consecutive=True)
+
+    def time_pickle_protocol5_out_of_band(self, size):
+        buffers = []
+        payload = pickle.dumps(self.arr, protocol=5, buffer_callback=buffers.append)
+        pickle.loads(payload, buffers=buffers)
+
+
+class Parquet:
+    params = [SIZES]
+    param_names = ["size"]
+    timeout = 600
+
+    def setup(self, size):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise NotImplementedError("pyarrow is not installed")
+        import pandas as pd
+        self.pd = pd
+        self.frame = pd.DataFrame({"darian_date": date_array(size, consecutive=True)})
+        self.buffer = io.BytesIO()
+        self.frame.to_parquet(self.buffer)
+
+    def time_write(self, size):
+        self.frame.to_parquet(io.BytesIO())
+
+    def time_read(self, size):
+        self.buffer.seek(0)
+        self.pd.read_parquet(self.buffer)
+
+
+class PlotConversion:
+    params = [SIZES]
+    param_names = ["size"]
+    timeout = 600
+
+    def setup(self, size):
+        import matplotlib
+        matplotlib.use("Agg")
+        from mars_dtc.plotting import MarsDateConverter, MarsAutoDateLocator
+        self.converter = MarsDateConverter
+        self.locator = MarsAutoDateLocator()
+        self.arr = date_array(size, consecutive=True)
+        self.span = (float(self.arr._ordinals[0]), float(self.arr._ordinals[-1]))
+
+    def time_convert_array(self, size):
+        self.converter.convert(self.arr, None, None)
+
+    def time_tick_values(self, size):
+        self.locator.tick_values(*self.span)
+
+
+class PlotConversionObjects:
+    params = [OBJECT_SIZES]
+    param_names = ["size"]
+
+    def setup(self, size):
+        from mars_dtc.plotting import MarsDateConverter
+        self.converter = MarsDateConverter
+        self.dates = list(date_array(size, consecutive=True))
+
+    def time_convert_list(self, size):
+        self.converter.convert(self.dates, None, None)
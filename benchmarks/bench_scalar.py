@@ -0,0 +1,69 @@
+import pickle
+
+from mars_dtc import MarsDate, MarsDateTime
+
+from . import YEARS
+
+
+class Scalar:
+    params = [YEARS]
+    param_names = ["year"]
+
+    def setup(self, year):
+        self.date = MarsDate(year, 14, 20)
+        self.ordinal = self.date.to_ordinal()
+        self.text = self.date.format("%Y/%m/%d")
+        self.named = self.date.format("%A, %d %B %Y")
+        self.payload = pickle.dumps(self.date)
+
+    def time_construct(self, year):
+        MarsDate(year, 14, 20)
+
+    def time_from_ordinal(self, year):
+        MarsDate.from_ordinal(self.ordinal)
+
+    def time_to_ordinal_uncached(self, year):
+        MarsDate(year, 14, 20).to_ordinal()
+
+    def time_hash_uncached(self, year):
+        hash(MarsDate(year, 14, 20))
+
+    def time_format_numeric(self, year):
+        self.date.format("%Y/%m/%d")
+
+    def time_format_names(self, year):
+        self.date.format("%A, %d %B %Y")
+
+    def time_from_string(self, year):
+        MarsDate.from_string(self.text)
+
+    def time_strptime_numeric(self, year):
+        MarsDate.strptime(self.text, "%Y/%m/%d")
+
+    def time_strptime_names(self, year):
+        MarsDate.strptime(self.named, "%A, %d %B %Y")
+
+    def time_pickle_roundtrip(self, year):
+        pickle.loads(pickle.dumps(self.date))
+
+    def time_add_months(self, year):
+        self.date.add_months(5)
+
+
+class DateTimeScalar:
+    params = [YEARS]
+    param_names = ["year"]
+
+    def setup(self, year):
+        self.dt = MarsDateTime(year, 14, 20, 13, 5, 9)
+        self.text = self.dt.isoformat()
+        self.value = self.dt.to_ordinal_float()
+
+    def time_to_ordinal_float(self, year):
+        MarsDateTime(year, 14, 20, 13, 5, 9).to_ordinal_float()
+
+    def time_from_ordinal_float(self, year):
+        MarsDateTime.from_ordinal_float(self.value)
+
+    def time_strptime_iso(self, year):
+        MarsDateTime.strptime(self.text, "%Y-%m-%dT%H:%M:%S")
@@ -1,31 +1,131 @@
-from .mars_dtc import MarsDate, MarsDateTime, MarsTimedelta
+import importlib
+import importlib.abc
+import importlib.util
+import sys
+
+from .mars_dtc import MarsDate, MarsDateTime, MarsTimedelta, MarsPeriod, set_intern_cache
 
 from .darian_calendar import DarianCalendar
 from .base_calendar import BaseCalendar
 from .utils import mars_date_range, get_martian_week, get_sol_of_year
+from .instrumentation import instrument, stats
+
+
+# Pandas, Matplotlib and PyYAML integrations are imported on first access,
+# so `import mars_dtc` stays cheap for code that only needs the scalars.
+# Names resolve to None when their optional stack cannot be imported.
+_LAZY_EXPORTS = {
+    "MarsDateArray": "pandas_ext",
+    "MarsDateDtype": "pandas_ext",
+    "MarsPeriodArray": "pandas_ext",
+    "MarsPeriodDtype": "pandas_ext",
+    "MarsJSONEncoder": "serialization",
+    "mars_object_hook": "serialization",
+    "encode_dates": "serialization",
+    "decode_dates": "serialization",
+    "write_ndjson": "serialization",
+    "read_ndjson": "serialization",
+    "dump_yaml": "serialization",
+    "load_yaml": "serialization",
+    "read_mars_csv": "serialization",
+    "save_npy": "serialization",
+    "load_npy": "serialization",
+    "save_npz": "serialization",
+    "load_npz": "serialization",
+    "rolling_sols": "timeseries",
+    "merge_asof_sols": "timeseries",
+    "find_sol_gaps": "timeseries",
+    "reindex_sols": "timeseries",
+    "interpolate_sols": "timeseries",
+    "MissionClock": "missions",
+    "register_mission": "missions",
+    "plot": "plotting",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(f".{module}", __name__), name)
+    except ImportError:
+        value = None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
+class _PandasImportHook(importlib.abc.MetaPathFinder):
+    """Register the marsdate dtype as soon as pandas finishes importing."""
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname != "pandas":
+            return None
+        # One-shot: step aside so the real finders locate pandas
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(fullname)
+        if spec is None or spec.loader is None:
+            return spec
+        exec_module = spec.loader.exec_module
+
+        def exec_and_register(module):
+            exec_module(module)
+            importlib.import_module(".pandas_ext", __name__)
+
+        spec.loader.exec_module = exec_and_register
+        return spec
 
 
-try:
-    from .pandas_ext import MarsDateArray, MarsDateDtype
-except Exception:
-    MarsDateArray = None
-    MarsDateDtype = None
+# Make "marsdate" a pandas dtype name without importing pandas here: now if
+# the host process already loaded it (this imports nothing new), otherwise
+# when it is first imported. Plotting stays opt-in through
+# mars_dtc.plotting.enable().
+if "pandas" in sys.modules:
+    from . import pandas_ext  # noqa: F401
+elif not any(isinstance(f, _PandasImportHook) for f in sys.meta_path):
+    sys.meta_path.insert(0, _PandasImportHook())
 
-try:
-    from .plotting import plot
-except Exception:
-    plot = None
 
 __all__ = [
     "MarsDate",
     "MarsDateTime",
     "MarsTimedelta",
+    "MarsPeriod",
+    "set_intern_cache",
     "DarianCalendar",
     "BaseCalendar",
     "mars_date_range",
     "get_martian_week",
     "get_sol_of_year",
+    "instrument",
+    "stats",
     "MarsDateArray",
     "MarsDateDtype",
+    "MarsPeriodArray",
+    "MarsPeriodDtype",
+    "MarsJSONEncoder",
+    "mars_object_hook",
+    "encode_dates",
+    "decode_dates",
+    "write_ndjson",
+    "read_ndjson",
+    "dump_yaml",
+    "load_yaml",
+    "read_mars_csv",
+    "save_npy",
+    "load_npy",
+    "save_npz",
+    "load_npz",
+    "rolling_sols",
+    "merge_asof_sols",
+    "find_sol_gaps",
+    "reindex_sols",
+    "interpolate_sols",
+    "MissionClock",
+    "register_mission",
     "plot",
 ]
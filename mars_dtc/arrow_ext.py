@@ -0,0 +1,69 @@
+# ---------------- Imports ----------------
+import json
+
+import numpy as np
+import pyarrow as pa
+
+from mars_dtc.base_calendar import _calendar_from_name
+
+
+# ---------------- Classes and functions ----------------
+class MarsDateArrowType(pa.ExtensionType):
+    """
+    Arrow extension type for marsdate columns: int32 ordinals with the
+    calendar name stored as type metadata, so Parquet/Feather files keep the
+    dtype and are read back without re-parsing.
+    """
+
+    def __init__(self, calendar: str = "DarianCalendar"):
+        self.calendar = calendar
+        super().__init__(pa.int32(), "mars_dtc.marsdate")
+
+    def __arrow_ext_serialize__(self):
+        return json.dumps({"calendar": self.calendar}).encode()
+
+    @classmethod
+    def __arrow_ext_deserialize__(cls, storage_type, serialized):
+        metadata = json.loads(serialized.decode()) if serialized else {}
+        return cls(metadata.get("calendar", "DarianCalendar"))
+
+    def to_pandas_dtype(self):
+        from mars_dtc.pandas_ext import MarsDateDtype
+        return MarsDateDtype()
+
+
+def to_arrow(ordinals: np.ndarray, mask: np.ndarray, calendar) -> pa.ExtensionArray:
+    """Wrap an ordinal buffer and missing-value mask as a marsdate Arrow array."""
+    info = np.iinfo(np.int32)
+    valid = ordinals[~mask]
+    if len(valid) and (valid.min() < info.min or valid.max() > info.max):
+        raise OverflowError("Ordinals do not fit in the int32 Arrow storage")
+    storage = pa.array(ordinals.astype("int32"), type=pa.int32(),
+                       mask=mask if mask.any() else None)
+    return pa.ExtensionArray.from_storage(
+        MarsDateArrowType(calendar.__class__.__name__), storage)
+
+
+def from_arrow(array, na_ordinal):
+    """
+    Return (int64 ordinals, calendar) from a marsdate Arrow Array or
+    ChunkedArray; plain int32 storage arrays default to the Darian calendar.
+    """
+    chunks = array.chunks if isinstance(array, pa.ChunkedArray) else [array]
+    calendar = "DarianCalendar"
+    if isinstance(array.type, MarsDateArrowType):
+        calendar = array.type.calendar
+
+    parts = []
+    for chunk in chunks:
+        storage = chunk.storage if isinstance(chunk, pa.ExtensionArray) else chunk
+        ordinals = storage.fill_null(0).to_numpy().astype("int64")
+        if storage.null_count:
+            ordinals[storage.is_null().to_numpy(zero_copy_only=False)] = na_ordinal
+        parts.append(ordinals)
+
+    ordinals = np.concatenate(parts) if parts else np.empty(0, dtype="int64")
+    return ordinals, _calendar_from_name(calendar)
+
+
+pa.register_extension_type(MarsDateArrowType())
@@ -1,5 +1,11 @@
 # ---------------- Imports ----------------
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from functools import lru_cache
+
+import numpy as np
+
+from mars_dtc import instrumentation
 
 
 # ---------------- Classes and functions ----------------
@@ -8,8 +14,27 @@ class BaseCalendar(ABC):
     Base class for all calendar systems. Trying to instantiate a calendar
     inheriting from BaseCalendar without all the methods below will result in
     an error.
+
+    Calendars whose leap pattern repeats can instead declare LEAP_CYCLE (the
+    period in years), REGYEAR_MONTH_LENGTHS and LEAPYEAR_MONTH_LENGTHS, and
+    implement only is_leap_year. month_lengths, validate_date, the scalar
+    conversions and the array kernels are then derived from tables built
+    over one cycle, so every conversion is O(1) in the year.
     """
 
+    LEAP_CYCLE = None
+    REGYEAR_MONTH_LENGTHS = None
+    LEAPYEAR_MONTH_LENGTHS = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.LEAP_CYCLE is None:
+            return
+        # Fill in whatever the subclass (or its parents) left to the base
+        for name in _CYCLE_DERIVED:
+            if getattr(cls, name) is getattr(BaseCalendar, name):
+                setattr(cls, name, getattr(BaseCalendar, f"_cycle_{name}"))
+
     @abstractmethod
     def is_leap_year(self, year: int) -> bool:
         pass
@@ -33,3 +58,208 @@ class BaseCalendar(ABC):
     def validate_date(self, year: int, month: int, sol: int):
         """Raise if the date is invalid for that calendar."""
         pass
+
+    # ----- Array kernels -----
+    # Scalar fallbacks; calendars with a closed form should override these.
+
+    def to_ordinals(self, years, months, sols) -> np.ndarray:
+        """Convert arrays of (year, month, sol) to an int64 array of ordinals."""
+        return np.fromiter(
+            (self.to_ordinal(int(y), int(m), int(s))
+             for y, m, s in zip(years, months, sols)),
+            dtype="int64",
+            count=len(years),
+        )
+
+    def from_ordinals(self, ordinals):
+        """Return (years, months, sols) int64 arrays from an array of ordinals."""
+        ordinals = np.asarray(ordinals, dtype="int64")
+        out = np.empty((3, len(ordinals)), dtype="int64")
+        for i, ordinal in enumerate(ordinals.tolist()):
+            out[:, i] = self.from_ordinal(ordinal)
+        return out[0], out[1], out[2]
+
+    def valid_dates(self, years, months, sols) -> np.ndarray:
+        """Boolean mask of which (year, month, sol) triples are valid dates."""
+        def is_valid(y, m, s):
+            try:
+                self.validate_date(y, m, s)
+            except ValueError:
+                return False
+            return True
+
+        return np.fromiter(
+            (is_valid(int(y), int(m), int(s)) for y, m, s in zip(years, months, sols)),
+            dtype=bool,
+            count=len(years),
+        )
+
+    # ----- Leap-cycle protocol -----
+
+    def _cycle(self):
+        """Per-class tables for the leap-cycle protocol, built on first use."""
+        cls = type(self)
+        tables = cls.__dict__.get("_cycle_tables")
+        if tables is None:
+            period = cls.LEAP_CYCLE
+            regular = list(cls.REGYEAR_MONTH_LENGTHS)
+            leap = list(cls.LEAPYEAR_MONTH_LENGTHS)
+            is_leap = np.array([self.is_leap_year(y) for y in range(period)])
+            leaps_before = np.concatenate([[0], np.cumsum(is_leap)]).astype("int64")
+            regular_cum = np.cumsum([0] + regular).astype("int64")
+            leap_cum = np.cumsum([0] + leap).astype("int64")
+            tables = cls._cycle_tables = {
+                "period": period,
+                "is_leap": is_leap,
+                "leaps_before": leaps_before,
+                "year_sols": int(regular_cum[-1]),
+                "leap_extra": int(leap_cum[-1] - regular_cum[-1]),
+                "cycle_sols": int(regular_cum[-1]) * period
+                              + int(leap_cum[-1] - regular_cum[-1]) * int(leaps_before[-1]),
+                "regular_cum": regular_cum,
+                "leap_cum": leap_cum,
+                "regular_lengths": np.array(regular, dtype="int64"),
+                "leap_lengths": np.array(leap, dtype="int64"),
+                # False when leap years only lengthen the last month, so the
+                # common-year table locates every month start
+                "leap_shifts_months": bool((leap_cum[:-1] != regular_cum[:-1]).any()),
+                # Plain lists for the scalar paths, which avoid numpy scalars
+                "leaps_before_list": leaps_before.tolist(),
+                "regular_cum_list": regular_cum.tolist(),
+                "leap_cum_list": leap_cum.tolist(),
+            }
+        return tables
+
+    def _sols_before_year(self, years):
+        """
+        Sols between the start of year 0 and the start of each year (negative
+        for years before 0). Accepts a Python int or an integer array.
+        """
+        t = self._cycle()
+        period = t["period"]
+        if isinstance(years, (int, np.integer)):
+            years = int(years)
+            cycles, offset = divmod(years, period)
+            leaps = cycles * t["leaps_before_list"][-1] + t["leaps_before_list"][offset]
+        else:
+            years = np.asarray(years, dtype="int64")
+            leaps = (years // period) * t["leaps_before"][-1] + t["leaps_before"][years % period]
+        return t["year_sols"] * years + t["leap_extra"] * leaps
+
+    def _cycle_month_lengths(self, year: int) -> list[int]:
+        lengths = self.LEAPYEAR_MONTH_LENGTHS if self.is_leap_year(year) else self.REGYEAR_MONTH_LENGTHS
+        return list(lengths)
+
+    def _cycle_validate_date(self, year: int, month: int, sol: int):
+        lengths = self.month_lengths(year)
+        if not (1 <= month <= len(lengths)):
+            raise ValueError("Invalid month")
+        if not (1 <= sol <= lengths[month - 1]):
+            raise ValueError(
+                f"Invalid sol {sol} for month {month}. Valid range is 1–{lengths[month - 1]}.")
+
+    def _cycle_valid_dates(self, years, months, sols) -> np.ndarray:
+        t = self._cycle()
+        years = np.asarray(years, dtype="int64")
+        months = np.asarray(months, dtype="int64")
+        sols = np.asarray(sols, dtype="int64")
+        month_ok = (months >= 1) & (months <= len(t["regular_lengths"]))
+        index = np.where(month_ok, months, 1) - 1
+        leap = t["is_leap"][years % t["period"]]
+        max_sols = np.where(leap, t["leap_lengths"][index], t["regular_lengths"][index])
+        return month_ok & (sols >= 1) & (sols <= max_sols)
+
+    def _cycle_to_ordinal(self, year: int, month: int, sol: int) -> int:
+        t = self._cycle()
+        cum = t["leap_cum_list"] if self.is_leap_year(year) else t["regular_cum_list"]
+        return self._sols_before_year(year) + cum[month - 1] + sol - 1
+
+    def _cycle_from_ordinal(self, ordinal: int):
+        t = self._cycle()
+        ordinal = int(ordinal)
+        # The mean year length over a cycle gives an estimate that only
+        # needs a step or two of correction
+        year = ordinal * t["period"] // t["cycle_sols"]
+        start = self._sols_before_year(year)
+        while start > ordinal:
+            year -= 1
+            start = self._sols_before_year(year)
+        while self._sols_before_year(year + 1) <= ordinal:
+            year += 1
+            start = self._sols_before_year(year)
+
+        remaining = ordinal - start
+        cum = t["leap_cum_list"] if self.is_leap_year(year) else t["regular_cum_list"]
+        month = bisect_right(cum, remaining, 1, len(cum) - 1)
+        return year, month, remaining - cum[month - 1] + 1
+
+    def _cycle_to_ordinals(self, years, months, sols) -> np.ndarray:
+        t = self._cycle()
+        years = np.asarray(years, dtype="int64")
+        months = np.asarray(months, dtype="int64")
+        cum = t["regular_cum"][months - 1]
+        if t["leap_shifts_months"]:
+            leap = np.flatnonzero(t["is_leap"][years % t["period"]])
+            cum[leap] = t["leap_cum"][months[leap] - 1]
+        return self._sols_before_year(years) + cum + np.asarray(sols, dtype="int64") - 1
+
+    def _cycle_from_ordinals(self, ordinals):
+        t = self._cycle()
+        ordinals = np.asarray(ordinals, dtype="int64")
+
+        years = (ordinals * t["period"]) // t["cycle_sols"]
+        starts = self._sols_before_year(years)
+        # Step the (few) misestimated rows into place
+        late = np.flatnonzero(starts > ordinals)
+        while len(late):
+            years[late] -= 1
+            starts[late] = self._sols_before_year(years[late])
+            late = late[starts[late] > ordinals[late]]
+        next_starts = self._sols_before_year(years + 1)
+        early = np.flatnonzero(next_starts <= ordinals)
+        while len(early):
+            years[early] += 1
+            starts[early] = next_starts[early]
+            next_starts[early] = self._sols_before_year(years[early] + 1)
+            early = early[next_starts[early] <= ordinals[early]]
+
+        # Search the common-year table, then redo only the leap-year rows
+        remaining = ordinals - starts
+        months = np.searchsorted(t["regular_cum"][1:-1], remaining, side="right") + 1
+        cum = t["regular_cum"][months - 1]
+        leap = np.flatnonzero(t["is_leap"][years % t["period"]]) if t["leap_shifts_months"] else ()
+        if len(leap):
+            leap_months = np.searchsorted(t["leap_cum"][1:-1], remaining[leap], side="right") + 1
+            months[leap] = leap_months
+            cum[leap] = t["leap_cum"][leap_months - 1]
+        return years, months.astype("int64", copy=False), remaining - cum + 1
+
+
+_CYCLE_DERIVED = (
+    "month_lengths", "validate_date", "valid_dates",
+    "to_ordinal", "from_ordinal", "to_ordinals", "from_ordinals",
+)
+
+
+@lru_cache(maxsize=None)
+def _calendar_from_name(name: str) -> BaseCalendar:
+    """Return a shared instance of a registered calendar from its class name."""
+    pending = [BaseCalendar]
+    while pending:
+        cls = pending.pop()
+        if cls.__name__ == name:
+            return cls()
+        pending.extend(cls.__subclasses__())
+    raise ValueError(f"Unknown calendar {name!r}")
+
+
+instrumentation.register_cache("calendar_from_name", _calendar_from_name)
+
+
+def _calendar_id(calendar):
+    # Registered calendars are identified by name; anything else is kept as-is
+    return calendar.__class__.__name__ if isinstance(calendar, BaseCalendar) else calendar
+
+
+def _resolve_calendar(calendar):
+    return _calendar_from_name(calendar) if isinstance(calendar, str) else calendar
@@ -0,0 +1,214 @@
+"""
+Stream Mars dates through a shell pipeline:
+
+    mars-dtc --to ordinal < dates.txt
+    mars-dtc --input-format csv -c darian_date --format "%d %B %Y" weather.csv
+    zcat log.ndjson.gz | mars-dtc --input-format ndjson -c time --workers 4
+
+Input is read and written chunksize records at a time, so memory stays
+bounded whatever the input size.
+"""
+# ---------------- Imports ----------------
+import argparse
+import json
+import re
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+from mars_dtc.base_calendar import _calendar_from_name
+from mars_dtc.mars_dtc import MarsDate, MarsDateTime
+from mars_dtc.pandas_ext import MarsDateArray
+from mars_dtc.serialization import _decode_one, _encode_one
+
+
+# ---------------- Classes and functions ----------------
+_NUMBER = re.compile(r"^\s*-?\d+(\.\d*)?\s*$")
+_TIME_CODES = re.compile(r"%[HMS]")
+
+
+def _parse_one(value, parse_fmt, calendar):
+    if parse_fmt:
+        cls = MarsDateTime if _TIME_CODES.search(parse_fmt) else MarsDate
+        return cls.strptime(value, parse_fmt, calendar=calendar)
+    if "T" in value:
+        return _decode_one(value.strip(), calendar)
+    return _decode_one(float(value) if "." in value else int(value), calendar)
+
+
+def _render_one(date, out_fmt, to):
+    if out_fmt:
+        return date.format(out_fmt)
+    return _encode_one(date, to)
+
+
+def convert_values(values, parse_fmt=None, out_fmt=None, to="iso", calendar="DarianCalendar"):
+    """
+    Convert a list of date/datetime strings (ISO, 'Y/M/D'-style, ordinals,
+    or parse_fmt) to ISO strings, ordinals (to='ordinal') or out_fmt. Each
+    distinct value is converted once; None and '' stay None.
+    """
+    cal = _calendar_from_name(calendar)
+    codes, uniques = pd.factorize(
+        np.array([None if v == "" else v for v in values], dtype=object))
+    if not len(uniques):
+        return [None] * len(values)
+
+    rendered = np.empty(len(uniques), dtype=object)
+    plain = np.array([not parse_fmt and "T" not in u and not _NUMBER.match(u) for u in uniques])
+    if plain.any():
+        # Plain date strings: parse and render the distinct values in bulk
+        dates = MarsDateArray.from_strings(uniques[plain], calendar=cal)
+        if out_fmt:
+            rendered[plain] = dates.strftime(out_fmt)
+        elif to == "ordinal":
+            rendered[plain] = dates._ordinals.tolist()
+        else:
+            rendered[plain] = dates.isoformat()
+    for i in np.flatnonzero(~plain).tolist():
+        try:
+            rendered[i] = _render_one(_parse_one(uniques[i], parse_fmt, cal), out_fmt, to)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Cannot convert {uniques[i]!r}: {e}") from None
+    rendered = rendered.tolist()
+    return [None if c < 0 else rendered[c] for c in codes]
+
+
+def _convert_lines(lines, options):
+    values = [line.rstrip("\r\n") for line in lines]
+    out = convert_values(values, **options)
+    return "".join("\n" if v is None else f"{v}\n" for v in out)
+
+
+def _convert_ndjson(lines, options, columns):
+    records = [json.loads(line) for line in lines if line.strip()]
+    if not columns:
+        values = [None if r is None else str(r) for r in records]
+        out = convert_values(values, **options)
+        return "".join(json.dumps(v) + "\n" for v in out)
+    bad = next((r for r in records if not isinstance(r, dict)), None)
+    if bad is not None:
+        raise ValueError(f"NDJSON record {json.dumps(bad)} is not an object; --column needs objects")
+    for col in columns:
+        values = [None if r.get(col) is None else str(r[col]) for r in records]
+        for record, value in zip(records, convert_values(values, **options)):
+            if col in record:
+                record[col] = value
+    return "".join(json.dumps(r) + "\n" for r in records)
+
+
+def _convert_csv(frame, options, columns, header):
+    for col in columns:
+        out = convert_values(frame[col].tolist(), **options)
+        frame[col] = ["" if v is None else v for v in out]
+    return frame.to_csv(index=False, header=header)
+
+
+def _bounded_map(fn, items, workers):
+    """Ordered map over items, keeping at most 2 * workers chunks in flight."""
+    if workers <= 1:
+        yield from (fn(*item) for item in items)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(fn, *item))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _line_chunks(streams, chunksize):
+    for stream in streams:
+        while True:
+            chunk = list(islice(stream, chunksize))
+            if not chunk:
+                break
+            yield chunk
+
+
+def _csv_chunks(streams, chunksize, columns):
+    first = True
+    for stream in streams:
+        reader = pd.read_csv(stream, chunksize=chunksize, dtype=str,
+                             keep_default_na=False, na_filter=False)
+        for frame in reader:
+            missing = [c for c in columns if c not in frame.columns]
+            if missing:
+                raise ValueError(f"Column(s) not found: {', '.join(missing)}")
+            yield frame, first
+            first = False
+
+
+def _chunk_jobs(args, streams, options):
+    if args.input_format == "lines":
+        return _convert_lines, ((chunk, options) for chunk in _line_chunks(streams, args.chunksize))
+    if args.input_format == "ndjson":
+        return _convert_ndjson, ((chunk, options, args.column)
+                                 for chunk in _line_chunks(streams, args.chunksize))
+    return _convert_csv, ((frame, options, args.column, header)
+                          for frame, header in _csv_chunks(streams, args.chunksize, args.column))
+
+
+def _run_job(fn, *args):
+    return fn(*args)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="mars-dtc", description=__doc__.split("\n\n")[0].strip(),
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", default=["-"],
+                        help="input files ('-' or none for stdin)")
+    parser.add_argument("--input-format", choices=("lines", "ndjson", "csv"), default="lines",
+                        help="one value per line (default), JSON Lines or CSV")
+    parser.add_argument("-c", "--column", action="append", default=[],
+                        help="CSV column or NDJSON key to convert (repeatable)")
+    parser.add_argument("--parse", metavar="FMT", help="strptime-style format of the input values")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--format", metavar="FMT", help="format output values with these codes")
+    output.add_argument("--to", choices=("iso", "ordinal"), default="iso",
+                        help="write ISO strings (default) or ordinals")
+    parser.add_argument("--calendar", default="DarianCalendar", help="calendar class name")
+    parser.add_argument("--chunksize", type=int, default=65536, help="records per chunk")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="convert chunks on this many processes")
+    parser.add_argument("-o", "--output", default="-", help="output file (default stdout)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.input_format == "csv" and not args.column:
+        parser.error("--input-format csv needs at least one --column")
+    if args.chunksize < 1 or args.workers < 1:
+        parser.error("--chunksize and --workers must be positive")
+
+    options = {"parse_fmt": args.parse, "out_fmt": args.format, "to": args.to,
+               "calendar": args.calendar}
+    streams, out = [], sys.stdout
+    try:
+        # Inputs first, so a missing input does not truncate the output file
+        for name in args.files:
+            streams.append(sys.stdin if name == "-" else open(name, newline=""))
+        if args.output != "-":
+            out = open(args.output, "w", newline="")
+        fn, jobs = _chunk_jobs(args, streams, options)
+        for text in _bounded_map(_run_job, ((fn, *job) for job in jobs), args.workers):
+            out.write(text)
+        out.flush()
+    except (OSError, ValueError, json.JSONDecodeError) as e:
+        parser.exit(1, f"mars-dtc: error: {e}\n")
+    finally:
+        for stream in streams:
+            if stream is not sys.stdin:
+                stream.close()
+        if out is not sys.stdout:
+            out.close()
+    return 0
@@ -1,4 +1,5 @@
 # ---------------- Imports ----------------
+from mars_dtc import instrumentation
 from mars_dtc.base_calendar import BaseCalendar
 
 
@@ -10,6 +11,11 @@ class DarianCalendar(BaseCalendar):
         28, 28, 28, 28, 28, 27,
         28, 28, 28, 28, 28, 27
     ]
+    # Leap years add a 28th sol to Vrishika
+    LEAPYEAR_MONTH_LENGTHS = REGYEAR_MONTH_LENGTHS[:-1] + [28]
+    # The leap rule below repeats every 500 years; BaseCalendar derives
+    # month_lengths and the ordinal conversions from these declarations
+    LEAP_CYCLE = 500
 
     MONTH_NAMES = {
         1: "Sagittarius", 2: "Dhanus", 3: "Capricornus", 4: "Makara",
@@ -49,15 +55,6 @@ class DarianCalendar(BaseCalendar):
             return False  # 668
         return True
 
-    def month_lengths(self, year: int) -> list[int]:
-        """
-        Modify REGYEAR_MONTH_LENGTHS if leap year.
-        """
-        validated_month_lengths = self.REGYEAR_MONTH_LENGTHS.copy()
-        if self.is_leap_year(year):
-            validated_month_lengths[-1] = 28
-        return validated_month_lengths
-
     def validate_date(self, year: int, month: int, sol: int):
         validated_month_lengths = self.month_lengths(year)
         if not (1 <= month <= len(validated_month_lengths)):
@@ -84,68 +81,9 @@ class DarianCalendar(BaseCalendar):
                     f"Valid range is 1–{max_sol}."
                 )
 
-    def to_ordinal(self, year: int, month: int, sol: int) -> int:
-        # Count all sols in complete prior years
-        total = 0
-
-        if year >= 0:
-            # Count all sols in years before this one
-            for y in range(0, year):
-                total += sum(self.month_lengths(y))
-        else:
-            # For negative years, count backward — subtract sols from year up to -1
-            for y in range(year, 0):
-                total -= sum(self.month_lengths(y))
-
-        # Add sols within current year
-        lengths = self.month_lengths(year)
-        sols_before = sum(lengths[:month - 1]) + (sol - 1)
-
-        return total + sols_before
-
-    def from_ordinal(self, ordinal: int):
-
-        # Find year
-        year = 0
-        remaining = ordinal  # how far (in sols) the target date is from year 0
-
-        # Handle negative ordinals (years before year 0)
-        if ordinal < 0:  # If the ordinal value is negative
-            while True:  # Keep looping backward through years until we find the correct one
-                # Get month lengths for the previous year (year - 1)
-                lengths = self.month_lengths(year - 1)
-                # Count how many sols that previous year has (668 or 669)
-                sols_in_year = sum(lengths)
-
-                # Check if moving back one more year would bring us to or past the target ordinal
-
-                if remaining + sols_in_year >= 0:  # If adding this year's sols brings us to or past zero, we've found the target year
-                    year -= 1  # # Move back exactly one year
-                    # Adjust `remaining`` to represent the sol offset within that year
-                    remaining += sols_in_year
-                    break
-
-                # Move one full year backward (increase remaining toward zero)
-                remaining += sols_in_year
-                year -= 1  # Decrease the year counter as we go further into negative years
-        else:
-            while True:
-                lengths = self.month_lengths(year)
-                sols_in_year = sum(lengths)
-                if remaining < sols_in_year:
-                    break
-                remaining -= sols_in_year
-                year += 1
-
-        # Find month and sol
-        lengths = self.month_lengths(year)
-        month = 1
-        while remaining >= lengths[month - 1]:
-            remaining -= lengths[month - 1]
-            month += 1
 
-        sol = remaining + 1
-        return year, month, sol
+for _method in ("to_ordinal", "from_ordinal", "to_ordinals", "from_ordinals"):
+    instrumentation.register(DarianCalendar, _method)
 
 
 if __name__ == "__main__":
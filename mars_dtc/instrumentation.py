@@ -0,0 +1,169 @@
+# ---------------- Imports ----------------
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+
+# ---------------- Classes and functions ----------------
+# Hot paths register themselves here at import time but are only wrapped
+# while instrumentation is enabled, so a disabled process runs the original
+# functions with no extra frames or flag checks.
+_HOOKS = []
+_CACHES = {}
+
+_lock = threading.RLock()
+_depth = 0
+_originals = {}
+_callbacks = []
+_calls = {}
+_seconds = {}
+_cache_baseline = {}
+
+
+def _record(name, elapsed):
+    with _lock:
+        _calls[name] = _calls.get(name, 0) + 1
+        _seconds[name] = _seconds.get(name, 0.0) + elapsed
+        callbacks = list(_callbacks)
+    for callback in callbacks:
+        callback(name, elapsed)
+
+
+def _timed(func, name):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _record(name, time.perf_counter() - start)
+    return wrapper
+
+
+def _patch(owner, attr, name):
+    raw = owner.__dict__[attr]
+    _originals[(owner, attr)] = raw
+    if isinstance(raw, (classmethod, staticmethod)):
+        wrapped = type(raw)(_timed(raw.__func__, name))
+    else:
+        wrapped = _timed(raw, name)
+    setattr(owner, attr, wrapped)
+
+
+def _unpatch_all():
+    for (owner, attr), raw in _originals.items():
+        setattr(owner, attr, raw)
+    _originals.clear()
+
+
+def register(owner, attr: str, name: str = None):
+    """Declare owner.attr as an instrumented hot path, reported as name."""
+    name = name or f"{owner.__name__}.{attr}"
+    with _lock:
+        _HOOKS.append((owner, attr, name))
+        if _depth:
+            _patch(owner, attr, name)
+
+
+def register_cache(name: str, cache):
+    """Report hit rates for cache, an lru_cache function or anything with cache_info()."""
+    with _lock:
+        _CACHES[name] = cache
+        _cache_baseline[name] = cache.cache_info()
+
+
+def unregister_cache(name: str):
+    """Stop reporting the cache registered as name, if any."""
+    with _lock:
+        _CACHES.pop(name, None)
+        _cache_baseline.pop(name, None)
+
+
+def _cache_stats():
+    out = {}
+    for name, cache in _CACHES.items():
+        info = cache.cache_info()
+        base = _cache_baseline[name]
+        hits, misses = info.hits - base.hits, info.misses - base.misses
+        out[name] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else None,
+            "size": info.currsize,
+        }
+    return out
+
+
+def enabled() -> bool:
+    return _depth > 0
+
+
+def enable(callback=None):
+    """
+    Start counting calls and time in the registered hot paths. callback, if
+    given, is called as callback(name, seconds) after every instrumented
+    call. Calls nest; each enable() needs a matching disable().
+    """
+    global _depth
+    with _lock:
+        if callback is not None:
+            _callbacks.append(callback)
+        if not _depth:
+            for owner, attr, name in _HOOKS:
+                _patch(owner, attr, name)
+        _depth += 1
+
+
+def disable(callback=None):
+    """Undo one enable(); the original functions are restored on the last one."""
+    global _depth
+    with _lock:
+        if not _depth:
+            return
+        if callback is not None and callback in _callbacks:
+            _callbacks.remove(callback)
+        _depth -= 1
+        if not _depth:
+            _unpatch_all()
+
+
+def reset():
+    """Zero the call counters, timings and cache hit/miss baselines."""
+    with _lock:
+        _calls.clear()
+        _seconds.clear()
+        for name, cache in _CACHES.items():
+            _cache_baseline[name] = cache.cache_info()
+
+
+def stats() -> dict:
+    """
+    Snapshot of what was recorded since the last reset(): per hot path the
+    number of calls and inclusive seconds spent, and per cache its hits,
+    misses, hit rate and current size.
+    """
+    with _lock:
+        paths = {
+            name: {"calls": _calls[name], "seconds": _seconds[name]}
+            for name in sorted(_calls)
+        }
+        return {"paths": paths, "caches": _cache_stats()}
+
+
+@contextmanager
+def instrument(callback=None, reset_stats: bool = True):
+    """
+    Enable instrumentation for the duration of a with block:
+
+        with mars_dtc.instrument():
+            df["date"].astype("marsdate")
+        print(mars_dtc.stats())
+    """
+    if reset_stats:
+        reset()
+    enable(callback)
+    try:
+        yield
+    finally:
+        disable(callback)
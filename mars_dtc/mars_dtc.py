@@ -2,18 +2,272 @@
 import json
 import math
 import re
-from functools import total_ordering
-
-import yaml
-
+import threading
+from collections import OrderedDict, namedtuple
+from functools import lru_cache, total_ordering
 
+from mars_dtc import instrumentation
+from mars_dtc.base_calendar import _calendar_id, _resolve_calendar
 from mars_dtc.darian_calendar import DarianCalendar
 
 
 # ---------------- Classes and functions ----------------
+@lru_cache(maxsize=None)
+def _yaml_codecs():
+    """
+    Import PyYAML on first use and return (yaml, Loader, Dumper), preferring
+    libyaml's much faster C loader/dumper over the pure-Python ones.
+    """
+    import yaml
+    return (
+        yaml,
+        getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+        getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+    )
+
+_FORMAT_CODE = re.compile(r"%([YymBbdAaHMS%])")
+
+
+@lru_cache(maxsize=256)
+def _compile_format(fmt: str):
+    """
+    Parse a format string once into a ``str.format`` template and the set of
+    codes it uses, e.g. '%Y/%m/%d' -> ('{Y}/{m}/{d}', {'Y', 'm', 'd'}).
+    """
+    parts = []
+    codes = set()
+    pos = 0
+    for match in _FORMAT_CODE.finditer(fmt):
+        parts.append(fmt[pos:match.start()].replace(
+            "{", "{{").replace("}", "}}"))
+        code = match.group(1)
+        if code == "%":
+            parts.append("%")
+        else:
+            parts.append("{" + code + "}")
+            codes.add(code)
+        pos = match.end()
+    parts.append(fmt[pos:].replace("{", "{{").replace("}", "}}"))
+    return "".join(parts), frozenset(codes)
+
+
+# Field renderers for each format code, only evaluated when the code is used
+_FORMAT_FIELDS = {
+    "Y": lambda d: f"{d.year:+04d}" if d.year < 0 else f"{d.year:03d}",
+    "y": lambda d: f"{abs(d.year) % 100:02d}",
+    "m": lambda d: f"{d.month:02d}",
+    "B": lambda d: d.calendar.month_name(d.month),
+    "b": lambda d: d.calendar.month_name(d.month, short=True),
+    "d": lambda d: f"{d.sol:02d}",
+    "A": lambda d: d.calendar.weekday_name(d.weekday()),
+    "a": lambda d: d.calendar.weekday_name(d.weekday(), short=True),
+    "H": lambda d: f"{getattr(d, 'hour', 0):02d}",
+    "M": lambda d: f"{getattr(d, 'minute', 0):02d}",
+    "S": lambda d: f"{getattr(d, 'second', 0):02d}",
+}
+
+
+# Regex for each numeric code; names are built from the calendar tables
+_PARSE_PATTERNS = {
+    "Y": r"[+-]?\d+",
+    "m": r"\d{1,2}",
+    "d": r"\d{1,2}",
+    "H": r"\d{1,2}",
+    "M": r"\d{1,2}",
+    "S": r"\d{1,2}",
+}
+
+
+def _literal_pattern(text: str) -> str:
+    # Any run of whitespace in the format matches any run in the input
+    return r"\s+".join(re.escape(part) for part in re.split(r"\s+", text))
+
+
+@lru_cache(maxsize=256)
+def _compile_parser(fmt: str, calendar_cls):
+    """
+    Compile a format string into a regex with one named group per code (the
+    inverse of _compile_format), plus lookup tables for month and weekday
+    names. Names match case-insensitively.
+    """
+    cal = calendar_cls()
+    n_months = len(cal.month_lengths(0))
+    tables = {
+        "B": {cal.month_name(m).lower(): m for m in range(1, n_months + 1)},
+        "b": {cal.month_name(m, short=True).lower(): m for m in range(1, n_months + 1)},
+        "A": {cal.weekday_name(wd).lower(): wd for wd in range(1, 8)},
+        "a": {cal.weekday_name(wd, short=True).lower(): wd for wd in range(1, 8)},
+    }
+
+    parts = []
+    codes = set()
+    pos = 0
+    for match in _FORMAT_CODE.finditer(fmt):
+        parts.append(_literal_pattern(fmt[pos:match.start()]))
+        code = match.group(1)
+        pos = match.end()
+        if code == "%":
+            parts.append("%")
+            continue
+        if code == "y":
+            raise ValueError("%y is ambiguous and cannot be parsed; use %Y")
+        if code in codes:
+            raise ValueError(f"Format code %{code} appears more than once")
+        codes.add(code)
+        if code in tables:
+            # Longest names first so prefixes do not shadow them
+            names = sorted(tables[code], key=len, reverse=True)
+            parts.append(f"(?P<{code}>" + "|".join(map(re.escape, names)) + ")")
+        else:
+            parts.append(f"(?P<{code}>{_PARSE_PATTERNS[code]})")
+    parts.append(_literal_pattern(fmt[pos:]))
+
+    if "Y" not in codes:
+        raise ValueError("Format must contain %Y")
+    lookups = {code: tables[code] for code in codes if code in tables}
+    return re.compile("".join(parts), re.IGNORECASE), lookups
+
+
+def _strptime_fields(s: str, fmt: str, calendar):
+    """
+    Match s against fmt and return a dict of integer fields plus the parsed
+    weekday (None when the format has no weekday code).
+    """
+    regex, lookups = _compile_parser(fmt, calendar.__class__)
+    match = regex.fullmatch(s.strip())
+    if match is None:
+        raise ValueError(f"Mars date string {s!r} does not match format {fmt!r}")
+    groups = match.groupdict()
+
+    fields = {"year": int(groups["Y"]), "month": 1, "sol": 1,
+              "hour": 0, "minute": 0, "second": 0}
+    for code, key in (("m", "month"), ("d", "sol"),
+                      ("H", "hour"), ("M", "minute"), ("S", "second")):
+        if code in groups:
+            fields[key] = int(groups[code])
+    for code in ("B", "b"):
+        if code in groups:
+            fields["month"] = lookups[code][groups[code].lower()]
+
+    weekday = None
+    for code in ("A", "a"):
+        if code in groups:
+            weekday = lookups[code][groups[code].lower()]
+    return fields, weekday
+
+
+def _check_weekday(date, weekday, s):
+    if weekday is not None and date.weekday() != weekday:
+        raise ValueError(
+            f"Weekday in {s!r} does not match the date {date.format()}")
+
+
+def _restore_date(cls, calendar, ordinal, time=()):
+    """Unpickle a MarsDate/MarsDateTime from a calendar id and an ordinal."""
+    cal = _resolve_calendar(calendar)
+    year, month, sol = cal.from_ordinal(ordinal)
+    date = cls(year, month, sol, *time, calendar=cal)
+    date._ordinal = ordinal
+    return date
+
+
+def _boxed_date(calendar, year, month, sol, ordinal, text=None):
+    """
+    MarsDate from fields that calendar.from_ordinals produced, skipping the
+    validation in __init__; text, if given, primes the cached str().
+    """
+    date = object.__new__(MarsDate)
+    date.__dict__.update(calendar=calendar, year=year, month=month, sol=sol,
+                         _ordinal=ordinal, _str=text)
+    return date
+
+
+# Same fields as functools.lru_cache's cache_info()
+CacheInfo = namedtuple("CacheInfo", "hits misses maxsize currsize")
+
+
+class _InternCache:
+    """Thread-safe LRU map from (class, calendar id, ordinal) to a shared date."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._dates = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            date = self._dates.get(key)
+            if date is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._dates.move_to_end(key)
+            return date
+
+    def put(self, key, date):
+        """Store date under key and return the shared instance (another thread may have won)."""
+        with self._lock:
+            date = self._dates.setdefault(key, date)
+            self._dates.move_to_end(key)
+            if len(self._dates) > self.maxsize:
+                self._dates.popitem(last=False)
+            return date
+
+    def cache_info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._dates))
+
+
+_intern_cache = None
+
+
+def set_intern_cache(maxsize: int = 65536):
+    """
+    Share MarsDate instances built from ordinals (from_ordinal, from_string,
+    MarsDateArray element access) through an LRU cache of up to maxsize
+    dates, so repeated dates cost one lookup. maxsize=0 turns it off again.
+    Dates are immutable, so sharing them is safe.
+    """
+    global _intern_cache
+    if maxsize < 0:
+        raise ValueError("maxsize must be >= 0")
+    _intern_cache = _InternCache(maxsize) if maxsize else None
+    # Report the new cache, or stop reporting the dropped one
+    if _intern_cache is None:
+        instrumentation.unregister_cache("intern")
+    else:
+        instrumentation.register_cache("intern", _intern_cache)
+
+
+def _interned(cls, ordinal: int, calendar):
+    """Shared cls instance for ordinal, building it on a cache miss."""
+    key = (cls, _calendar_id(calendar), ordinal)
+    cache = _intern_cache
+    date = cache.get(key)
+    if date is None:
+        year, month, sol = calendar.from_ordinal(ordinal)
+        date = cls(year, month, sol, calendar=calendar)
+        date._ordinal = ordinal
+        date = cache.put(key, date)
+    return date
+
+
+def _intern_all(cls, ordinals, calendar):
+    """Shared instances for a list of ordinals, or None when interning is off."""
+    if _intern_cache is None:
+        return None
+    return [_interned(cls, o, calendar) for o in ordinals]
+
+
 @total_ordering
 class MarsDate:
 
+    # Computed on first use and cached; dates are immutable
+    _ordinal = None
+    _hash = None
+    _str = None
+    _FIELDS = frozenset({"calendar", "year", "month", "sol"})
+
     def __init__(self, year: int, month: int, sol: int, calendar=None):
 
         # Allow any registered calendar, fall back to a Darian
@@ -30,6 +284,17 @@ class MarsDate:
         self.month = month
         self.sol = sol
 
+    def __setattr__(self, name, value):
+        # Fields are set once in __init__; only the cached ordinal/hash/str
+        # may be filled in later, so interned instances and hashes stay valid
+        if name in ("_ordinal", "_hash", "_str") or (name in self._FIELDS and name not in self.__dict__):
+            object.__setattr__(self, name, value)
+        else:
+            raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
     # ----- Representations -----
     def __repr__(self):
         cname = getattr(self.calendar, "name",
@@ -37,18 +302,35 @@ class MarsDate:
         return f"{cname}Date({self.year}, {self.month}, {self.sol})"
 
     def __str__(self):
-        return f"{self.year:03d}/{self.month:02d}/{self.sol:02d}"
+        text = self._str
+        if text is None:
+            text = self._str = f"{self.year:03d}/{self.month:02d}/{self.sol:02d}"
+        return text
 
     def __hash__(self):
-        return hash((self.year, self.month, self.sol, self.calendar.__class__.__name__))
+        h = self._hash
+        if h is None:
+            h = self._hash = hash((self.to_ordinal(), self.calendar.__class__.__name__))
+        return h
+
+    def __reduce__(self):
+        # Pickle as calendar id + ordinal rather than the full __dict__
+        return (_restore_date,
+                (self.__class__, _calendar_id(self.calendar), self.to_ordinal()))
 
     # ----- Comparisons -----
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, MarsDate):
+            return False
+        # Plain integer comparisons, no tuples built
         return (
-            isinstance(other, MarsDate)
-            and self.calendar.__class__ == other.calendar.__class__
-            and (self.year, self.month, self.sol) == (other.year, other.month, other.sol)
+            self.sol == other.sol
+            and self.month == other.month
+            and self.year == other.year
+            and self.calendar.__class__ is other.calendar.__class__
         )
 
     def __lt__(self, other):
@@ -110,8 +392,11 @@ class MarsDate:
     # ----- Conversion -----
 
     def to_ordinal(self) -> int:
-
-        return self.calendar.to_ordinal(self.year, self.month, self.sol)
+        ordinal = self._ordinal
+        if ordinal is None:
+            ordinal = self._ordinal = self.calendar.to_ordinal(
+                self.year, self.month, self.sol)
+        return ordinal
 
     def to_ordinal_float(self) -> float:
 
@@ -120,8 +405,13 @@ class MarsDate:
     @classmethod
     def from_ordinal(cls, ordinal: int | float, calendar=None) -> "MarsDate":
         cal = calendar or DarianCalendar()
-        year, month, sol = cal.from_ordinal(int(ordinal)) 
-        return cls(int(year), int(month), int(sol), calendar=cal)
+        ordinal = int(ordinal)
+        if _intern_cache is not None:
+            return _interned(cls, ordinal, cal)
+        year, month, sol = cal.from_ordinal(ordinal)
+        date = cls(int(year), int(month), int(sol), calendar=cal)
+        date._ordinal = ordinal
+        return date
 
     @classmethod
     def from_string(cls, s: str, calendar=None) -> "MarsDate":
@@ -138,8 +428,27 @@ class MarsDate:
             raise ValueError(f"Invalid MarsDate string: {s}")
 
         year, month, sol = map(int, match.groups())
+        if _intern_cache is not None:
+            cal.validate_date(year, month, sol)
+            return _interned(cls, cal.to_ordinal(year, month, sol), cal)
         return cls(year, month, sol, calendar=cal)
 
+    @classmethod
+    def strptime(cls, s: str, fmt: str, calendar=None, strict: bool = False) -> "MarsDate":
+        """
+        Parse a string with the same codes as format(), e.g.
+        MarsDate.strptime("Sol Jovis, 12 Rishabha 214", "%A, %d %B %Y").
+        %y is not accepted. Time codes are matched but dropped. As in
+        datetime.strptime, a parsed weekday is ignored; with strict=True it
+        must agree with the date.
+        """
+        cal = calendar or DarianCalendar()
+        fields, weekday = _strptime_fields(s, fmt, cal)
+        date = cls(fields["year"], fields["month"], fields["sol"], calendar=cal)
+        if strict:
+            _check_weekday(date, weekday, s)
+        return date
+
     def isoformat(self) -> str:
 
         return f"{self.year:+05d}-{self.month:02d}-{self.sol:02d}"
@@ -158,7 +467,8 @@ class MarsDate:
         return json.dumps(self.to_dict())
 
     def to_yaml(self) -> str:
-        return yaml.safe_dump(self.to_dict())
+        yaml, _, dumper = _yaml_codecs()
+        return yaml.dump(self.to_dict(), Dumper=dumper)
 
     @classmethod
     def from_dict(cls, data: dict, calendar=None):
@@ -180,7 +490,8 @@ class MarsDate:
     @classmethod
     def from_yaml(cls, yaml_str: str, calendar=None):
 
-        data = yaml.safe_load(yaml_str)
+        yaml, loader, _ = _yaml_codecs()
+        data = yaml.load(yaml_str, Loader=loader)
         return cls.from_dict(data, calendar=calendar)
 
     # ----- Formatting -----
@@ -196,36 +507,23 @@ class MarsDate:
         %d = sol (01–28)
         %A = full weekday name
         %a = abbreviated weekday name
-        """
-        year, month, sol = self.year, self.month, self.sol
-        wd = self.weekday()
-
-        # Retrieve names from calendar
-        month_full = self.calendar.month_name(month)
-        month_abbr = self.calendar.month_name(month, short=True)
-        weekday_full = self.calendar.weekday_name(wd)
-        weekday_abbr = self.calendar.weekday_name(wd, short=True)
-
-        replacements = {
-            "%Y": f"{year:+04d}" if year < 0 else f"{year:03d}",
-            "%y": f"{abs(year) % 100:02d}",
-            "%m": f"{month:02d}",
-            "%B": month_full,
-            "%b": month_abbr,
-            "%d": f"{sol:02d}",
-            "%A": weekday_full,
-            "%a": weekday_abbr,
-        }
+        %H, %M, %S = hour, minute, second (00 for plain dates)
+        %% = literal '%'
 
-        result = fmt
-        for code, val in replacements.items():
-            result = result.replace(code, val)
-        return result
+        The format is compiled once and cached, and only the fields it
+        references are computed.
+        """
+        template, codes = _compile_format(fmt)
+        return template.format_map({code: _FORMAT_FIELDS[code](self) for code in codes})
 
     def weekday(self) -> int:
 
         return (self.to_ordinal() % 7) + 1
 
+    def sol_of_year(self) -> int:
+        """Return the 1-based sol number within the year."""
+        return self.to_ordinal() - self.calendar.to_ordinal(self.year, 1, 1) + 1
+
     def weekday_name(self, short: bool = False) -> str:
         """
         Return the full or abbreviated weekday name
@@ -273,6 +571,10 @@ class MarsDate:
 
         return MarsDate(new_year, self.month, new_sol, calendar=self.calendar)
 
+    def to_period(self, freq: str = "month") -> "MarsPeriod":
+        """The month, quarter or year containing this date, as a MarsPeriod."""
+        return MarsPeriod.from_date(self, freq)
+
     # ----- Rounding -----
 
     def floor(self, unit: str) -> "MarsDate":
@@ -341,6 +643,7 @@ class MarsDate:
 class MarsDateTime(MarsDate):
 
     SECONDS_PER_SOL = 24 * 60 * 60
+    _FIELDS = MarsDate._FIELDS | {"hour", "minute", "second"}
 
     def __init__(self, year, month, sol, hour=0, minute=0, second=0, calendar=None):
         super().__init__(year, month, sol, calendar=calendar)
@@ -366,10 +669,15 @@ class MarsDateTime(MarsDate):
     def __str__(self):
         return f"{self.year:03d}/{self.month:02d}/{self.sol:02d} {self.hour:02d}:{self.minute:02d}:{self.second:02d}"
 
+    def __reduce__(self):
+        return (_restore_date,
+                (self.__class__, _calendar_id(self.calendar), self.to_ordinal(),
+                 (self.hour, self.minute, self.second)))
+
     # ----- Conversion -----
     def to_ordinal_float(self) -> float:
 
-        base = self.calendar.to_ordinal(self.year, self.month, self.sol)
+        base = self.to_ordinal()
         fraction = (self.hour * 3600 + self.minute * 60 +
                     self.second) / self.SECONDS_PER_SOL
         return base + fraction
@@ -377,7 +685,10 @@ class MarsDateTime(MarsDate):
     @classmethod
     def from_ordinal_float(cls, ordinal: float, calendar=None):
 
-        base_sol = int(ordinal)
+        # Floor, not int(): before ordinal 0 truncation would move the sol
+        # one day forward and flip the fraction's sign (-0.25 is 18:00 on
+        # sol -1, not 06:00 on sol 0)
+        base_sol = math.floor(ordinal)
         frac = ordinal - base_sol
         base_date = MarsDate.from_ordinal(base_sol, calendar=calendar)
         total_seconds = frac * cls.SECONDS_PER_SOL
@@ -386,6 +697,21 @@ class MarsDateTime(MarsDate):
         second = int(total_seconds % 60)
         return cls(base_date.year, base_date.month, base_date.sol, hour, minute, second, calendar=base_date.calendar)
 
+    @classmethod
+    def strptime(cls, s: str, fmt: str, calendar=None, strict: bool = False) -> "MarsDateTime":
+        """
+        Parse a string with the same codes as format(), e.g.
+        MarsDateTime.strptime("214-12-22T13:05:00", "%Y-%m-%dT%H:%M:%S").
+        Missing time fields default to 0. strict is as in MarsDate.strptime.
+        """
+        cal = calendar or DarianCalendar()
+        fields, weekday = _strptime_fields(s, fmt, cal)
+        date = cls(fields["year"], fields["month"], fields["sol"],
+                   fields["hour"], fields["minute"], fields["second"], calendar=cal)
+        if strict:
+            _check_weekday(date, weekday, s)
+        return date
+
     # ----- Comparisons -----
     def __eq__(self, other):
         if not isinstance(other, MarsDateTime):
@@ -541,18 +867,189 @@ class MarsTimedelta:
         return NotImplemented
 
 
+_PERIOD_FREQS = ("month", "quarter", "year")
+
+
+def _periods_per_year(freq: str, calendar) -> int:
+    """Number of freq periods in a year of calendar (24, 4 or 1 for Darian)."""
+    if freq not in _PERIOD_FREQS:
+        raise ValueError(f"freq must be one of: {', '.join(_PERIOD_FREQS)}")
+    if freq == "year":
+        return 1
+    months = len(calendar.month_lengths(0))
+    if freq == "month":
+        return months
+    if months % 4:
+        raise ValueError(f"The {months} months of {calendar.__class__.__name__} do not split into quarters")
+    return 4
+
+
+def _period_number(freq: str, month: int, calendar) -> int:
+    """1-based month, quarter or year number of month within its year."""
+    if freq == "year":
+        return 1
+    if freq == "month":
+        return month
+    return (month - 1) // (len(calendar.month_lengths(0)) // 4) + 1
+
+
+def _restore_period(code, freq, calendar):
+    return MarsPeriod.from_code(code, freq, calendar=_resolve_calendar(calendar))
+
+
+@total_ordering
+class MarsPeriod:
+    """
+    A Darian month, quarter or year, stored as one integer code:
+    year * 24 + month - 1 for months, year * 4 + quarter - 1 for quarters
+    and the year itself for years. Consecutive periods have consecutive codes.
+    """
+
+    def __init__(self, year: int, number: int = 1, freq: str = "month", calendar=None):
+        self.calendar = calendar or DarianCalendar()
+        per_year = _periods_per_year(freq, self.calendar)
+        if not 1 <= number <= per_year:
+            raise ValueError(f"{freq.capitalize()} number must be between 1 and {per_year}")
+        self.freq = freq
+        self.code = year * per_year + number - 1
+
+    @classmethod
+    def from_code(cls, code: int, freq: str = "month", calendar=None) -> "MarsPeriod":
+        period = cls.__new__(cls)
+        period.calendar = calendar or DarianCalendar()
+        _periods_per_year(freq, period.calendar)
+        period.freq = freq
+        period.code = int(code)
+        return period
+
+    @classmethod
+    def from_date(cls, date: MarsDate, freq: str = "month") -> "MarsPeriod":
+        """The period of freq that contains date."""
+        return cls(date.year, _period_number(freq, date.month, date.calendar),
+                   freq=freq, calendar=date.calendar)
+
+    # ----- Fields -----
+
+    @property
+    def year(self) -> int:
+        return self.code // _periods_per_year(self.freq, self.calendar)
+
+    @property
+    def number(self) -> int:
+        """Month (1-24), quarter (1-4) or 1 for a year."""
+        return self.code % _periods_per_year(self.freq, self.calendar) + 1
+
+    def start_date(self) -> MarsDate:
+        months = len(self.calendar.month_lengths(0))
+        per_period = months // _periods_per_year(self.freq, self.calendar)
+        return MarsDate(self.year, (self.number - 1) * per_period + 1, 1, calendar=self.calendar)
+
+    def end_date(self) -> MarsDate:
+        return (self + 1).start_date().add_sols(-1)
+
+    @property
+    def n_sols(self) -> int:
+        return (self + 1).start_date().to_ordinal() - self.start_date().to_ordinal()
+
+    def __contains__(self, date):
+        return (isinstance(date, MarsDate)
+                and date.calendar.__class__ is self.calendar.__class__
+                and MarsPeriod.from_date(date, self.freq).code == self.code)
+
+    # ----- Representations -----
+
+    def __repr__(self):
+        return f"MarsPeriod('{self}', freq='{self.freq}')"
+
+    def __str__(self):
+        if self.freq == "month":
+            return f"{self.year:03d}/{self.number:02d}"
+        if self.freq == "quarter":
+            return f"{self.year:03d}Q{self.number}"
+        return f"{self.year:03d}"
+
+    def __hash__(self):
+        return hash((self.code, self.freq, self.calendar.__class__.__name__))
+
+    def __reduce__(self):
+        return (_restore_period, (self.code, self.freq, _calendar_id(self.calendar)))
+
+    # ----- Comparisons and arithmetic -----
+
+    def _check_compatible(self, other):
+        if other.freq != self.freq or other.calendar.__class__ is not self.calendar.__class__:
+            raise TypeError("Cannot combine MarsPeriods of different freq or calendar")
+
+    def __eq__(self, other):
+        if not isinstance(other, MarsPeriod):
+            return False
+        return (self.code == other.code and self.freq == other.freq
+                and self.calendar.__class__ is other.calendar.__class__)
+
+    def __lt__(self, other):
+        if not isinstance(other, MarsPeriod):
+            return NotImplemented
+        self._check_compatible(other)
+        return self.code < other.code
+
+    def __add__(self, n):
+        if isinstance(n, bool) or not isinstance(n, int):
+            return NotImplemented
+        return MarsPeriod.from_code(self.code + n, self.freq, calendar=self.calendar)
+
+    def __radd__(self, n):
+        return self.__add__(n)
+
+    def __sub__(self, other):
+        if isinstance(other, MarsPeriod):
+            # Number of periods between the two
+            self._check_compatible(other)
+            return self.code - other.code
+        if isinstance(other, int) and not isinstance(other, bool):
+            return self + (-other)
+        return NotImplemented
+
+
+for _owner, _method in (
+        (MarsDate, "__init__"), (MarsDate, "from_ordinal"), (MarsDate, "from_string"),
+        (MarsDate, "strptime"), (MarsDate, "format"), (MarsDateTime, "strptime"),
+        (MarsDateTime, "from_ordinal_float")):
+    instrumentation.register(_owner, _method)
+instrumentation.register_cache("compile_format", _compile_format)
+instrumentation.register_cache("compile_parser", _compile_parser)
+
 
 # ---------------- Public API Re-Exports ----------------
-# Late imports to avoid circular dependencies
-from mars_dtc.pandas_ext import MarsDateArray, MarsDateDtype
-from mars_dtc.utils import mars_date_range, get_martian_week, get_sol_of_year
+# Resolved on first access, so importing this module does not pull in pandas
+_LAZY_EXPORTS = {
+    "MarsDateArray": "mars_dtc.pandas_ext",
+    "MarsDateDtype": "mars_dtc.pandas_ext",
+    "MarsPeriodArray": "mars_dtc.pandas_ext",
+    "MarsPeriodDtype": "mars_dtc.pandas_ext",
+    "mars_date_range": "mars_dtc.utils",
+    "get_martian_week": "mars_dtc.utils",
+    "get_sol_of_year": "mars_dtc.utils",
+    "plot": "mars_dtc.plotting",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    return getattr(importlib.import_module(module), name)
+
 
 __all__ = [
     "MarsDate",
     "MarsDateTime",
     "MarsTimedelta",
+    "MarsPeriod",
     "MarsDateArray",
     "MarsDateDtype",
+    "MarsPeriodArray",
+    "MarsPeriodDtype",
     "mars_date_range",
     "get_martian_week",
     "get_sol_of_year",
@@ -0,0 +1,180 @@
+"""
+Mission sol clocks: rover datasets count sols from landing (Curiosity's
+sol 0 is Darian 214/12/12), and a MissionClock converts such counts to and
+from Darian dates as one array operation:
+
+    clock = MissionClock.for_mission("curiosity")
+    df["darian_date"] = clock.to_darian(df["sol"])
+"""
+# ---------------- Imports ----------------
+import math
+
+import numpy as np
+import pandas as pd
+
+from mars_dtc.mars_dtc import MarsDate
+from mars_dtc.pandas_ext import MarsDateArray, _NA_ORDINAL
+from mars_dtc.timeseries import _datetimes
+
+
+# ---------------- Classes and functions ----------------
+# Local times like '13:45' or '13:45:10.5' (LMST on the mission clock)
+_LOCAL_TIME = r"^\s*(\d{1,2}):(\d{2})(?::(\d{2}(?:\.\d*)?))?\s*$"
+
+# Darian date on which each mission's first sol began. Whole sols,
+# aligned like the demo dataset: ordinal = floor(Mars Sol Date at landing)
+# + 94128. Spirit and Opportunity count the landing sol as sol 1.
+_MISSIONS = {
+    "spirit": ((209, 22, 25), 1),
+    "opportunity": ((209, 23, 17), 1),
+    "phoenix": ((212, 6, 24), 0),
+    "curiosity": ((214, 12, 12), 0),
+    "insight": ((217, 20, 27), 0),
+    "perseverance": ((219, 1, 12), 0),
+}
+_ALIASES = {"mer-a": "spirit", "mer-b": "opportunity", "msl": "curiosity", "m2020": "perseverance"}
+
+
+def _sol_values(sols) -> np.ndarray:
+    """Mission sols as float64, NaN where missing."""
+    return pd.Series(sols).to_numpy(dtype="float64", na_value=np.nan)
+
+
+def _local_time_sols(local_time) -> np.ndarray:
+    """Fraction of a sol from local times given as hours or 'HH:MM[:SS]' strings."""
+    values = pd.Series(local_time)
+    if values.dtype.kind in "iuf":
+        hours = values.to_numpy(dtype="float64")
+    else:
+        parts = values.astype(object).str.extract(_LOCAL_TIME).astype("float64")
+        bad = parts[0].isna() & values.notna()
+        if bad.any():
+            raise ValueError(f"Invalid local time {values[bad].iloc[0]!r}; expected 'HH:MM[:SS]'")
+        hours = (parts[0] + parts[1] / 60 + parts[2].fillna(0) / 3600).to_numpy()
+    if np.any(hours >= 24):
+        raise ValueError("Local times must be below 24:00")
+    return hours / 24
+
+
+def _date_ordinals(dates) -> np.ndarray:
+    """Fractional ordinals of a marsdate array, date/datetime objects or float ordinals."""
+    if isinstance(dates, (pd.Series, pd.Index)):
+        dates = dates.array
+    if isinstance(dates, MarsDateArray):
+        return dates.to_numpy()
+    if isinstance(dates, np.ndarray) and dates.dtype.kind == "f":
+        return dates
+    return np.array(
+        [d.to_ordinal_float() if isinstance(d, MarsDate) else np.nan for d in dates],
+        dtype="float64",
+    )
+
+
+class MissionClock:
+    """
+    Mission sol count anchored at epoch, the MarsDate or MarsDateTime at
+    which sol first_sol began. Sols can be fractional: sol 12.5 is midway
+    through sol 12. Conversions take scalars or array-likes (NaN/None/NA
+    stay missing) and run on float ordinals without building dates per row.
+    """
+
+    def __init__(self, epoch: MarsDate, first_sol: int = 0, name: str = None):
+        if not isinstance(epoch, MarsDate):
+            raise TypeError("epoch must be a MarsDate or MarsDateTime")
+        self.epoch = epoch
+        self.first_sol = first_sol
+        self.name = name
+        self.calendar = epoch.calendar
+        self._offset = epoch.to_ordinal_float() - first_sol
+
+    @classmethod
+    def for_mission(cls, name: str) -> "MissionClock":
+        """Clock of a registered mission, e.g. 'curiosity' or 'perseverance'."""
+        key = _ALIASES.get(name.lower(), name.lower())
+        if key not in _MISSIONS:
+            raise ValueError(f"Unknown mission {name!r}; known: {', '.join(sorted(_MISSIONS))}")
+        epoch, first_sol = _MISSIONS[key]
+        if not isinstance(epoch, MarsDate):
+            epoch = MarsDate(*epoch)
+        return cls(epoch, first_sol=first_sol, name=key)
+
+    def __repr__(self):
+        label = f"{self.name!r}, " if self.name else ""
+        return f"MissionClock({label}epoch={self.epoch!r}, first_sol={self.first_sol})"
+
+    # ----- Mission sols to Darian -----
+
+    def to_ordinals(self, sols, local_time=None) -> np.ndarray:
+        """
+        Fractional Darian ordinals at the given mission sols, optionally at
+        local_time on each sol (hours, or 'HH:MM[:SS]' strings).
+        """
+        sols = _sol_values(sols)
+        if local_time is not None:
+            # Local time counts from the start of each mission sol
+            sols = np.floor(sols) + _local_time_sols(local_time)
+        return sols + self._offset
+
+    def to_darian(self, sols):
+        """
+        Darian date on which each mission sol (or fractional instant) falls,
+        as a MarsDateArray; a scalar sol gives a MarsDate, or None if missing.
+        """
+        if np.ndim(sols) == 0 and not isinstance(sols, pd.Series):
+            if pd.isna(sols):
+                return None
+            return MarsDate.from_ordinal(math.floor(sols + self._offset), calendar=self.calendar)
+        ordinals = self.to_ordinals(sols)
+        na = np.isnan(ordinals)
+        out = np.floor(np.where(na, 0, ordinals)).astype("int64")
+        out[na] = _NA_ORDINAL
+        return MarsDateArray._simple_new(out, self.calendar)
+
+    def to_datetimes(self, sols, local_time=None) -> np.ndarray:
+        """MarsDateTime objects for to_ordinals(sols, local_time), None where missing."""
+        ordinals = self.to_ordinals(sols, local_time)
+        na = np.isnan(ordinals)
+        out = np.empty(len(ordinals), dtype=object)
+        out[~na] = _datetimes(ordinals[~na], self.calendar)
+        return out
+
+    # ----- Darian to mission sols -----
+
+    def to_mission_sol(self, dates, fractional: bool = False):
+        """
+        Mission sol of each date, datetime or fractional ordinal: the sol in
+        progress as a nullable Int64 array, or float sols with fractional=True.
+        A scalar date or ordinal gives a scalar, None if missing.
+        """
+        if isinstance(dates, MarsDate) or np.ndim(dates) == 0:
+            if pd.isna(dates):
+                return None
+            ordinal = dates.to_ordinal_float() if isinstance(dates, MarsDate) else float(dates)
+            sol = ordinal - self._offset
+            return sol if fractional else math.floor(sol)
+        return self._sols_out(_date_ordinals(dates) - self._offset, fractional)
+
+    def convert(self, sols, other: "MissionClock", fractional: bool = False):
+        """Sols of the other mission's clock at the same instants as sols of this one."""
+        if other.calendar.__class__ is not self.calendar.__class__:
+            raise TypeError("Cannot convert between clocks on different calendars")
+        return self._sols_out(_sol_values(sols) + self._offset - other._offset, fractional)
+
+    @staticmethod
+    def _sols_out(sols, fractional):
+        if fractional:
+            return sols
+        na = np.isnan(sols)
+        return pd.arrays.IntegerArray(np.floor(np.where(na, 0, sols)).astype("int64"), na)
+
+
+def register_mission(name: str, epoch: MarsDate, first_sol: int = 0):
+    """Add or replace a mission epoch for MissionClock.for_mission(name)."""
+    if not isinstance(epoch, MarsDate):
+        raise TypeError("epoch must be a MarsDate or MarsDateTime")
+    _MISSIONS[name.lower()] = (epoch, first_sol)
+
+
+def missions() -> list:
+    """Names of the registered missions."""
+    return sorted(_MISSIONS)
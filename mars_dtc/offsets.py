@@ -0,0 +1,184 @@
+"""
+Calendar offsets applied to whole marsdate columns at once:
+
+    from mars_dtc.offsets import Months, MonthEnd
+    df["due"] = df["date"] + Months(3)
+    df["month_end"] = MonthEnd(0).apply(df["date"])
+
+Relative offsets (Sols, Weeks, Months, Quarters, Years) move by n units,
+clamping the sol like MarsDate.add_months/add_years. Anchored offsets
+(MonthBegin, MonthEnd, QuarterBegin, ...) roll to the n-th period boundary,
+as pandas' MonthBegin/MonthEnd do; n=0 rolls forward only when not already
+on the boundary.
+"""
+# ---------------- Imports ----------------
+import numpy as np
+import pandas as pd
+
+from mars_dtc.mars_dtc import MarsDate, MarsDateTime, _periods_per_year
+from mars_dtc.pandas_ext import MarsDateArray, MarsPeriodArray
+from mars_dtc.timeseries import _as_marsdate_array
+
+
+# ---------------- Classes and functions ----------------
+def _shift_months(ordinals, n, calendar):
+    """Move ordinals by n months, clamping the sol to the target month's length."""
+    years, months, sols = calendar.from_ordinals(ordinals)
+    codes = years * _periods_per_year("month", calendar) + months - 1 + n
+    periods = MarsPeriodArray._simple_new(codes, "month", calendar)
+    starts = periods._start_ordinals(codes)
+    lengths = periods._start_ordinals(codes + 1) - starts
+    return starts + np.minimum(sols, lengths) - 1
+
+
+class MarsOffset:
+    """Base class of the calendar offsets; n is the number of units to move."""
+
+    def __init__(self, n: int = 1):
+        if isinstance(n, bool) or not isinstance(n, (int, np.integer)):
+            raise TypeError("n must be an integer")
+        self.n = int(n)
+
+    def _apply_ordinals(self, ordinals, calendar) -> np.ndarray:
+        raise NotImplementedError
+
+    def apply(self, dates):
+        """
+        Apply the offset to a MarsDate/MarsDateTime (the time of day is kept),
+        a MarsDateArray or anything it can be built from, or a marsdate
+        Series/Index. Missing dates stay missing.
+        """
+        if isinstance(dates, MarsDate):
+            return self._apply_scalar(dates)
+        if isinstance(dates, pd.Series):
+            return pd.Series(self.apply(dates.array), index=dates.index, name=dates.name)
+        if isinstance(dates, pd.Index):
+            return pd.Index(self.apply(dates.array), name=dates.name)
+        dates = _as_marsdate_array(dates)
+        na = dates.isna()
+        out = dates._ordinals.copy()
+        out[~na] = self._apply_ordinals(dates._ordinals[~na], dates._calendar)
+        return MarsDateArray._simple_new(out, dates._calendar)
+
+    def _apply_scalar(self, date):
+        cal = date.calendar
+        ordinal = int(self._apply_ordinals(np.array([date.to_ordinal()], dtype="int64"), cal)[0])
+        result = MarsDate.from_ordinal(ordinal, calendar=cal)
+        if isinstance(date, MarsDateTime):
+            return MarsDateTime(result.year, result.month, result.sol,
+                                date.hour, date.minute, date.second, calendar=cal)
+        return result
+
+    # ----- Operators -----
+
+    def __add__(self, other):
+        if isinstance(other, (MarsDate, MarsDateArray, pd.Series, pd.Index)):
+            return self.apply(other)
+        return NotImplemented
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+    def __neg__(self):
+        return type(self)(-self.n)
+
+    def __mul__(self, k):
+        if isinstance(k, bool) or not isinstance(k, (int, np.integer)):
+            return NotImplemented
+        return type(self)(self.n * int(k))
+
+    def __rmul__(self, k):
+        return self.__mul__(k)
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other.n == self.n
+
+    def __hash__(self):
+        return hash((type(self).__name__, self.n))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.n})"
+
+
+# ----- Relative offsets -----
+
+class Sols(MarsOffset):
+    _sols = 1
+
+    def _apply_ordinals(self, ordinals, calendar):
+        return ordinals + self.n * self._sols
+
+
+class Weeks(Sols):
+    _sols = 7
+
+
+class Months(MarsOffset):
+    """n months, the sol clamped to the target month's length like MarsDate.add_months."""
+
+    def _months(self, calendar) -> int:
+        return self.n
+
+    def _apply_ordinals(self, ordinals, calendar):
+        return _shift_months(ordinals, self._months(calendar), calendar)
+
+
+class Quarters(Months):
+    def _months(self, calendar):
+        months = _periods_per_year("month", calendar)
+        return self.n * months // _periods_per_year("quarter", calendar)
+
+
+class Years(Months):
+    """n years, the sol clamped like MarsDate.add_years."""
+
+    def _months(self, calendar):
+        return self.n * _periods_per_year("month", calendar)
+
+
+# ----- Anchored offsets -----
+
+class _Anchored(MarsOffset):
+    _freq = None
+    _end = 0
+
+    def _apply_ordinals(self, ordinals, calendar):
+        periods = MarsPeriodArray.from_dates(MarsDateArray._simple_new(ordinals, calendar), self._freq)
+        codes = periods._codes
+        # Start (or end) of each date's own period, to tell who is on the anchor
+        off_anchor = ordinals != periods._start_ordinals(codes + self._end) - self._end
+        if self._end:
+            target = codes + self.n - ((self.n > 0) & off_anchor)
+        else:
+            target = codes + self.n + ((self.n <= 0) & off_anchor)
+        return periods._start_ordinals(target + self._end) - self._end
+
+
+class MonthBegin(_Anchored):
+    _freq = "month"
+
+
+class MonthEnd(_Anchored):
+    _freq = "month"
+    _end = 1
+
+
+class QuarterBegin(_Anchored):
+    _freq = "quarter"
+
+
+class QuarterEnd(_Anchored):
+    _freq = "quarter"
+    _end = 1
+
+
+class YearBegin(_Anchored):
+    _freq = "year"
+
+
+class YearEnd(_Anchored):
+    _freq = "year"
+    _end = 1
@@ -1,11 +1,106 @@
 # ---------------- Imports ----------------
+import gc
+import operator
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from string import Formatter
+
 import numpy as np
+import pandas as pd
 
-from mars_dtc.mars_dtc import MarsDate, MarsTimedelta
-from pandas.api.extensions import ExtensionDtype, ExtensionArray, register_extension_dtype
+from mars_dtc import instrumentation
+from mars_dtc.base_calendar import _calendar_id, _resolve_calendar
+from mars_dtc.darian_calendar import DarianCalendar
+from mars_dtc.mars_dtc import (
+    MarsDate, MarsDateTime, MarsPeriod, MarsTimedelta, _PERIOD_FREQS, _boxed_date, _compile_format,
+    _intern_all,
+    _periods_per_year, _strptime_fields,
+)
+from pandas.api.extensions import (
+    ExtensionDtype, ExtensionArray, no_default, register_extension_dtype, take,
+)
+from pandas.api.indexers import check_array_indexer
+from pandas.api.types import infer_dtype, is_integer, is_string_dtype, pandas_dtype
 
 # ---------------- Classes and functions ----------------
 
+# Sentinel stored in the ordinal buffer for missing values (like NaT)
+_NA_ORDINAL = np.iinfo(np.int64).min
+
+# Same forms as MarsDate.from_string, plus the sign isoformat() writes
+_DATE_STRING = r"^\s*([+-]?\d+)[/.\-\s](\d+)[/.\-\s](\d+)\s*$"
+_NA_STRINGS = ("", "NaT")
+
+
+def _is_na(value):
+    return (
+        value is None
+        or value is pd.NA
+        or value is pd.NaT
+        or (isinstance(value, (float, np.floating)) and np.isnan(value))
+    )
+
+
+def _render_unique(values, render):
+    """Render each distinct value once and broadcast the strings back."""
+    uniques, inverse = np.unique(values, return_inverse=True)
+    table = np.array([render(v) for v in uniques.tolist()], dtype=str)
+    return table[inverse.reshape(-1)]
+
+
+def _render_dates(years, months, sols) -> np.ndarray:
+    """str() of each date from its field columns, e.g. '214/14/28'."""
+    return np.char.add(
+        np.char.add(_render_unique(years, lambda y: f"{y:03d}/"),
+                    _render_unique(months, lambda m: f"{m:02d}/")),
+        _render_unique(sols, lambda s: f"{s:02d}"),
+    )
+
+
+def _component_values(values, n):
+    """
+    Return (int64 values, missing mask, non-integral mask) for one column of
+    from_components input. Integer ndarrays are used as-is.
+    """
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+        if len(values) != n:
+            raise ValueError("years, months and sols must have the same length")
+        no = np.zeros(n, dtype=bool)
+        return values.astype("int64", copy=False), no, no
+    floats = pd.Series(values).to_numpy(dtype="float64", na_value=np.nan)
+    if len(floats) != n:
+        raise ValueError("years, months and sols must have the same length")
+    missing = np.isnan(floats)
+    filled = np.where(missing, 0, floats)
+    return filled.astype("int64"), missing, filled != np.floor(filled)
+
+
+def _convert_chunk(values, start, calendar):
+    """Ordinals for one chunk of from_values input; errors carry the absolute position."""
+    try:
+        if len(values) and infer_dtype(values, skipna=True) == "string":
+            return MarsDateArray.from_strings(values, calendar=calendar)._ordinals
+        return MarsDateArray(values, calendar=calendar)._ordinals
+    except (TypeError, ValueError):
+        # Slow path, only taken on failure: find the first bad element
+        for i, v in enumerate(values):
+            try:
+                MarsDateArray([v], calendar=calendar)
+            except (TypeError, ValueError) as e:
+                raise type(e)(f"Cannot convert value at position {start + i} ({v!r}): {e}") from None
+        raise
+
+
+def _restore_array(ordinals, calendar):
+    """Unpickle a MarsDateArray from its ordinal buffer and calendar id."""
+    return MarsDateArray._simple_new(ordinals, _resolve_calendar(calendar))
+
+
+def _restore_period_array(codes, freq, calendar):
+    return MarsPeriodArray._simple_new(codes, freq, _resolve_calendar(calendar))
+
 
 @register_extension_dtype
 class MarsDateDtype(ExtensionDtype):
@@ -16,7 +111,7 @@ class MarsDateDtype(ExtensionDtype):
 
     @classmethod
     def construct_array_type(cls):
-        return MarsDateArray 
+        return MarsDateArray
 
     @property
     def _is_numeric(self):
@@ -30,54 +125,329 @@ class MarsDateDtype(ExtensionDtype):
     def _is_datetime(self):
         return True
 
+    def __from_arrow__(self, array):
+        from mars_dtc.arrow_ext import from_arrow
+        ordinals, calendar = from_arrow(array, _NA_ORDINAL)
+        return MarsDateArray._simple_new(ordinals, calendar)
+
 
 class MarsDateArray(ExtensionArray):
-    def __init__(self, values):
-        self._data = np.asarray(values, dtype=object)
-        converted = []
-        for v in values:
-            if v is None:
-                converted.append(None)
+    """
+    Array of MarsDate values stored as an int64 buffer of ordinals, with
+    ``_NA_ORDINAL`` marking missing entries. Scalars are boxed on access.
+    """
+
+    def __init__(self, values, calendar=None):
+        if isinstance(values, MarsDateArray):
+            self._ordinals = values._ordinals.copy()
+            self._calendar = calendar or values._calendar
+            return
+
+        if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+            self._ordinals = values.astype("int64", copy=True)
+            self._calendar = calendar or DarianCalendar()
+            return
+
+        if not hasattr(values, "__len__"):
+            values = list(values)
+
+        cal = calendar or next(
+            (v.calendar for v in values if isinstance(v, MarsDate)), None
+        ) or DarianCalendar()
+
+        ordinals = np.empty(len(values), dtype="int64")
+        for i, v in enumerate(values):
+            if _is_na(v):
+                ordinals[i] = _NA_ORDINAL
+            elif isinstance(v, MarsDateTime):
+                # Whole sols only; storing it would silently drop the time of day
+                raise TypeError(
+                    f"MarsDateArray holds dates, not MarsDateTime {v!r}; keep "
+                    "datetimes in an object column (pd.Series(values, dtype=object)) "
+                    "or as to_ordinal_float() floats, or drop the time of day with "
+                    "MarsDate.from_ordinal(v.to_ordinal())")
             elif isinstance(v, MarsDate):
-                converted.append(v)
-            elif isinstance(v, int):
+                if v.calendar.__class__ != cal.__class__:
+                    raise TypeError(
+                        "Cannot mix calendars in a MarsDateArray")
+                ordinals[i] = v.to_ordinal()
+            elif isinstance(v, (int, np.integer)):
                 # Treat integer as ordinal sol count
-                converted.append(MarsDate.from_ordinal(v))
-            elif isinstance(v, (float, np.floating)) and not np.isnan(v):
+                ordinals[i] = v
+            elif isinstance(v, (float, np.floating)):
                 # Also handle floats that represent ordinals
-                converted.append(MarsDate.from_ordinal(int(v)))
+                ordinals[i] = int(v)
             elif isinstance(v, str):
                 # Accept flexible date string formats like '214-12-22', '214/12/22', '214.12.22'
                 try:
-                    converted.append(MarsDate.from_string(v))
+                    date = MarsDate.from_string(v, calendar=cal)
                 except Exception:
                     cleaned = v.strip().replace("-", "/").replace(".", "/").replace(" ", "/")
-                    converted.append(MarsDate.from_string(cleaned))
+                    date = MarsDate.from_string(cleaned, calendar=cal)
+                ordinals[i] = date.to_ordinal()
             else:
                 raise TypeError(
                     f"Invalid value type {type(v)} in MarsDateArray: {v}")
-        self._data = np.asarray(converted, dtype=object)
+
+        self._ordinals = ordinals
+        self._calendar = cal
+
+    @classmethod
+    def _simple_new(cls, ordinals, calendar):
+        """Wrap an int64 ordinal buffer without validation or copying."""
+        result = cls.__new__(cls)
+        result._ordinals = ordinals
+        result._calendar = calendar
+        return result
 
     @classmethod
     def _from_sequence(cls, scalars, dtype=None, copy=False):
-        return cls(list(scalars))
+        if isinstance(scalars, np.ndarray) and scalars.dtype.kind in "iu":
+            return cls.from_ordinals(scalars)
+        if isinstance(scalars, MarsDateArray):
+            return scalars.copy() if copy else scalars
+        if not isinstance(scalars, str) and hasattr(scalars, "__len__") and len(scalars) \
+                and infer_dtype(scalars, skipna=True) == "string":
+            return cls.from_strings(scalars)
+        return cls(scalars)
+
+    @classmethod
+    def _from_sequence_of_strings(cls, strings, *, dtype=None, copy=False):
+        return cls.from_strings(strings)
+
+    @classmethod
+    def from_strings(cls, strings, calendar=None) -> "MarsDateArray":
+        """
+        Vectorized parse of 'Y/M/D' strings in the forms MarsDate.from_string
+        accepts (also with a leading '+', as isoformat() writes). Each
+        distinct string is parsed once; None, NaN, '' and 'NaT' are missing.
+        """
+        cal = calendar or DarianCalendar()
+        codes, uniques = pd.factorize(np.asarray(strings, dtype=object))
+        uniques = pd.Series(uniques, dtype=object)
+        is_na = uniques.isin(_NA_STRINGS).to_numpy()
+        parts = uniques.str.extract(_DATE_STRING)
+
+        # Unmatched strings (which include the missing markers) extract as NaN
+        bad = parts[0].isna().to_numpy() & ~is_na
+        if bad.any():
+            raise ValueError(f"Invalid MarsDate string: {uniques[np.flatnonzero(bad)[0]]}")
+        parsed = cls.from_components(
+            parts[0].astype("float64"), parts[1].astype("float64"), parts[2].astype("float64"),
+            calendar=cal, errors="coerce")
+        bad = parsed.isna() & ~is_na
+        if bad.any():
+            shown = ", ".join(repr(v) for v in uniques[bad][:10])
+            raise ValueError(f"{bad.sum()} invalid date string(s): {shown}")
+
+        ordinals = np.full(len(codes), _NA_ORDINAL, dtype="int64")
+        valid = codes >= 0
+        ordinals[valid] = parsed._ordinals[codes[valid]]
+        return cls._simple_new(ordinals, cal)
+
+    @classmethod
+    def from_values(cls, values, calendar=None, workers: int = 1,
+                    chunksize: int = 1_000_000, processes: bool = False) -> "MarsDateArray":
+        """
+        Build an array from a large mixed sequence (MarsDate objects, date
+        strings, ordinals, missing values) in chunks of chunksize rows,
+        converted by up to workers threads, or processes with processes=True.
+        Processes avoid the GIL but pickle every chunk, which pays off for
+        string-heavy input; MarsDate objects are cheaper to convert in place.
+        workers=None uses every CPU. Chunks are concatenated in input order,
+        so the result does not depend on scheduling, and a bad value is
+        reported with its position in values.
+        """
+        if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+            return cls.from_ordinals(values, calendar=calendar)
+        if not hasattr(values, "__len__"):
+            values = list(values)
+        elif not isinstance(values, (list, tuple, np.ndarray)):
+            values = np.asarray(values, dtype=object)
+
+        # Resolve the calendar once so every chunk agrees on it
+        cal = calendar or next(
+            (v.calendar for v in values if isinstance(v, MarsDate)), None
+        ) or DarianCalendar()
+
+        starts = range(0, len(values), chunksize)
+        chunks = [values[start:start + chunksize] for start in starts]
+        workers = workers or os.cpu_count()
+        if workers == 1 or len(chunks) <= 1:
+            parts = list(map(_convert_chunk, chunks, starts, repeat(cal)))
+        else:
+            pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+            with pool(max_workers=min(workers, len(chunks))) as executor:
+                parts = list(executor.map(_convert_chunk, chunks, starts, repeat(cal)))
+
+        ordinals = np.concatenate(parts) if parts else np.empty(0, dtype="int64")
+        return cls._simple_new(ordinals, cal)
+
+    @classmethod
+    def from_ordinals(cls, ordinals, calendar=None) -> "MarsDateArray":
+        """
+        Build an array from integer ordinals (copied into the int64 buffer).
+        NaN in a float input marks a missing value.
+        """
+        ordinals = np.asarray(ordinals)
+        if ordinals.dtype.kind == "f":
+            missing = np.isnan(ordinals)
+            buffer = np.where(missing, 0, ordinals).astype("int64")
+            buffer[missing] = _NA_ORDINAL
+        elif ordinals.dtype.kind in "iu":
+            buffer = ordinals.astype("int64", copy=True)
+        else:
+            raise TypeError(f"Cannot build a MarsDateArray from {ordinals.dtype} ordinals")
+        return cls._simple_new(buffer, calendar or DarianCalendar())
+
+    @classmethod
+    def from_components(cls, years, months, sols, calendar=None,
+                        errors: str = "raise") -> "MarsDateArray":
+        """
+        Build an array from year, month and sol columns without creating a
+        MarsDate per row. Rows with a missing component are missing. Invalid
+        dates are all checked at once: errors="raise" reports every bad row
+        in one ValueError, errors="coerce" turns them into missing values.
+        """
+        if errors not in ("raise", "coerce"):
+            raise ValueError("errors must be 'raise' or 'coerce'")
+        cal = calendar or DarianCalendar()
+        n = len(years)
+        (y, y_na, y_frac), (m, m_na, m_frac), (s, s_na, s_frac) = (
+            _component_values(values, n) for values in (years, months, sols))
+
+        missing = y_na | m_na | s_na
+        invalid = ~missing & (y_frac | m_frac | s_frac | ~cal.valid_dates(y, m, s))
+        if errors == "raise" and invalid.any():
+            rows = np.flatnonzero(invalid)
+            shown = ", ".join(
+                f"{i}: ({y[i]}, {m[i]}, {s[i]})" for i in rows[:10].tolist())
+            more = f" and {len(rows) - 10} more" if len(rows) > 10 else ""
+            raise ValueError(f"{len(rows)} invalid date(s) at rows {shown}{more}")
+
+        ordinals = np.full(n, _NA_ORDINAL, dtype="int64")
+        keep = ~(missing | invalid)
+        ordinals[keep] = cal.to_ordinals(y[keep], m[keep], s[keep])
+        return cls._simple_new(ordinals, cal)
+
+    @classmethod
+    def _from_factorized(cls, uniques, original):
+        return cls._simple_new(np.asarray(uniques, dtype="int64"), original._calendar)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        to_concat = list(to_concat)
+        return cls._simple_new(
+            np.concatenate([a._ordinals for a in to_concat]),
+            to_concat[0]._calendar,
+        )
+
+    @classmethod
+    def strptime(cls, strings, fmt: str, calendar=None, strict: bool = False) -> "MarsDateArray":
+        """
+        Bulk MarsDate.strptime. Each distinct string is parsed once with the
+        cached compiled pattern; ordinals (and, with strict=True, weekday
+        checks) are then computed for all of them at once. Missing values
+        stay missing.
+        """
+        cal = calendar or DarianCalendar()
+        codes, uniques = pd.factorize(np.asarray(strings, dtype=object))
+
+        n = len(uniques)
+        years = np.empty(n, dtype="int64")
+        months = np.empty(n, dtype="int64")
+        sols = np.empty(n, dtype="int64")
+        weekdays = np.zeros(n, dtype="int64")
+        for i, s in enumerate(uniques):
+            fields, weekday = _strptime_fields(s, fmt, cal)
+            cal.validate_date(fields["year"], fields["month"], fields["sol"])
+            years[i], months[i], sols[i] = fields["year"], fields["month"], fields["sol"]
+            weekdays[i] = weekday or 0
+
+        ordinals = cal.to_ordinals(years, months, sols)
+        bad = (weekdays != 0) & (ordinals % 7 + 1 != weekdays)
+        if strict and bad.any():
+            s = uniques[np.flatnonzero(bad)[0]]
+            raise ValueError(f"Weekday in {s!r} does not match the date")
+
+        result = np.full(len(codes), _NA_ORDINAL, dtype="int64")
+        valid = codes >= 0
+        result[valid] = ordinals[codes[valid]]
+        return cls._simple_new(result, cal)
+
+    def __reduce__(self):
+        # The int64 buffer pickles as raw bytes, and out-of-band under
+        # protocol 5 when a buffer_callback is given
+        return (_restore_array,
+                (np.ascontiguousarray(self._ordinals), _calendar_id(self._calendar)))
+
+    def _box_values(self):
+        """Return an object ndarray of MarsDate (None where missing)."""
+        out = np.empty(len(self), dtype=object)
+        valid = ~self.isna()
+        ordinals = self._ordinals[valid]
+        cal = self._calendar
+        years, months, sols = cal.from_ordinals(ordinals)
+        # Rendered column-wise here so str() on the boxes, which is what
+        # to_csv and display call per element, is a cache lookup
+        texts = _render_dates(years, months, sols).tolist() if len(ordinals) else []
+        shared = _intern_all(MarsDate, ordinals.tolist(), cal)
+        if shared is not None:
+            for date, text in zip(shared, texts):
+                date._str = text
+            out[valid] = shared
+            return out
+        # The boxes hold no cycles; pausing the collector keeps it from
+        # rescanning the growing list on every allocation threshold
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            out[valid] = [
+                _boxed_date(cal, y, m, s, o, t)
+                for o, y, m, s, t in zip(ordinals.tolist(), years.tolist(), months.tolist(),
+                                         sols.tolist(), texts)
+            ]
+        finally:
+            if gc_enabled:
+                gc.enable()
+        return out
 
     def __len__(self):
-        return len(self._data)
+        return len(self._ordinals)
 
     def __getitem__(self, item):
-        return self._data[item]
+        if is_integer(item):
+            ordinal = self._ordinals[item]
+            if ordinal == _NA_ORDINAL:
+                return None
+            return MarsDate.from_ordinal(int(ordinal), calendar=self._calendar)
+        item = check_array_indexer(self, item)
+        return self._simple_new(self._ordinals[item], self._calendar)
 
     def __iter__(self):
-        return iter(self._data)
+        return iter(self._box_values())
 
     def __repr__(self):
-        return f"MarsDateArray({self._data})"
+        return f"MarsDateArray({self._box_values()})"
+
+    def _shift(self, sols):
+        # Same truncation as MarsDate.from_ordinal(int(ordinal + sols))
+        na = self.isna()
+        shifted = np.trunc(self._ordinals + sols).astype("int64")
+        shifted[na] = _NA_ORDINAL
+        return self._simple_new(shifted, self._calendar)
+
+    def _timedeltas(self, other_ordinals, na):
+        diffs = self._ordinals - other_ordinals
+        return np.array(
+            [None if missing else MarsTimedelta(int(d))
+             for d, missing in zip(diffs.tolist(), na.tolist())],
+            dtype=object,
+        )
 
     def __add__(self, other):
         if isinstance(other, MarsTimedelta):
-
-            return MarsDateArray([v.add_sols(other.sols) if v is not None else None for v in self._data])
+            return self._shift(other.sols)
         return NotImplemented
 
     def __radd__(self, other):
@@ -86,20 +456,12 @@ class MarsDateArray(ExtensionArray):
     def __sub__(self, other):
         if isinstance(other, MarsTimedelta):
             # Subtract a timedelta
-            return MarsDateArray([v.add_sols(-other.sols) if v is not None else None for v in self._data])
+            return self._shift(-other.sols)
         if isinstance(other, MarsDateArray):
             # Elementwise difference → return MarsTimedelta array (list)
-            return np.array(
-                [MarsTimedelta(v1.to_ordinal() - v2.to_ordinal()) if (v1 and v2)
-                 else None for v1, v2 in zip(self._data, other._data)],
-                dtype=object,
-            )
+            return self._timedeltas(other._ordinals, self.isna() | other.isna())
         if isinstance(other, MarsDate):
-            return np.array(
-                [MarsTimedelta(v.to_ordinal() - other.to_ordinal())
-                 if v is not None else None for v in self._data],
-                dtype=object,
-            )
+            return self._timedeltas(other.to_ordinal(), self.isna())
         return NotImplemented
 
 
@@ -107,145 +469,725 @@ class MarsDateArray(ExtensionArray):
     def dtype(self):
         return MarsDateDtype()
 
+    @property
+    def nbytes(self):
+        return self._ordinals.nbytes
+
     def isna(self):
-        return np.array([x is None for x in self._data], dtype=bool)
+        return self._ordinals == _NA_ORDINAL
 
     def take(self, indices, allow_fill=False, fill_value=None):
-        result = []
-        n = len(self)
         if allow_fill:
-            if fill_value is None:
-                fill_value = None
-            for i in indices:
-                if i == -1:
-                    result.append(fill_value)
-                else:
-                    if i < -n or i >= n:
-                        raise IndexError("take index out of bounds")
-                    result.append(self._data[i])
-        else:
-            for i in indices:
-                if i < -n or i >= n:
-                    raise IndexError("take index out of bounds")
-                result.append(self._data[i])
-        return MarsDateArray(result)
+            fill_value = (
+                _NA_ORDINAL if _is_na(fill_value) else fill_value.to_ordinal()
+            )
+        result = take(self._ordinals, indices,
+                      allow_fill=allow_fill, fill_value=fill_value)
+        return self._simple_new(result, self._calendar)
 
     # Equality
     def __eq__(self, other):
         if isinstance(other, MarsDateArray):
-            return np.array([a == b for a, b in zip(self._data, other._data)], dtype=object)
+            if self._calendar.__class__ != other._calendar.__class__:
+                return np.zeros(len(self), dtype=bool)
+            return (self._ordinals == other._ordinals) & ~self.isna()
         elif isinstance(other, MarsDate):
-            return np.array([a == other for a in self._data], dtype=object)
+            if self._calendar.__class__ != other.calendar.__class__:
+                return np.zeros(len(self), dtype=bool)
+            return (self._ordinals == other.to_ordinal()) & ~self.isna()
         else:
             return NotImplemented
 
-    def _compare_op(self, other, op):
+    def _other_ordinals(self, other):
+        """(ordinals, missing mask) of a MarsDateArray or MarsDate operand."""
         if isinstance(other, MarsDateArray):
-            return np.array([op(a, b) for a, b in zip(self._data, other._data)], dtype=bool)
+            other_cal, other_ordinals, other_na = other._calendar, other._ordinals, other.isna()
         elif isinstance(other, MarsDate):
-            return np.array([op(a, other) for a in self._data], dtype=bool)
+            other_cal, other_ordinals, other_na = other.calendar, other.to_ordinal(), False
         else:
             raise TypeError(f"Cannot compare MarsDateArray with {type(other)}")
+        if self._calendar.__class__ != other_cal.__class__:
+            raise TypeError(
+                "Cannot compare MarsDate objects with different calendars")
+        return other_ordinals, other_na
+
+    def _compare_op(self, other, op):
+        other_ordinals, other_na = self._other_ordinals(other)
+        return op(self._ordinals, other_ordinals) & ~(self.isna() | other_na)
 
     def __ge__(self, other):
-        import operator
         return self._compare_op(other, operator.ge)
 
     def __le__(self, other):
-        import operator
         return self._compare_op(other, operator.le)
 
     def __gt__(self, other):
-        import operator
         return self._compare_op(other, operator.gt)
 
     def __lt__(self, other):
-        import operator
         return self._compare_op(other, operator.lt)
 
 
     def copy(self):
-        return MarsDateArray(self._data.copy())
+        return self._simple_new(self._ordinals.copy(), self._calendar)
 
-    def _from_factorized(self, uniques, original):
-        return MarsDateArray(list(uniques))
+    def _values_for_factorize(self):
+        return self._ordinals, _NA_ORDINAL
 
     def _values_for_argsort(self):
-        out = np.empty(len(self._data), dtype="float64")
-        for i, v in enumerate(self._data):
-            out[i] = np.nan if v is None else v.to_ordinal()
-        return out
+        # Missing values are handled separately by pandas through isna()
+        return self._ordinals
 
     def _values_for_plotting(self):
-        return np.array([np.nan if v is None else v.to_ordinal() for v in self._data], dtype="float64")
+        return self.to_numpy()
 
     def _formatter(self, boxed=False):
-
+        # pandas boxes through _box_values first, so str() is a cache hit
         def format_func(x):
             if x is None:
                 return "NaT"
             return str(x)
         return format_func
 
+    # ----- Formatting -----
+
+    def strftime(self, date_format: str = "%Y/%m/%d", na_rep=None) -> np.ndarray:
+        """
+        Vectorized MarsDate.format over the whole array. The format is
+        compiled once and each field is rendered column-wise from the
+        ordinal buffer. Returns an object ndarray of str.
+        """
+        template, codes = _compile_format(date_format)
+        na = self.isna()
+        ordinals = np.where(na, 0, self._ordinals)
+        cal = self._calendar
+        years, months, sols = cal.from_ordinals(ordinals)
+
+        fields = {}
+        for code in codes:
+            if code == "Y":
+                fields[code] = _render_unique(
+                    years, lambda y: f"{y:+04d}" if y < 0 else f"{y:03d}")
+            elif code == "y":
+                fields[code] = _render_unique(years, lambda y: f"{abs(y) % 100:02d}")
+            elif code == "m":
+                fields[code] = _render_unique(months, lambda m: f"{m:02d}")
+            elif code == "d":
+                fields[code] = _render_unique(sols, lambda s: f"{s:02d}")
+            elif code in ("B", "b"):
+                fields[code] = _render_unique(
+                    months, lambda m: cal.month_name(m, short=(code == "b")))
+            elif code in ("A", "a"):
+                fields[code] = _render_unique(
+                    ordinals % 7 + 1, lambda wd: cal.weekday_name(wd, short=(code == "a")))
+            else:
+                # Dates carry no time of day
+                fields[code] = np.full(len(self), "00")
+
+        out = np.full(len(self), "")
+        for literal, code, _, _ in Formatter().parse(template):
+            if literal:
+                out = np.char.add(out, literal)
+            if code is not None:
+                out = np.char.add(out, fields[code])
+        out = out.astype(object)
+        out[na] = na_rep
+        return out
+
+    def isoformat(self) -> np.ndarray:
+        """Vectorized MarsDate.isoformat, e.g. '+0214-14-28'; None where missing."""
+        na = self.isna()
+        years, months, sols = self._calendar.from_ordinals(np.where(na, 0, self._ordinals))
+        out = np.char.add(
+            np.char.add(_render_unique(years, lambda y: f"{y:+05d}-"),
+                        _render_unique(months, lambda m: f"{m:02d}-")),
+            _render_unique(sols, lambda s: f"{s:02d}"),
+        ).astype(object)
+        out[na] = None
+        return out
+
+    def astype(self, dtype, copy=True):
+        dtype = pandas_dtype(dtype)
+        if isinstance(dtype, MarsDateDtype):
+            return self.copy() if copy else self
+        if dtype == object:
+            return self._box_values()
+        if is_string_dtype(dtype):
+            strings = self.strftime(na_rep="NaT")
+            if isinstance(dtype, ExtensionDtype):
+                return dtype.construct_array_type()._from_sequence(strings, dtype=dtype)
+            return strings.astype(dtype)
+        return super().astype(dtype, copy=copy)
+
+
+    def __arrow_array__(self, type=None):
+        from mars_dtc.arrow_ext import to_arrow
+        return to_arrow(self._ordinals, self.isna(), self._calendar)
+
+    @property
+    def asi8(self) -> np.ndarray:
+        """Read-only int64 view of the ordinal buffer (no copy); missing is _NA_ORDINAL."""
+        view = self._ordinals.view()
+        view.flags.writeable = False
+        return view
 
     def __array__(self, dtype=None, copy=None):
-        arr = np.array(
-            [np.nan if v is None else v.to_ordinal() for v in self._data],
-            dtype="float64" if dtype is None else dtype,
-        )
-        if copy:
-            arr = arr.copy()
-        return arr
+        # int64 is the ordinal buffer itself (missing as _NA_ORDINAL, see
+        # asi8); any other dtype is a conversion, so copy=False cannot be met
+        if dtype is not None and np.dtype(dtype) == np.int64:
+            return self._ordinals.copy() if copy else self.asi8
+        if copy is False:
+            raise ValueError(
+                "Unable to avoid a copy converting a MarsDateArray to a NumPy array")
+        if dtype is not None and np.dtype(dtype) == object:
+            return self._box_values()
+        return self.to_numpy(dtype=dtype)
+
+    # ----- NumPy protocols -----
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if any(isinstance(x, (pd.Series, pd.DataFrame, pd.Index)) for x in inputs):
+            return NotImplemented
+        if "out" not in kwargs:
+            if method == "__call__" and len(inputs) == 2:
+                result = self._binary_ufunc(ufunc, *inputs)
+                if result is not NotImplemented:
+                    return result
+            elif method == "__call__" and ufunc in (np.isnan, np.isnat):
+                return self.isna()
+            elif method == "reduce" and ufunc in _UFUNC_REDUCTIONS \
+                    and kwargs.get("axis", 0) in (0, None):
+                return self._reduce(_UFUNC_REDUCTIONS[ufunc])
+        if any(isinstance(x, MarsDateArray) for x in kwargs.get("out", ())):
+            return NotImplemented
+        # Anything else sees the float ordinals (NaN where missing)
+        return getattr(ufunc, method)(*_float_ordinals(inputs), **kwargs)
+
+    def _binary_ufunc(self, ufunc, left, right):
+        if ufunc in _UFUNC_DUNDERS:
+            if left is self:
+                return getattr(self, _UFUNC_DUNDERS[ufunc])(right)
+            if ufunc in _UFUNC_FLIPPED:
+                return getattr(self, _UFUNC_DUNDERS[_UFUNC_FLIPPED[ufunc]])(left)
+        if ufunc in (np.maximum, np.minimum, np.fmax, np.fmin):
+            return self._extremum(right if left is self else left, ufunc)
+        return NotImplemented
+
+    def _extremum(self, other, ufunc):
+        other_ordinals, other_na = self._other_ordinals(other)
+        na = self.isna()
+        out = (np.maximum if ufunc in (np.maximum, np.fmax) else np.minimum)(
+            self._ordinals, other_ordinals)
+        if ufunc in (np.fmax, np.fmin):
+            # Missing values lose to any date, as NaN does for fmax/fmin
+            out = np.where(na, other_ordinals, np.where(other_na, self._ordinals, out))
+            missing = na & other_na
+        else:
+            missing = na | other_na
+        out = np.asarray(out, dtype="int64").copy()
+        out[np.broadcast_to(missing, out.shape)] = _NA_ORDINAL
+        return self._simple_new(out, self._calendar)
+
+    def __array_function__(self, func, types, args, kwargs):
+        implementation = _HANDLED_FUNCTIONS.get(func)
+        if implementation is not None:
+            return implementation(*args, **kwargs)
+        return func(*_float_ordinals(args), **dict(zip(kwargs, _float_ordinals(kwargs.values()))))
+
+    def _search_keys(self):
+        # Missing values sort last, as NaT does in np.sort
+        if not self.isna().any():
+            return self._ordinals
+        return np.where(self.isna(), np.iinfo(np.int64).max, self._ordinals)
+
+    def searchsorted(self, value, side="left", sorter=None):
+        """Find insertion points for MarsDate value(s) in this (sorted) array."""
+        if not isinstance(value, (MarsDate, MarsDateArray)):
+            value = MarsDateArray(value, calendar=self._calendar)
+        ordinals, na = self._other_ordinals(value)
+        if np.any(na):
+            ordinals = np.where(na, np.iinfo(np.int64).max, ordinals)
+        return self._search_keys().searchsorted(ordinals, side=side, sorter=sorter)
 
 
     def to_numpy(self, dtype=None, copy=False, na_value=np.nan):
-        return np.array(
-            [na_value if v is None else v.to_ordinal() for v in self._data],
-            dtype="float64" if dtype is None else dtype,
-        )
+        if na_value is no_default:
+            na_value = np.nan
+        dtype = np.dtype("float64" if dtype is None else dtype)
+        na = self.isna()
+        has_na = na.any()
+        if has_na and dtype.kind in "iub" and _is_na(na_value):
+            raise ValueError(
+                f"Cannot convert a MarsDateArray with missing values to {dtype}; "
+                "pass an integer na_value or use asi8")
+        arr = self._ordinals.astype(dtype, copy=copy or has_na)
+        if has_na:
+            arr[na] = na_value
+        return arr
 
 
     def _reduce(self, name, skipna=True, **kwargs):
-        vals = [v for v in self._data if v is not None]
-        if not vals:
+        valid = self._ordinals[~self.isna()]
+        if not len(valid):
             return None
         if name == "min":
-            return min(vals)
+            return MarsDate.from_ordinal(int(valid.min()), calendar=self._calendar)
         if name == "max":
-            return max(vals)
+            return MarsDate.from_ordinal(int(valid.max()), calendar=self._calendar)
         raise TypeError(f"Reduction '{name}' not supported for MarsDateArray")
 
     def floor(self, freq="month"):
-        return MarsDateArray([v.floor(freq) if v is not None else None for v in self._data])
+        return MarsDateArray([v.floor(freq) if v is not None else None for v in self],
+                             calendar=self._calendar)
 
     def ceil(self, freq="month"):
-        return MarsDateArray([v.ceil(freq) if v is not None else None for v in self._data])
+        return MarsDateArray([v.ceil(freq) if v is not None else None for v in self],
+                             calendar=self._calendar)
 
     def round(self, freq="month"):
-        return MarsDateArray([v.round(freq) if v is not None else None for v in self._data])
+        return MarsDateArray([v.round(freq) if v is not None else None for v in self],
+                             calendar=self._calendar)
 
-    def diff(self, periods: int = 1, sort_before: bool = False):
+    def to_period(self, freq: str = "month") -> "MarsPeriodArray":
+        """The month, quarter or year containing each date, as a MarsPeriodArray."""
+        return MarsPeriodArray.from_dates(self, freq)
 
-        from mars_dtc.mars_dtc import MarsTimedelta
+    def diff(self, periods: int = 1, sort_before: bool = False):
 
+        ordinals = self._ordinals
         if sort_before:
-
-            valid = [v for v in self._data if v is not None]
-            valid_sorted = sorted(valid, key=lambda x: x.to_ordinal())
-            arr = list(valid_sorted)
-        else:
-            arr = list(self._data)
+            ordinals = np.sort(ordinals[~self.isna()])
 
         result = []
-        for i in range(len(arr)):
-            if i < periods or arr[i] is None or arr[i - periods] is None:
+        for i in range(len(ordinals)):
+            if (i < periods or ordinals[i] == _NA_ORDINAL
+                    or ordinals[i - periods] == _NA_ORDINAL):
                 result.append(None)
             else:
-                diff_val = arr[i].to_ordinal() - arr[i - periods].to_ordinal()
+                diff_val = int(ordinals[i] - ordinals[i - periods])
                 result.append(MarsTimedelta(diff_val))
         return np.array(result, dtype=object)
 
 
+def _float_ordinals(values):
+    """Replace MarsDateArrays in values (and nested lists/tuples) with float ordinals."""
+    return [
+        v.to_numpy() if isinstance(v, MarsDateArray)
+        else type(v)(_float_ordinals(v)) if isinstance(v, (list, tuple)) else v
+        for v in values
+    ]
+
+
+_UFUNC_DUNDERS = {
+    np.add: "__add__", np.subtract: "__sub__",
+    np.equal: "__eq__", np.not_equal: "__ne__",
+    np.less: "__lt__", np.less_equal: "__le__",
+    np.greater: "__gt__", np.greater_equal: "__ge__",
+}
+# Ufuncs that can run with the MarsDateArray as the right operand
+_UFUNC_FLIPPED = {
+    np.add: np.add, np.equal: np.equal, np.not_equal: np.not_equal,
+    np.less: np.greater, np.less_equal: np.greater_equal,
+    np.greater: np.less, np.greater_equal: np.less_equal,
+}
+_UFUNC_REDUCTIONS = {np.maximum: "max", np.fmax: "max", np.minimum: "min", np.fmin: "min"}
+
+# NumPy functions run on the ordinal buffer by __array_function__
+_HANDLED_FUNCTIONS = {}
+
+
+def _implements(*funcs):
+    def register(implementation):
+        for func in funcs:
+            _HANDLED_FUNCTIONS[func] = implementation
+        return implementation
+    return register
+
+
+@_implements(np.sort)
+def _sort(a, axis=-1, kind=None, order=None):
+    na = a.isna()
+    ordinals = np.sort(a._ordinals[~na], kind=kind)
+    if na.any():
+        ordinals = np.concatenate([ordinals, np.full(int(na.sum()), _NA_ORDINAL)])
+    return MarsDateArray._simple_new(ordinals, a._calendar)
+
+
+@_implements(np.argsort)
+def _argsort(a, axis=-1, kind=None, order=None):
+    return np.argsort(a._search_keys(), kind=kind)
+
+
+@_implements(np.searchsorted)
+def _searchsorted(a, v, side="left", sorter=None):
+    return a.searchsorted(v, side=side, sorter=sorter)
+
+
+@_implements(np.unique)
+def _unique(ar, return_index=False, return_inverse=False, return_counts=False, **kwargs):
+    result = np.unique(ar._ordinals, return_index=return_index,
+                       return_inverse=return_inverse, return_counts=return_counts)
+    result = list(result) if isinstance(result, tuple) else [result]
+    if len(result[0]) and result[0][0] == _NA_ORDINAL:
+        # The sentinel sorts first; move the missing value last, like NaT
+        result = [np.roll(r, -1) for r in result[:1 + return_index]] \
+            + ([(result[1 + return_index] - 1) % len(result[0])] if return_inverse else []) \
+            + ([np.roll(result[-1], -1)] if return_counts else [])
+    result[0] = MarsDateArray._simple_new(result[0], ar._calendar)
+    return result[0] if len(result) == 1 else tuple(result)
+
+
+@_implements(np.diff)
+def _diff(a, n=1, axis=-1, **kwargs):
+    if n != 1 or kwargs:
+        raise TypeError("np.diff on a MarsDateArray supports only n=1 without prepend/append")
+    return a[1:] - a[:-1]
+
+
+@_implements(np.concatenate)
+def _concatenate(arrays, axis=0, **kwargs):
+    arrays = list(arrays)
+    if all(isinstance(arr, MarsDateArray) for arr in arrays) and axis == 0 and not kwargs:
+        return MarsDateArray._concat_same_type(arrays)
+    return np.concatenate(_float_ordinals(arrays), axis=axis, **kwargs)
+
+
+@_implements(np.min, np.amin)
+def _min(a, axis=None, **kwargs):
+    return a._reduce("min")
+
+
+@_implements(np.max, np.amax)
+def _max(a, axis=None, **kwargs):
+    return a._reduce("max")
+
+
+@register_extension_dtype
+class MarsPeriodDtype(ExtensionDtype):
+    """Dtype of a MarsPeriodArray: 'marsperiod[month]', '[quarter]' or '[year]'."""
+    type = MarsPeriod
+    kind = "O"
+    na_value = None
+    _metadata = ("freq",)
+    _match = re.compile(r"^marsperiod(?:\[(\w+)\])?$")
+
+    def __init__(self, freq: str = "month"):
+        if freq not in _PERIOD_FREQS:
+            raise ValueError(f"freq must be one of: {', '.join(_PERIOD_FREQS)}")
+        self.freq = freq
+
+    @property
+    def name(self):
+        return f"marsperiod[{self.freq}]"
+
+    @classmethod
+    def construct_from_string(cls, string):
+        if not isinstance(string, str):
+            raise TypeError(f"'construct_from_string' expects a string, got {type(string)}")
+        match = cls._match.match(string)
+        if match is None or (match.group(1) or "month") not in _PERIOD_FREQS:
+            raise TypeError(f"Cannot construct a 'MarsPeriodDtype' from '{string}'")
+        return cls(match.group(1) or "month")
+
+    @classmethod
+    def construct_array_type(cls):
+        return MarsPeriodArray
+
+    @property
+    def _is_numeric(self):
+        return False
+
+    @property
+    def _is_boolean(self):
+        return False
+
+
+class MarsPeriodArray(ExtensionArray):
+    """
+    Array of MarsPeriod values of one freq, stored as an int64 buffer of
+    period codes with ``_NA_ORDINAL`` marking missing entries, so grouping
+    and factorizing by period are integer operations.
+    """
+
+    def __init__(self, values, freq: str = None, calendar=None):
+        if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+            codes = values.astype("int64", copy=True)
+            freq, cal = freq or "month", calendar or DarianCalendar()
+        else:
+            if not hasattr(values, "__len__"):
+                values = list(values)
+            first = next((v for v in values if isinstance(v, MarsPeriod)), None)
+            freq = freq or (first.freq if first else "month")
+            cal = calendar or (first.calendar if first else None) or DarianCalendar()
+            codes = np.empty(len(values), dtype="int64")
+            for i, v in enumerate(values):
+                if _is_na(v):
+                    codes[i] = _NA_ORDINAL
+                elif isinstance(v, MarsPeriod):
+                    if v.freq != freq or v.calendar.__class__ != cal.__class__:
+                        raise TypeError("Cannot mix freqs or calendars in a MarsPeriodArray")
+                    codes[i] = v.code
+                elif isinstance(v, (int, np.integer)):
+                    codes[i] = v
+                else:
+                    raise TypeError(f"Invalid value type {type(v)} in MarsPeriodArray: {v}")
+        _periods_per_year(freq, cal)
+        self._codes, self._freq, self._calendar = codes, freq, cal
+
+    @classmethod
+    def _simple_new(cls, codes, freq, calendar):
+        """Wrap an int64 code buffer without validation or copying."""
+        result = cls.__new__(cls)
+        result._codes, result._freq, result._calendar = codes, freq, calendar
+        return result
+
+    @classmethod
+    def from_dates(cls, dates, freq: str = "month") -> "MarsPeriodArray":
+        """
+        Assign each date to the month, quarter or year containing it, in one
+        vectorized pass over the ordinals (missing dates stay missing).
+        """
+        if not isinstance(dates, MarsDateArray):
+            dates = MarsDateArray._from_sequence(dates)
+        cal = dates._calendar
+        per_year = _periods_per_year(freq, cal)
+        na = dates.isna()
+        years, months, _ = cal.from_ordinals(np.where(na, 0, dates._ordinals))
+        codes = years * per_year + (months - 1) // (len(cal.month_lengths(0)) // per_year)
+        codes[na] = _NA_ORDINAL
+        return cls._simple_new(codes, freq, cal)
+
+    @classmethod
+    def _from_sequence(cls, scalars, dtype=None, copy=False):
+        freq = dtype.freq if isinstance(dtype, MarsPeriodDtype) else None
+        if isinstance(scalars, MarsPeriodArray) and freq in (None, scalars._freq):
+            return scalars.copy() if copy else scalars
+        if isinstance(scalars, MarsDateArray):
+            return cls.from_dates(scalars, freq or "month")
+        return cls(scalars, freq=freq)
+
+    @classmethod
+    def _from_factorized(cls, uniques, original):
+        return cls._simple_new(uniques, original._freq, original._calendar)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        first = to_concat[0]
+        if any(arr._freq != first._freq or arr._calendar.__class__ != first._calendar.__class__
+               for arr in to_concat):
+            raise TypeError("Cannot concatenate MarsPeriodArrays of different freq or calendar")
+        return cls._simple_new(np.concatenate([arr._codes for arr in to_concat]),
+                               first._freq, first._calendar)
+
+    def __reduce__(self):
+        return (_restore_period_array,
+                (np.ascontiguousarray(self._codes), self._freq, _calendar_id(self._calendar)))
+
+    @property
+    def dtype(self):
+        return MarsPeriodDtype(self._freq)
+
+    @property
+    def nbytes(self):
+        return self._codes.nbytes
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __getitem__(self, item):
+        if is_integer(item):
+            code = self._codes[item]
+            if code == _NA_ORDINAL:
+                return None
+            return MarsPeriod.from_code(int(code), self._freq, calendar=self._calendar)
+        item = check_array_indexer(self, item)
+        return self._simple_new(self._codes[item], self._freq, self._calendar)
+
+    def _box_values(self):
+        """Return an object ndarray of MarsPeriod (None where missing)."""
+        out = np.empty(len(self), dtype=object)
+        valid = ~self.isna()
+        boxed = {code: MarsPeriod.from_code(code, self._freq, calendar=self._calendar)
+                 for code in np.unique(self._codes[valid]).tolist()}
+        out[valid] = [boxed[code] for code in self._codes[valid].tolist()]
+        return out
+
+    def __iter__(self):
+        return iter(self._box_values())
+
+    def __repr__(self):
+        return f"MarsPeriodArray({self._box_values()}, freq='{self._freq}')"
+
+    def _formatter(self, boxed=False):
+        return lambda x: "NaT" if x is None else str(x)
+
+    def isna(self):
+        return self._codes == _NA_ORDINAL
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        if allow_fill:
+            fill_value = _NA_ORDINAL if _is_na(fill_value) else fill_value.code
+        result = take(self._codes, indices, allow_fill=allow_fill, fill_value=fill_value)
+        return self._simple_new(result, self._freq, self._calendar)
+
+    def copy(self):
+        return self._simple_new(self._codes.copy(), self._freq, self._calendar)
+
+    def _values_for_factorize(self):
+        return self._codes, _NA_ORDINAL
+
+    def _values_for_argsort(self):
+        return self._codes
+
+    def value_counts(self, dropna: bool = True) -> pd.Series:
+        """Count of each period, counted on the integer codes."""
+        codes = self._codes if not dropna else self._codes[~self.isna()]
+        uniques, counts = np.unique(codes, return_counts=True)
+        index = pd.Index(self._simple_new(uniques, self._freq, self._calendar))
+        return pd.Series(counts, index=index, name="count")
+
+    def astype(self, dtype, copy=True):
+        dtype = pandas_dtype(dtype)
+        if isinstance(dtype, MarsPeriodDtype) and dtype.freq == self._freq:
+            return self.copy() if copy else self
+        if dtype == object:
+            return self._box_values()
+        if is_string_dtype(dtype):
+            strings = np.array(["NaT" if p is None else str(p) for p in self._box_values()],
+                               dtype=object)
+            if isinstance(dtype, ExtensionDtype):
+                return dtype.construct_array_type()._from_sequence(strings, dtype=dtype)
+            return strings.astype(dtype)
+        return super().astype(dtype, copy=copy)
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None or np.dtype(dtype) == object:
+            return self._box_values()
+        dtype = np.dtype(dtype)
+        na = self.isna()
+        if not na.any():
+            return self._codes.astype(dtype, copy=bool(copy))
+        if dtype.kind != "f":
+            raise ValueError(
+                f"Cannot convert a MarsPeriodArray with missing values to {dtype}; "
+                "use a float dtype")
+        codes = self._codes.astype(dtype)
+        codes[na] = np.nan
+        return codes
+
+    def _reduce(self, name, skipna=True, **kwargs):
+        valid = self._codes[~self.isna()]
+        if name not in ("min", "max"):
+            raise TypeError(f"Reduction '{name}' not supported for MarsPeriodArray")
+        if not len(valid):
+            return None
+        code = valid.min() if name == "min" else valid.max()
+        return MarsPeriod.from_code(int(code), self._freq, calendar=self._calendar)
+
+    # ----- Comparisons and arithmetic -----
+
+    def _other_codes(self, other):
+        """(codes, missing mask) of a MarsPeriodArray or MarsPeriod operand."""
+        if isinstance(other, MarsPeriodArray):
+            freq, cal, codes, na = other._freq, other._calendar, other._codes, other.isna()
+        elif isinstance(other, MarsPeriod):
+            freq, cal, codes, na = other.freq, other.calendar, other.code, False
+        else:
+            raise TypeError(f"Cannot compare MarsPeriodArray with {type(other)}")
+        if freq != self._freq or cal.__class__ != self._calendar.__class__:
+            raise TypeError("Cannot combine MarsPeriods of different freq or calendar")
+        return codes, na
+
+    def __eq__(self, other):
+        if not isinstance(other, (MarsPeriodArray, MarsPeriod)):
+            return NotImplemented
+        try:
+            codes, na = self._other_codes(other)
+        except TypeError:
+            return np.zeros(len(self), dtype=bool)
+        return (self._codes == codes) & ~(self.isna() | na)
+
+    def _compare_op(self, other, op):
+        codes, na = self._other_codes(other)
+        return op(self._codes, codes) & ~(self.isna() | na)
+
+    def __ge__(self, other):
+        return self._compare_op(other, operator.ge)
+
+    def __le__(self, other):
+        return self._compare_op(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare_op(other, operator.gt)
+
+    def __lt__(self, other):
+        return self._compare_op(other, operator.lt)
+
+    def __add__(self, other):
+        if isinstance(other, bool) or not (
+                is_integer(other) or (isinstance(other, np.ndarray) and other.dtype.kind in "iu")):
+            return NotImplemented
+        na = self.isna()
+        shifted = self._codes + other
+        shifted[na] = _NA_ORDINAL
+        return self._simple_new(shifted, self._freq, self._calendar)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        if isinstance(other, (MarsPeriodArray, MarsPeriod)):
+            # Number of periods between, as a nullable integer array
+            codes, na = self._other_codes(other)
+            missing = self.isna() | na
+            return pd.arrays.IntegerArray(np.where(missing, 0, self._codes - codes), missing)
+        if is_integer(other) or isinstance(other, np.ndarray):
+            return self.__add__(-other)
+        return NotImplemented
+
+    # ----- Period bounds -----
+
+    def _start_ordinals(self, codes):
+        cal = self._calendar
+        per_year = _periods_per_year(self._freq, cal)
+        years, index = np.divmod(codes, per_year)
+        months = index * (len(cal.month_lengths(0)) // per_year) + 1
+        return cal.to_ordinals(years, months, np.ones_like(years))
+
+    def _bound(self, offset):
+        na = self.isna()
+        codes = np.where(na, 0, self._codes)
+        ordinals = self._start_ordinals(codes + offset) - offset
+        ordinals[na] = _NA_ORDINAL
+        return MarsDateArray._simple_new(ordinals, self._calendar)
+
+    def start_dates(self) -> MarsDateArray:
+        """First sol of each period."""
+        return self._bound(0)
+
+    def end_dates(self) -> MarsDateArray:
+        """Last sol of each period."""
+        return self._bound(1)
+
+    def n_sols(self) -> pd.arrays.IntegerArray:
+        """Length of each period in sols."""
+        na = self.isna()
+        codes = np.where(na, 0, self._codes)
+        return pd.arrays.IntegerArray(
+            self._start_ordinals(codes + 1) - self._start_ordinals(codes), na)
+
+
 # Let the dtype name resolve to the class object for construct_array_type
 globals()["MarsDateArray"] = MarsDateArray
 
+for _method in ("__init__", "from_values", "from_ordinals", "from_components", "from_strings",
+                "strptime", "_box_values", "strftime", "isoformat", "astype"):
+    instrumentation.register(MarsDateArray, _method)
+instrumentation.register(MarsPeriodArray, "from_dates")
+
+# Register the Arrow extension type when pyarrow is available, so files
+# written with it read back as marsdate
+try:
+    import mars_dtc.arrow_ext  # noqa: F401
+except ImportError:
+    pass
@@ -4,54 +4,299 @@ import matplotlib.ticker as mticker
 import numpy as np
 import pandas as pd
 
+from mars_dtc.darian_calendar import DarianCalendar
 from mars_dtc.mars_dtc import MarsDate
 from mars_dtc.pandas_ext import MarsDateArray
 
 
 # ---------------- Classes and functions ----------------
+class MarsAutoDateLocator(mticker.Locator):
+    """
+    Place ticks on sol, week, month or year boundaries of the calendar,
+    choosing the finest unit and step that keeps at most maxticks in view.
+    """
+
+    SOL_STEPS = (1, 2, 3)
+    WEEK_STEPS = (1, 2)
+    MONTH_STEPS = (1, 2, 3, 4, 6, 12)
+    YEAR_STEPS = (1, 2, 5)
+
+    def __init__(self, calendar=None, maxticks=8):
+        self.calendar = calendar or DarianCalendar()
+        self.maxticks = maxticks
+        self.unit = "sol"
+
+    def __call__(self):
+        vmin, vmax = self.axis.get_view_interval()
+        return self.tick_values(vmin, vmax)
+
+    def _choose(self, span):
+        cal = self.calendar
+        n_months = len(cal.month_lengths(0))
+        year_sols = (int(cal.to_ordinals([400], [1], [1])[0])
+                     - int(cal.to_ordinals([0], [1], [1])[0])) / 400
+        candidates = (
+            [("sol", n, n) for n in self.SOL_STEPS]
+            + [("week", n, 7 * n) for n in self.WEEK_STEPS]
+            + [("month", n, n * year_sols / n_months) for n in self.MONTH_STEPS]
+        )
+        for unit, step, sols in candidates:
+            if span / sols <= self.maxticks:
+                return unit, step
+        # Years in 1-2-5 steps of increasing magnitude
+        scale = 1
+        while True:
+            for n in self.YEAR_STEPS:
+                if span / (n * scale * year_sols) <= self.maxticks:
+                    return "year", n * scale
+            scale *= 10
+
+    def tick_values(self, vmin, vmax):
+        if not (np.isfinite(vmin) and np.isfinite(vmax)):
+            return []
+        if vmax < vmin:
+            vmin, vmax = vmax, vmin
+
+        unit, step = self._choose(vmax - vmin)
+        self.unit = unit
+        lo, hi = int(np.floor(vmin)), int(np.ceil(vmax))
+
+        if unit == "sol":
+            ticks = np.arange(-(-lo // step) * step, hi + 1, step)
+        elif unit == "week":
+            # Weeks start on Sol Solis, where ordinal % 7 == 0
+            ticks = np.arange(-(-lo // (7 * step)) * 7 * step, hi + 1, 7 * step)
+        else:
+            cal = self.calendar
+            years, _, _ = cal.from_ordinals([lo, hi])
+            if unit == "month":
+                n_months = len(cal.month_lengths(0))
+                start = years[0] * n_months
+                index = np.arange(start - start % step, (years[1] + 1) * n_months, step)
+                ticks = cal.to_ordinals(index // n_months, index % n_months + 1,
+                                        np.ones_like(index))
+            else:
+                index = np.arange(years[0] - years[0] % step, years[1] + 1, step)
+                ones = np.ones_like(index)
+                ticks = cal.to_ordinals(index, ones, ones)
+
+        ticks = ticks[(ticks >= vmin) & (ticks <= vmax)]
+        return self.raise_if_exceeds(ticks.astype("float64"))
+
+
+class MarsAutoDateFormatter(mticker.Formatter):
+    """
+    Label ticks with a format matching the unit picked by the locator.
+    Labels are cached per (ordinal, format), so redraws while panning only
+    format ticks that were not seen before.
+    """
+
+    FORMATS = {
+        "sol": "%Y/%m/%d",
+        "week": "%Y/%m/%d",
+        "month": "%Y/%m",
+        "year": "%Y",
+    }
+    MAX_CACHED = 4096
+
+    def __init__(self, locator=None, calendar=None, formats=None):
+        self.locator = locator
+        self.calendar = calendar or getattr(locator, "calendar", None) or DarianCalendar()
+        self.formats = {**self.FORMATS, **(formats or {})}
+        self._labels = {}
+
+    def __call__(self, x, pos=None):
+        if not np.isfinite(x):
+            return "NaT"
+        fmt = self.formats[getattr(self.locator, "unit", "sol")]
+        key = (int(np.floor(x)), fmt)
+        label = self._labels.get(key)
+        if label is None:
+            if len(self._labels) >= self.MAX_CACHED:
+                self._labels.clear()
+            label = self._labels[key] = MarsDate.from_ordinal(
+                key[0], calendar=self.calendar).format(fmt)
+        return label
+
+
 class MarsDateConverter(munits.ConversionInterface):
     @staticmethod
     def convert(value, unit, axis):
         if isinstance(value, MarsDate):
-            return value.to_ordinal()
-        if isinstance(value, MarsDateArray):
-            return value._values_for_plotting()
-        if isinstance(value, (list, np.ndarray)):
-            return [np.nan if v is None else (v.to_ordinal() if isinstance(v, MarsDate) else v) for v in value]
+            return value.to_ordinal_float()
+        array = getattr(value, "array", value)
+        if isinstance(array, MarsDateArray):
+            return array._values_for_plotting()
+        if isinstance(value, np.ndarray) and value.dtype.kind in "iuf":
+            return value
+        if isinstance(value, (list, tuple, np.ndarray)):
+            return np.fromiter(
+                (np.nan if v is None else (v.to_ordinal_float() if isinstance(v, MarsDate) else v)
+                 for v in value),
+                dtype="float64",
+                count=len(value),
+            )
         return value
 
     @staticmethod
     def axisinfo(unit, axis):
-        majloc = mticker.MaxNLocator(integer=True)
-        def fmt(x, pos):
-            if np.isnan(x):
-                return "NaT"
-            return str(MarsDate.from_ordinal(int(x)))
-        majfmt = mticker.FuncFormatter(fmt)
+        majloc = MarsAutoDateLocator(calendar=unit)
+        majfmt = MarsAutoDateFormatter(majloc)
         return munits.AxisInfo(majloc=majloc, majfmt=majfmt)
 
     @staticmethod
     def default_units(x, axis):
+        # The calendar doubles as the axis unit
+        if isinstance(x, MarsDate):
+            return x.calendar
+        array = getattr(x, "array", x)
+        if isinstance(array, MarsDateArray):
+            return array._calendar
         return None
 
 munits.registry[MarsDate] = MarsDateConverter()
 munits.registry[MarsDateArray] = MarsDateConverter()
 
 
+# ---------------- Downsampling ----------------
+def _minmax_indices(x, y, width):
+    """
+    Indices of the lowest and highest y in each of `width` equal-width x
+    buckets (one per pixel column), plus both endpoints. x must be sorted.
+    """
+    n = len(x)
+    if n <= 4 * width:
+        return np.arange(n)
+
+    edges = np.linspace(x[0], x[-1], width + 1)[1:-1]
+    starts = np.unique(np.r_[0, np.searchsorted(x, edges, side="left")])
+    starts = starts[starts < n]
+    segment = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, n]))
+
+    picks = [np.array([0, n - 1])]
+    for reduce in (np.minimum, np.maximum):
+        extreme = reduce.reduceat(y, starts)
+        hits = np.flatnonzero(y == extreme[segment])
+        # First hit in each bucket; hits and segments are both ascending
+        first = np.flatnonzero(np.r_[True, np.diff(segment[hits]) != 0])
+        picks.append(hits[first])
+    return np.unique(np.concatenate(picks))
+
+
+def _lttb_indices(x, y, width):
+    """
+    Largest-Triangle-Three-Buckets: keep 2 * width points that preserve the
+    visual shape of the series. x must be sorted.
+    """
+    n = len(x)
+    n_out = 2 * width
+    if n <= n_out:
+        return np.arange(n)
+
+    # Interior points split into n_out - 2 buckets; endpoints are always kept
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[:-1], edges[:-1]) / counts
+    mean_y = np.add.reduceat(y[:-1], edges[:-1]) / counts
+
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 1 < n_out - 2:
+            cx, cy = mean_x[i + 1], mean_y[i + 1]
+        else:
+            cx, cy = x[-1], y[-1]
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+    return out
+
+
+_DOWNSAMPLERS = {"minmax": _minmax_indices, "lttb": _lttb_indices}
+
+
+def _plot_downsampled(ax, x, y, method, **kwargs):
+    """
+    Plot only the points needed at the axes' pixel width, and re-decimate the
+    visible range whenever the x-limits change.
+    """
+    if method not in _DOWNSAMPLERS:
+        raise ValueError(
+            f"downsample must be one of: {', '.join(_DOWNSAMPLERS)}")
+    pick = _DOWNSAMPLERS[method]
+
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    finite = np.isfinite(x) & np.isfinite(y)
+    order = np.argsort(x[finite], kind="stable")
+    x, y = x[finite][order], y[finite][order]
+
+    def visible(x0, x1):
+        # Keep one point beyond each edge so the line runs off the axes
+        lo = max(int(np.searchsorted(x, x0, side="left")) - 1, 0)
+        hi = min(int(np.searchsorted(x, x1, side="right")) + 1, len(x))
+        width = max(int(ax.bbox.width), 100)
+        idx = lo + pick(x[lo:hi], y[lo:hi], width)
+        return x[idx], y[idx]
+
+    line, = ax.plot(*(visible(x[0], x[-1]) if len(x) else ([], [])), **kwargs)
+
+    def on_xlim_changed(axes):
+        line.set_data(*visible(*sorted(axes.get_xlim())))
+
+    ax.callbacks.connect("xlim_changed", on_xlim_changed)
+    return line
+
+
+# DataFrame.plot keywords that configure the axes rather than the lines
+_AXES_KWARGS = ("title", "grid", "legend", "xlabel", "ylabel", "xlim", "ylim")
+
+
+def _new_axes(kwargs):
+    import matplotlib.pyplot as plt
+    ax = kwargs.pop("ax", None)
+    figsize = kwargs.pop("figsize", None)
+    if ax is None:
+        _, ax = plt.subplots(figsize=figsize)
+    return ax
+
+
+def _apply_axes_kwargs(ax, options):
+    if options.get("title"):
+        ax.set_title(options["title"])
+    if options.get("grid"):
+        ax.grid(True)
+    if options.get("legend"):
+        ax.legend()
+    if options.get("xlabel") is not None:
+        ax.set_xlabel(options["xlabel"])
+    if options.get("ylabel") is not None:
+        ax.set_ylabel(options["ylabel"])
+    if options.get("xlim") is not None:
+        ax.set_xlim(options["xlim"])
+    if options.get("ylim") is not None:
+        ax.set_ylim(options["ylim"])
 
 
 def plot(data, kind=None, **kwargs):
+    """
+    Pandas plotting backend entry point. For a marsdate x column, pass
+    downsample="minmax" or "lttb" to draw large series decimated to the
+    axes' pixel width; the visible range is re-decimated on zoom and pan.
+    """
 
-    xcol = kwargs.get("x", None)
+    xcol = kwargs.pop("x", None)
+    downsample = kwargs.pop("downsample", None)
     if xcol is not None:
         ser = data[xcol]
         is_mars = getattr(getattr(ser, "dtype", None), "name", "") == "marsdate"
         if is_mars:
-            import matplotlib.pyplot as plt
-            ax = kwargs.pop("ax", None)
-            if ax is None:
-                _, ax = plt.subplots()
-
+            ax = _new_axes(kwargs)
+            # Defaults of this branch: labelled x axis, legend and grid
+            options = {"grid": True, "legend": True, "xlabel": str(xcol)}
+            options.update((k, kwargs.pop(k)) for k in _AXES_KWARGS if k in kwargs)
 
             x_numeric = ser.to_numpy()
             yarg = kwargs.pop("y", None)
@@ -62,33 +307,29 @@ def plot(data, kind=None, **kwargs):
             )
 
             for col in ycols:
-                ax.plot(x_numeric, data[col].to_numpy(), label=str(col), **kwargs)
-
-            from matplotlib.ticker import FuncFormatter
-            ax.xaxis.set_major_formatter(
-                FuncFormatter(
-                    lambda x, pos: "NaT"
-                    if np.isnan(x)
-                    else str(mdt.MarsDate.from_ordinal(int(x)))
-                )
-            )
-            ax.set_xlabel(str(xcol))
-            ax.legend()
-            ax.grid(True)
+                if downsample:
+                    _plot_downsampled(ax, x_numeric, data[col].to_numpy(),
+                                      downsample, label=str(col), **kwargs)
+                else:
+                    ax.plot(x_numeric, data[col].to_numpy(), label=str(col), **kwargs)
+
+            locator = MarsAutoDateLocator(calendar=ser.array._calendar)
+            ax.xaxis.set_major_locator(locator)
+            ax.xaxis.set_major_formatter(MarsAutoDateFormatter(locator))
+            _apply_axes_kwargs(ax, options)
             return ax
 
+    if downsample:
+        raise ValueError("downsample requires a marsdate x column")
+
     # fallback: call Matplotlib manually
-    import matplotlib.pyplot as plt
-    ax = kwargs.pop("ax", None)
-    if ax is None:
-        _, ax = plt.subplots()
+    ax = _new_axes(kwargs)
 
     # Handle common pandas-style kwargs
-    title = kwargs.pop("title", None)
-    grid = kwargs.pop("grid", False)
+    options = {k: kwargs.pop(k) for k in _AXES_KWARGS if k in kwargs}
 
     y = kwargs.pop("y", None)
-    x = kwargs.pop("x", None)
+    x = xcol
 
     if x is not None and y is not None:
         ax.plot(data[x], data[y], **kwargs)
@@ -97,22 +338,15 @@ def plot(data, kind=None, **kwargs):
     else:
         ax.plot(data, **kwargs)
 
-    if title:
-        ax.set_title(title)
-    if grid:
-        ax.grid(True)
-
+    _apply_axes_kwargs(ax, options)
     return ax
 
 
-def _enable_backend():
-    try:
-        # Only set if not already set to something else custom
-        if pd.options.plotting.backend in (None, "matplotlib", ""):
-            pd.options.plotting.backend = __name__
-    except Exception:
-
-        pass
-
-_enable_backend()
-
+def enable():
+    """
+    Make mars_dtc the pandas plotting backend, so DataFrame.plot() draws
+    marsdate columns with calendar-aware ticks. Same as setting
+    pd.options.plotting.backend = "mars_dtc.plotting"; nothing changes the
+    option until one of them is called.
+    """
+    pd.options.plotting.backend = __name__
@@ -0,0 +1,323 @@
+# ---------------- Imports ----------------
+import json
+import re
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+from mars_dtc.base_calendar import _calendar_from_name
+from mars_dtc.darian_calendar import DarianCalendar
+from mars_dtc.mars_dtc import MarsDate, MarsDateTime, MarsTimedelta, _yaml_codecs
+from mars_dtc.pandas_ext import MarsDateArray, _NA_ORDINAL
+from mars_dtc.timeseries import _datetimes
+
+
+# ---------------- Classes and functions ----------------
+_ISO_DATE = "%Y-%m-%d"
+_ISO_DATETIME = "%Y-%m-%dT%H:%M:%S"
+_REPRESENTATIONS = ("iso", "ordinal", "dict")
+# Field name of the one-field record dtype that save_npy writes, so the
+# kind and calendar live in the standard .npy header
+_NPY_FIELD = re.compile(r"^(marsdate|marsdatetime)\[(\w+)\]$")
+
+
+class MarsJSONEncoder(json.JSONEncoder):
+    """
+    JSON encoder for Mars types, used as json.dumps(obj, cls=MarsJSONEncoder).
+    Dates and datetimes become ISO strings, timedeltas their sols, and a
+    MarsDateArray a list of ISO strings.
+    """
+
+    def default(self, o):
+        if isinstance(o, MarsDate):
+            return o.isoformat()
+        if isinstance(o, MarsTimedelta):
+            return o.sols
+        if isinstance(o, MarsDateArray):
+            return o.isoformat().tolist()
+        return super().default(o)
+
+
+def mars_object_hook(data: dict):
+    """json.loads object_hook that turns to_dict() payloads back into dates."""
+    if {"year", "month", "sol"} <= data.keys():
+        cls = MarsDateTime if "hour" in data else MarsDate
+        return cls.from_dict(data)
+    return data
+
+
+def _check_representation(representation):
+    if representation not in _REPRESENTATIONS:
+        raise ValueError(
+            f"representation must be one of: {', '.join(_REPRESENTATIONS)}")
+
+
+def _encode_one(d, representation):
+    if d is None:
+        return None
+    if representation == "iso":
+        return d.isoformat()
+    if representation == "ordinal":
+        return d.to_ordinal_float() if isinstance(d, MarsDateTime) else d.to_ordinal()
+    return d.to_dict()
+
+
+def _decode_one(v, calendar):
+    if v is None:
+        return None
+    if isinstance(v, dict):
+        cls = MarsDateTime if "hour" in v else MarsDate
+        return cls.from_dict(v, calendar=calendar)
+    if isinstance(v, str):
+        if "T" in v:
+            return MarsDateTime.strptime(v, _ISO_DATETIME, calendar=calendar)
+        return MarsDate.strptime(v, _ISO_DATE, calendar=calendar)
+    if isinstance(v, int):
+        return MarsDate.from_ordinal(v, calendar=calendar)
+    if isinstance(v, float):
+        return MarsDateTime.from_ordinal_float(v, calendar=calendar)
+    raise TypeError(f"Cannot decode {type(v)} as a Mars date: {v}")
+
+
+def encode_dates(dates, representation: str = "iso") -> list:
+    """
+    Encode MarsDate/MarsDateTime values (or a MarsDateArray) as a compact
+    list of ISO strings, ordinals (floats for datetimes) or to_dict()
+    payloads. Missing values become None. A MarsDateArray is encoded from
+    its ordinal buffer without boxing.
+    """
+    _check_representation(representation)
+    if not isinstance(dates, MarsDateArray):
+        return [_encode_one(d, representation) for d in dates]
+
+    if representation == "iso":
+        return dates.isoformat().tolist()
+    if representation == "ordinal":
+        return [None if o == _NA_ORDINAL else o for o in dates._ordinals.tolist()]
+
+    cal = dates._calendar
+    name = cal.__class__.__name__
+    na = dates.isna()
+    years, months, sols = cal.from_ordinals(dates._ordinals[~na])
+    encoded = iter(zip(years.tolist(), months.tolist(), sols.tolist()))
+    return [
+        None if missing else dict(zip(("year", "month", "sol"), next(encoded)), calendar=name)
+        for missing in na.tolist()
+    ]
+
+
+def decode_dates(values, calendar=None):
+    """
+    Inverse of encode_dates. Dates come back as a MarsDateArray: lists of
+    ISO strings are parsed in bulk (each distinct string once) and ordinals
+    go straight into the buffer. Values that include datetimes come back as
+    an object array of MarsDate/MarsDateTime (None where missing), as
+    load_npy returns them.
+    """
+    cal = calendar or DarianCalendar()
+    values = list(values)
+    if all(v is None or (isinstance(v, str) and "T" not in v) for v in values):
+        return MarsDateArray.strptime(values, _ISO_DATE, calendar=cal)
+    decoded = [v if v is None or isinstance(v, int) else _decode_one(v, cal) for v in values]
+    if any(isinstance(v, MarsDateTime) for v in decoded):
+        out = np.empty(len(decoded), dtype=object)
+        out[:] = [_decode_one(v, cal) if isinstance(v, int) else v for v in decoded]
+        return out
+    return MarsDateArray(decoded, calendar=cal)
+
+
+def _ndjson_lines(values, representation):
+    if representation == "dict":
+        return "".join(json.dumps(v) + "\n" for v in values)
+    # ISO strings and ordinals never need JSON escaping, so skip json.dumps
+    return "".join(
+        "null\n" if v is None else f'"{v}"\n' if isinstance(v, str) else f"{v}\n"
+        for v in values
+    )
+
+
+def write_ndjson(dates, fp, representation: str = "iso", chunksize: int = 65536) -> int:
+    """
+    Stream dates to a text file object as JSON Lines (one value per line),
+    encoding and writing chunksize lines at a time so memory stays bounded.
+    Returns the number of lines written.
+    """
+    _check_representation(representation)
+    written = 0
+
+    if isinstance(dates, MarsDateArray):
+        chunks = (
+            encode_dates(dates[start:start + chunksize], representation)
+            for start in range(0, len(dates), chunksize)
+        )
+    else:
+        it = iter(dates)
+        chunks = iter(
+            lambda: [_encode_one(d, representation) for d in islice(it, chunksize)], []
+        )
+
+    for chunk in chunks:
+        fp.write(_ndjson_lines(chunk, representation))
+        written += len(chunk)
+    return written
+
+
+def read_ndjson(fp, calendar=None):
+    """
+    Lazily read JSON Lines written by write_ndjson, yielding MarsDate,
+    MarsDateTime or None per line. Blank lines are skipped.
+    """
+    cal = calendar or DarianCalendar()
+    for line in fp:
+        line = line.strip()
+        if line:
+            yield _decode_one(json.loads(line), cal)
+
+
+def dump_yaml(dates, stream=None, representation: str = "iso"):
+    """Dump dates as a YAML list, using libyaml's C dumper when available."""
+    yaml, _, dumper = _yaml_codecs()
+    return yaml.dump(encode_dates(dates, representation), stream, Dumper=dumper)
+
+
+def load_yaml(stream, calendar=None):
+    """
+    Load a YAML list written by dump_yaml, using libyaml's C loader when
+    available. Returns what decode_dates does.
+    """
+    yaml, loader, _ = _yaml_codecs()
+    return decode_dates(yaml.load(stream, Loader=loader), calendar=calendar)
+
+
+def _convert_csv_chunk(chunk, date_columns, component_columns, calendar):
+    try:
+        for col in date_columns:
+            chunk[col] = MarsDateArray.from_strings(chunk[col].to_numpy(dtype=object), calendar=calendar)
+        for name, (y, m, s) in component_columns.items():
+            chunk[name] = MarsDateArray.from_components(chunk[y], chunk[m], chunk[s], calendar=calendar)
+    except ValueError as e:
+        start = chunk.index[0] if len(chunk) else 0
+        raise ValueError(f"In the chunk starting at row {start}: {e}") from e
+    dropped = {c for cols in component_columns.values() for c in cols} - set(component_columns)
+    return chunk.drop(columns=sorted(dropped))
+
+
+def _csv_chunks(reader, *args):
+    with reader:
+        for chunk in reader:
+            yield _convert_csv_chunk(chunk, *args)
+
+
+def read_mars_csv(filepath_or_buffer, date_columns=(), component_columns=None,
+                  chunksize: int = 1_000_000, calendar=None, iterator: bool = False, **kwargs):
+    """
+    Read a CSV with Mars date columns, chunksize rows at a time, so only one
+    chunk of raw strings is held in memory. date_columns are parsed into
+    marsdate columns; component_columns maps a new column name to a
+    (year, month, sol) column triple, which is combined and dropped, e.g.
+    {"darian_date": ("darian_year", "darian_month", "darian_sol")}. Other
+    keyword arguments go to pandas.read_csv. Returns one DataFrame, or an
+    iterator of converted chunks with iterator=True.
+    """
+    cal = calendar or DarianCalendar()
+    date_columns = [date_columns] if isinstance(date_columns, str) else list(date_columns)
+    component_columns = dict(component_columns or {})
+
+    dtype = dict(kwargs.pop("dtype", None) or {})
+    dtype.update({col: object for col in date_columns})
+    reader = pd.read_csv(filepath_or_buffer, chunksize=chunksize, dtype=dtype, **kwargs)
+    chunks = _csv_chunks(reader, date_columns, component_columns, cal)
+    if iterator:
+        return chunks
+    frames = list(chunks)
+    return pd.concat(frames) if frames else pd.DataFrame()
+
+
+def _ordinal_record(dates, calendar):
+    """Ordinals of dates as a one-field record array named kind[calendar]."""
+    if isinstance(dates, MarsDateArray):
+        kind, ordinals, cal = "marsdate", dates._ordinals, dates._calendar
+    elif isinstance(dates, np.ndarray) and dates.dtype.kind in "iuf":
+        # Raw ordinals: integers are dates, floats datetimes (NaN missing)
+        kind = "marsdatetime" if dates.dtype.kind == "f" else "marsdate"
+        ordinals = dates.astype("float64" if kind == "marsdatetime" else "int64", copy=False)
+        cal = calendar or DarianCalendar()
+    else:
+        values = list(dates)
+        if not any(isinstance(v, MarsDateTime) for v in values):
+            return _ordinal_record(MarsDateArray(values, calendar=calendar), None)
+        kind = "marsdatetime"
+        cal = calendar or next(v.calendar for v in values if isinstance(v, MarsDate))
+        if any(isinstance(v, MarsDate) and v.calendar.__class__ != cal.__class__ for v in values):
+            raise TypeError("Cannot mix calendars in one ordinal file")
+        ordinals = np.array(
+            [v.to_ordinal_float() if isinstance(v, MarsDate) else np.nan for v in values],
+            dtype="float64")
+    field = f"{kind}[{cal.__class__.__name__}]"
+    return np.ascontiguousarray(ordinals).view([(field, ordinals.dtype)])
+
+
+def _from_record(record, calendar, box_datetimes=True):
+    names = record.dtype.names or ()
+    match = _NPY_FIELD.match(names[0]) if len(names) == 1 else None
+    if match is None or record.ndim != 1:
+        raise ValueError("Not a Mars ordinal array written by save_npy/save_npz")
+    kind, name = match.groups()
+    cal = _calendar_from_name(name)
+    if calendar is not None and calendar.__class__ != cal.__class__:
+        raise ValueError(f"File holds {name} ordinals, not {calendar.__class__.__name__}")
+    # Field view of the record buffer: no copy, and memory-mapped if record is
+    ordinals = record[names[0]].view(np.ndarray)
+    if kind == "marsdatetime":
+        if not box_datetimes:
+            return ordinals
+        # No datetime array type: rebuild the objects on the recorded calendar
+        na = np.isnan(ordinals)
+        out = np.empty(len(ordinals), dtype=object)
+        out[~na] = _datetimes(ordinals[~na], cal)
+        return out
+    return MarsDateArray._simple_new(ordinals, cal)
+
+
+def save_npy(dates, file, calendar=None):
+    """
+    Save dates to a .npy file (path or binary file object) as raw ordinals:
+    int64 for dates, float64 sols for datetimes (NaN missing). A
+    MarsDateArray is written straight from its buffer. The kind and calendar
+    are recorded in the standard .npy header, so plain numpy can read it too.
+    calendar applies to raw ordinal ndarrays and empty input.
+    """
+    np.save(file, _ordinal_record(dates, calendar), allow_pickle=False)
+
+
+def load_npy(file, mmap_mode="r", calendar=None):
+    """
+    Load a file written by save_npy. By default the file is memory-mapped
+    read-only and wrapped without copying, so opening is instant whatever
+    its size and only the pages touched are read; mmap_mode=None reads it
+    into memory. Dates load as a MarsDateArray either way. Datetimes load as
+    the memory-mapped float64 ordinals (NaN missing; rebuild rows with
+    MarsDateTime.from_ordinal_float), or with mmap_mode=None eagerly as an
+    object array of MarsDateTime (None where missing). calendar, if given,
+    must match the one recorded.
+    """
+    record = np.load(file, mmap_mode=mmap_mode, allow_pickle=False)
+    return _from_record(record, calendar, box_datetimes=mmap_mode is None)
+
+
+def save_npz(columns: dict, file, compressed: bool = False):
+    """Save several named date columns to one .npz archive, as in save_npy."""
+    records = {name: _ordinal_record(dates, None) for name, dates in columns.items()}
+    (np.savez_compressed if compressed else np.savez)(file, **records)
+
+
+def load_npz(file) -> dict:
+    """
+    Load every column of a save_npz archive into memory (.npz members cannot
+    be memory-mapped; use save_npy files for that). Date columns are
+    MarsDateArrays and datetime columns object arrays of MarsDateTime, built
+    eagerly as load_npy(mmap_mode=None) does.
+    """
+    with np.load(file, allow_pickle=False) as archive:
+        return {name: _from_record(archive[name], None) for name in archive.files}
@@ -0,0 +1,339 @@
+# ---------------- Imports ----------------
+import re
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import take
+from pandas.api.indexers import BaseIndexer
+
+from mars_dtc.darian_calendar import DarianCalendar
+from mars_dtc.mars_dtc import MarsDate, MarsDateTime, MarsTimedelta
+from mars_dtc.pandas_ext import MarsDateArray, MarsDateDtype
+
+
+# ---------------- Classes and functions ----------------
+_CLOSED = ("right", "left", "both", "neither")
+_DIRECTIONS = ("backward", "forward", "nearest")
+_GRID_FREQS = ("sol", "month", "year")
+
+
+def _parse_sols(window) -> float:
+    """Window length in sols from an int/float, a MarsTimedelta or a string like '30sol'."""
+    if isinstance(window, MarsTimedelta):
+        window = window.sols
+    elif isinstance(window, str):
+        match = re.fullmatch(r"\s*(\d+(?:\.\d*)?)\s*sols?\s*", window)
+        if not match:
+            raise ValueError(f"Invalid sol window {window!r}; expected e.g. '30sol'")
+        window = float(match.group(1))
+    if not window > 0:
+        raise ValueError("window must be a positive number of sols")
+    return window
+
+
+def _key_ordinals(data, on):
+    """
+    Ordinals of the Mars-date key of data: its index, or the column on.
+    marsdate keys give their int64 buffer, MarsDate/MarsDateTime objects
+    their (fractional) ordinals. Missing keys are NaN in a float result.
+    """
+    keys = data.index if on is None else data[on]
+    values = keys.array if isinstance(keys.dtype, MarsDateDtype) else np.asarray(keys, dtype=object)
+    if isinstance(values, MarsDateArray):
+        if values.isna().any():
+            out = values._ordinals.astype("float64")
+            out[values.isna()] = np.nan
+            return out
+        return values._ordinals
+    return np.array(
+        [v.to_ordinal_float() if isinstance(v, MarsDate) else np.nan for v in values],
+        dtype="float64",
+    )
+
+
+class MarsSolWindowIndexer(BaseIndexer):
+    """
+    Variable-width window bounds for pandas rolling(): each row's window
+    covers the rows whose ordinals lie within `window` sols of its own,
+    looked up on the sorted ordinal buffer. The bounds are two vectorised
+    binary searches, O(n log n); at a million rows they beat a linear merge
+    of the sorted window edges into the buffer.
+    """
+
+    def __init__(self, ordinals, window, closed="right", center=False):
+        super().__init__()
+        self.ordinals = np.asarray(ordinals)
+        self.sols = window
+        self.closed = closed
+        self.center = center
+
+    def get_window_bounds(self, num_values=0, min_periods=None, center=None,
+                          closed=None, step=None):
+        t = self.ordinals
+        if self.center:
+            lo, hi = t - self.sols / 2, t + self.sols / 2
+        else:
+            lo, hi = t - self.sols, t
+        left_open = self.closed in ("right", "neither")
+        right_closed = self.closed in ("right", "both")
+        start = np.searchsorted(t, lo, side="right" if left_open else "left")
+        end = np.searchsorted(t, hi, side="right" if right_closed else "left")
+        return start.astype("int64"), end.astype("int64")
+
+
+def rolling_sols(data, window, agg="mean", on=None, closed: str = "right",
+                 center: bool = False, min_periods: int = 1):
+    """
+    Rolling aggregate over a fixed number of sols on an irregular Mars-dated
+    Series or DataFrame, keyed by its marsdate index or the column on (which
+    must be sorted). window is a number of sols, a MarsTimedelta or a string
+    like '30sol'. agg is any of 'sum', 'mean', 'min', 'max', 'count'.
+
+    closed picks which window ends are included ('right' is (t - window, t]),
+    and center=True centres the window on each row. Window bounds come from
+    the ordinal buffer; the aggregation itself runs in pandas' O(n)
+    variable-window kernels.
+    """
+    if closed not in _CLOSED:
+        raise ValueError(f"closed must be one of: {', '.join(_CLOSED)}")
+    if agg not in ("sum", "mean", "min", "max", "count"):
+        raise ValueError("agg must be one of: sum, mean, min, max, count")
+
+    ordinals = _key_ordinals(data, on)
+    if np.isnan(ordinals.astype("float64", copy=False)).any():
+        raise ValueError("Rolling keys must not contain missing dates")
+    if len(ordinals) and (np.diff(ordinals) < 0).any():
+        raise ValueError("Rolling keys must be sorted")
+
+    values = data
+    if on is not None:
+        values = data.drop(columns=[on]).select_dtypes("number")
+    indexer = MarsSolWindowIndexer(ordinals, _parse_sols(window), closed, center)
+    result = values.rolling(indexer, min_periods=min_periods).agg(agg)
+    if on is not None:
+        result.insert(0, on, data[on])
+    return result
+
+
+def _asof_positions(keys, targets, direction, tolerance, allow_exact_matches):
+    """
+    Position in the sorted targets matched by each key, or -1. Binary search
+    on the sorted buffer, so n keys against m targets cost O(n log m).
+    """
+    n = len(targets)
+    # Searching with sorted keys walks the targets in order, which is far
+    # more cache-friendly than random probes; results are scattered back
+    key_order = None
+    if len(keys) > 1 and (np.diff(keys) < 0).any():
+        key_order = np.argsort(keys, kind="stable")
+        keys = keys[key_order]
+    back = np.searchsorted(targets, keys, side="right" if allow_exact_matches else "left") - 1
+    fwd = np.searchsorted(targets, keys, side="left" if allow_exact_matches else "right")
+    fwd = np.where(fwd < n, fwd, -1)
+
+    if direction == "backward":
+        pos = back
+    elif direction == "forward":
+        pos = fwd
+    else:
+        back_dist = np.where(back >= 0, keys - targets[np.maximum(back, 0)], np.inf)
+        fwd_dist = np.where(fwd >= 0, targets[np.maximum(fwd, 0)] - keys, np.inf)
+        # Ties go to the earlier target
+        pos = np.where(fwd_dist < back_dist, fwd, back)
+
+    matched = (pos >= 0) & ~np.isnan(keys.astype("float64", copy=False))
+    if tolerance is not None and n:
+        matched &= np.abs(targets[np.maximum(pos, 0)] - keys) <= tolerance
+    pos = np.where(matched, pos, -1)
+    if key_order is not None:
+        unsorted = np.empty_like(pos)
+        unsorted[key_order] = pos
+        pos = unsorted
+    return pos
+
+
+def _take_fill(series, rows):
+    values = series.array if isinstance(series.dtype, pd.api.extensions.ExtensionDtype) \
+        else series.to_numpy()
+    return take(values, rows, allow_fill=True)
+
+
+def merge_asof_sols(left, right, on=None, left_on=None, right_on=None,
+                    direction: str = "backward", tolerance=None,
+                    allow_exact_matches: bool = True, suffixes=("_x", "_y")):
+    """
+    As-of join on Mars dates or datetimes: each left row takes the right row
+    with the nearest key at or before it (direction='backward'), at or after
+    it ('forward') or either way ('nearest'), optionally only within
+    tolerance sols. Keys are marsdate columns, MarsDate/MarsDateTime object
+    columns or, with on=None, the frames' indexes. Left may be in any
+    order and keeps its row order; right is sorted on its key internally.
+    Unmatched rows get missing values.
+    """
+    if direction not in _DIRECTIONS:
+        raise ValueError(f"direction must be one of: {', '.join(_DIRECTIONS)}")
+    left_on = left_on if left_on is not None else on
+    right_on = right_on if right_on is not None else on
+    if tolerance is not None:
+        tolerance = _parse_sols(tolerance) if not isinstance(tolerance, (int, float)) else tolerance
+        if tolerance < 0:
+            raise ValueError("tolerance must be >= 0 sols")
+
+    keys = _key_ordinals(left, left_on)
+    targets = _key_ordinals(right, right_on)
+    # Missing right keys can never match; order the rest once
+    usable = np.flatnonzero(~np.isnan(targets.astype("float64", copy=False)))
+    order = usable[np.argsort(targets[usable], kind="stable")]
+    pos = _asof_positions(keys, targets[order], direction, tolerance, allow_exact_matches)
+    rows = np.where(pos >= 0, order[np.maximum(pos, 0)], -1)
+
+    result = left.copy()
+    shared_key = left_on is not None and left_on == right_on
+    for col in right.columns:
+        if shared_key and col == right_on:
+            continue
+        name = col
+        if col in left.columns:
+            result = result.rename(columns={col: f"{col}{suffixes[0]}"})
+            name = f"{col}{suffixes[1]}"
+        result[name] = _take_fill(right[col], rows)
+    return result
+
+
+def _as_marsdate_array(dates) -> MarsDateArray:
+    if isinstance(dates, (pd.Series, pd.Index)):
+        dates = dates.array
+    if not isinstance(dates, MarsDateArray):
+        dates = MarsDateArray._from_sequence(dates)
+    return dates
+
+
+def _key_calendar(data, on):
+    keys = data.index if on is None else data[on]
+    if isinstance(keys.dtype, MarsDateDtype):
+        return keys.array._calendar
+    return next((v.calendar for v in keys if isinstance(v, MarsDate)), None) or DarianCalendar()
+
+
+def _bound_ordinal(value, calendar, default):
+    if value is None:
+        return default
+    if isinstance(value, str):
+        value = MarsDate.from_string(value, calendar=calendar)
+    return value.to_ordinal_float() if isinstance(value, MarsDate) else value
+
+
+def find_sol_gaps(dates, min_length: int = 1) -> pd.DataFrame:
+    """
+    Runs of sols missing from dates (any order, duplicates and missing
+    values allowed), as a DataFrame with the first and last missing sol of
+    each gap and its length in sols. Gaps shorter than min_length are
+    left out.
+    """
+    dates = _as_marsdate_array(dates)
+    ordinals = np.unique(dates._ordinals[~dates.isna()])
+    steps = np.diff(ordinals)
+    at = np.flatnonzero(steps - 1 >= max(min_length, 1))
+    cal = dates._calendar
+    return pd.DataFrame({
+        "start": MarsDateArray._simple_new(ordinals[at] + 1, cal),
+        "end": MarsDateArray._simple_new(ordinals[at + 1] - 1, cal),
+        "length": steps[at] - 1,
+    })
+
+
+def _grid_ordinals(calendar, first, last, freq):
+    """Ordinals of every sol, or every month/year start, from first to last."""
+    if freq == "sol":
+        return np.arange(first, last + 1, dtype="int64")
+    (y0, y1), (m0, m1), _ = calendar.from_ordinals([first, last])
+    if freq == "month":
+        n_months = len(calendar.month_lengths(0))
+        k = np.arange((y1 - y0) * n_months + (m1 - m0) + 1)
+        years, months = y0 + (m0 - 1 + k) // n_months, (m0 - 1 + k) % n_months + 1
+    else:
+        years = np.arange(y0, y1 + 1)
+        months = np.ones_like(years)
+    return calendar.to_ordinals(years, months, np.ones_like(years))
+
+
+def reindex_sols(data, on=None, freq: str = "sol", start=None, end=None, fill_value=None):
+    """
+    Reindex a frame keyed by a marsdate index (or column on) onto a complete
+    grid of sols, month starts or year starts between start and end (by
+    default the first and last key). Rows on the grid keep their values,
+    new rows get fill_value (missing by default). Keys must be unique; for
+    freq='month'/'year' they are expected on period starts, e.g. after
+    floor('month').
+    """
+    if freq not in _GRID_FREQS:
+        raise ValueError(f"freq must be one of: {', '.join(_GRID_FREQS)}")
+    keys = _as_marsdate_array(data.index if on is None else data[on])
+    if keys.isna().any():
+        raise ValueError("Reindex keys must not contain missing dates")
+    cal = keys._calendar
+    ordinals = keys._ordinals
+    if not len(ordinals) and (start is None or end is None):
+        return data.copy()
+    first = int(_bound_ordinal(start, cal, ordinals.min() if len(ordinals) else None))
+    last = int(_bound_ordinal(end, cal, ordinals.max() if len(ordinals) else None))
+    grid = _grid_ordinals(cal, first, last, freq)
+
+    # Reindexing on the int64 ordinals is a hash join, no MarsDate objects
+    result = data.set_axis(pd.Index(ordinals), axis=0).reindex(grid, fill_value=fill_value)
+    grid_dates = MarsDateArray._simple_new(grid, cal)
+    if on is None:
+        result.index = pd.Index(grid_dates, name=data.index.name)
+    else:
+        result = result.reset_index(drop=True)
+        result[on] = grid_dates
+    return result
+
+
+def _datetimes(ordinals, calendar):
+    """MarsDateTime objects for fractional ordinals, fields computed in bulk."""
+    base = np.floor(ordinals)
+    years, months, sols = calendar.from_ordinals(base.astype("int64"))
+    seconds = (ordinals - base) * MarsDateTime.SECONDS_PER_SOL
+    hours = (seconds // 3600).astype("int64")
+    minutes = ((seconds % 3600) // 60).astype("int64")
+    secs = (seconds % 60).astype("int64")
+    return [
+        MarsDateTime(*fields, calendar=calendar)
+        for fields in zip(years.tolist(), months.tolist(), sols.tolist(),
+                          hours.tolist(), minutes.tolist(), secs.tolist())
+    ]
+
+
+def interpolate_sols(data, step, on=None, start=None, end=None, columns=None) -> pd.DataFrame:
+    """
+    Linearly interpolate numeric columns of a Mars-dated frame onto a
+    regular grid of MarsDateTime every step sols (e.g. 0.25 or '1sol'),
+    from start to end (by default the first and last key). Keys may be
+    marsdate or MarsDate/MarsDateTime objects, in any order; each column's
+    missing values are skipped and grid points outside its data are NaN.
+    The result is indexed by the grid times.
+    """
+    step = _parse_sols(step)
+    cal = _key_calendar(data, on)
+    x = _key_ordinals(data, on).astype("float64")
+    keep = ~np.isnan(x)
+    order = np.flatnonzero(keep)[np.argsort(x[keep], kind="stable")]
+    x = x[order]
+
+    if columns is None:
+        frame = data.drop(columns=[on]) if on is not None else data
+        columns = frame.select_dtypes("number").columns
+    first = _bound_ordinal(start, cal, x[0] if len(x) else 0.0)
+    last = _bound_ordinal(end, cal, x[-1] if len(x) else 0.0)
+    n_points = int(np.floor((last - first) / step + 1e-9)) + 1 if last >= first else 0
+    grid = first + step * np.arange(n_points)
+
+    out = {}
+    for col in columns:
+        y = data[col].to_numpy(dtype="float64", na_value=np.nan)[order]
+        valid = ~np.isnan(y)
+        out[col] = np.interp(grid, x[valid], y[valid], left=np.nan, right=np.nan) \
+            if valid.any() else np.full(n_points, np.nan)
+    index = pd.Index(_datetimes(grid, cal), dtype=object, name=on or data.index.name or "time")
+    return pd.DataFrame(out, index=index)
@@ -50,13 +50,3 @@ def get_sol_of_year(date: "MarsDate") -> int:
         date = MarsDate.from_string(str(date))
     start_of_year = MarsDate(date.year, 1, 1)
     return (date.to_ordinal() - start_of_year.to_ordinal()) + 1
-
-
-# Also attach as a convenience method on MarsDate
-def _sol_of_year_method(self) -> int:
-    return get_sol_of_year(self)
-
-
-MarsDate.sol_of_year = _sol_of_year_method
-
-
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from mars_dtc import BaseCalendar, DarianCalendar, MarsDate
+
+
+class QuadCalendar(BaseCalendar):
+    """Two 10-sol months, with an extra sol in month 1 every fourth year."""
+    REGYEAR_MONTH_LENGTHS = [10, 10]
+    LEAPYEAR_MONTH_LENGTHS = [11, 10]
+    LEAP_CYCLE = 4
+
+    def is_leap_year(self, year):
+        return year % 4 == 0
+
+
+def test_cycle_protocol_derives_the_calendar():
+    cal = QuadCalendar()
+    assert cal.month_lengths(4) == [11, 10]
+    assert cal.month_lengths(5) == [10, 10]
+    assert cal.to_ordinal(0, 1, 1) == 0
+    assert cal.to_ordinal(1, 1, 1) == 21
+    assert cal.to_ordinal(-1, 1, 1) == -20
+    assert cal.from_ordinal(20) == (0, 2, 10)
+    assert cal.from_ordinal(11) == (0, 2, 1)
+    assert cal.from_ordinal(-1) == (-1, 2, 10)
+    with pytest.raises(ValueError):
+        cal.validate_date(1, 2, 11)
+
+
+def test_cycle_protocol_scalar_and_array_paths_agree():
+    cal = QuadCalendar()
+    ordinals = np.arange(-500, 500)
+    years, months, sols = cal.from_ordinals(ordinals)
+    assert [cal.from_ordinal(o) for o in ordinals.tolist()] == list(
+        zip(years.tolist(), months.tolist(), sols.tolist()))
+    assert (cal.to_ordinals(years, months, sols) == ordinals).all()
+
+
+def test_cycle_calendar_works_with_marsdate():
+    d = MarsDate(3, 2, 10, calendar=QuadCalendar())
+    assert d.add_sols(1).year == 4
+    assert MarsDate.from_ordinal(d.to_ordinal(), calendar=QuadCalendar()) == d
+
+
+def test_darian_far_years_are_constant_time():
+    cal = DarianCalendar()
+    ordinal = cal.to_ordinal(-1_000_000, 24, 28)
+    assert cal.from_ordinal(ordinal) == (-1_000_000, 24, 28)
+    assert cal.from_ordinal(cal.to_ordinal(10**9, 3, 5)) == (10**9, 3, 5)
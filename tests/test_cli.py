@@ -0,0 +1,71 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from mars_dtc.cli import convert_values, main
+
+ROOT = Path(__file__).parents[1]
+
+
+def test_convert_values_dates_datetimes_and_ordinals():
+    assert convert_values(["214-14-20", "", "214-14-20"], to="ordinal") == [143460, None, 143460]
+    assert convert_values(["143460", "214/14/20"]) == ["+0214-14-20", "+0214-14-20"]
+    start = convert_values(["214-01-01"], to="ordinal")[0]
+    assert convert_values(["214-01-01T12:00:00"], to="ordinal") == [start + 0.5]
+    assert convert_values(["20 Mithuna 214"], parse_fmt="%d %B %Y", out_fmt="%Y.%m.%d") == ["214.14.20"]
+
+
+def test_lines_with_chunks_and_workers(tmp_path, capsys):
+    src = tmp_path / "dates.txt"
+    src.write_text("".join(f"214-01-{s:02d}\n" for s in range(1, 28)))
+    main([str(src), "--to", "ordinal", "--chunksize", "5", "--workers", "2"])
+    out = capsys.readouterr().out.split()
+    first = convert_values(["214-01-01"], to="ordinal")[0]
+    assert out == [str(first + i) for i in range(27)]
+
+
+def test_ndjson_and_csv(tmp_path, capsys):
+    src = tmp_path / "log.ndjson"
+    src.write_text('{"t": "214-01-01T06:00:00", "v": 1}\n{"t": null, "v": 2}\n')
+    main([str(src), "--input-format", "ndjson", "-c", "t", "--format", "%d %b %Y %H:%M"])
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert lines == [{"t": "01 Sag 214 06:00", "v": 1}, {"t": None, "v": 2}]
+
+    src = tmp_path / "data.csv"
+    src.write_text("id,date\n1,214-01-01\n2,\n3,214/1/3\n")
+    out_file = tmp_path / "out.csv"
+    main([str(src), "--input-format", "csv", "-c", "date", "--chunksize", "2", "-o", str(out_file)])
+    assert out_file.read_text().splitlines() == [
+        "id,date", "1,+0214-01-01", "2,", "3,+0214-01-03"]
+
+
+def test_errors_exit_nonzero(tmp_path, capsys):
+    src = tmp_path / "bad.txt"
+    src.write_text("214-01-01\nnot a date\n")
+    with pytest.raises(SystemExit) as exc:
+        main([str(src)])
+    assert exc.value.code == 1
+    assert "not a date" in capsys.readouterr().err
+
+    out = tmp_path / "out.txt"
+    out.write_text("keep\n")
+    with pytest.raises(SystemExit) as exc:
+        main([str(tmp_path / "missing.txt"), "-o", str(out)])
+    assert exc.value.code == 1 and "missing.txt" in capsys.readouterr().err
+    assert out.read_text() == "keep\n"
+
+    records = tmp_path / "records.ndjson"
+    records.write_text('{"date": "214-01-01"}\n[1, 2]\n')
+    with pytest.raises(SystemExit):
+        main([str(records), "--input-format", "ndjson", "-c", "date"])
+    assert "record [1, 2] is not an object" in capsys.readouterr().err
+
+
+def test_module_entry_point_streams_stdin():
+    result = subprocess.run(
+        [sys.executable, "-m", "mars_dtc", "--to", "ordinal"],
+        input="0000-01-01\n", capture_output=True, text=True, cwd=ROOT, check=True)
+    assert result.stdout == "0\n"
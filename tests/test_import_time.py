@@ -0,0 +1,86 @@
+import json
+import subprocess
+import sys
+
+# Generous ceiling for a cold `import mars_dtc` (numpy is the only heavy
+# dependency it should load); pandas + matplotlib alone take several times this
+IMPORT_BUDGET_SECONDS = 1.0
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import mars_dtc
+elapsed = time.perf_counter() - start
+heavy = [m for m in ("pandas", "matplotlib", "yaml", "pyarrow") if m in sys.modules]
+print(json.dumps({"elapsed": elapsed, "heavy": heavy,
+                  "backend_set": "mars_dtc.plotting" in sys.modules}))
+"""
+
+
+def run_fresh(script):
+    out = subprocess.run([sys.executable, "-c", script], capture_output=True,
+                         text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_import_has_no_heavy_dependencies_or_side_effects():
+    result = run_fresh(SCRIPT)
+    assert result["heavy"] == []
+    assert result["backend_set"] is False
+
+
+def test_import_time_budget():
+    result = run_fresh(SCRIPT)
+    assert result["elapsed"] < IMPORT_BUDGET_SECONDS
+
+
+def test_lazy_exports_resolve_on_access():
+    result = run_fresh(
+        "import json, sys, mars_dtc\n"
+        "arr = mars_dtc.MarsDateArray([mars_dtc.MarsDate(214, 1, 1)])\n"
+        "print(json.dumps({'pandas': 'pandas' in sys.modules,"
+        " 'matplotlib': 'matplotlib' in sys.modules, 'n': len(arr)}))"
+    )
+    assert result == {"pandas": True, "matplotlib": False, "n": 1}
+
+
+def test_import_after_pandas_and_matplotlib_leaves_plotting_alone():
+    result = run_fresh(
+        "import json, sys\n"
+        "import matplotlib\n"
+        "matplotlib.use('Agg')\n"
+        "import matplotlib.units as munits\n"
+        "import pandas as pd\n"
+        "backend, registry = pd.options.plotting.backend, dict(munits.registry)\n"
+        "import mars_dtc\n"
+        "print(json.dumps({'backend': pd.options.plotting.backend,"
+        " 'registry_same': dict(munits.registry) == registry,"
+        " 'backend_same': pd.options.plotting.backend == backend}))"
+    )
+    assert result == {"backend": "matplotlib", "registry_same": True, "backend_same": True}
+
+
+def test_plotting_backend_is_opt_in():
+    result = run_fresh(
+        "import json\n"
+        "import matplotlib\n"
+        "matplotlib.use('Agg')\n"
+        "import pandas as pd\n"
+        "import mars_dtc.plotting\n"
+        "before = pd.options.plotting.backend\n"
+        "mars_dtc.plotting.enable()\n"
+        "print(json.dumps([before, pd.options.plotting.backend]))"
+    )
+    assert result == ["matplotlib", "mars_dtc.plotting"]
+
+
+def test_dtype_registered_when_pandas_is_imported_later():
+    result = run_fresh(
+        "import json, sys\n"
+        "import mars_dtc\n"
+        "before = 'pandas' in sys.modules\n"
+        "import pandas as pd\n"
+        "series = pd.Series(['214/01/01']).astype('marsdate')\n"
+        "print(json.dumps([before, str(series.dtype), str(series[0])]))"
+    )
+    assert result == [False, "marsdate", "214/01/01"]
@@ -0,0 +1,61 @@
+import pandas as pd
+
+import mars_dtc
+from mars_dtc import instrumentation
+from mars_dtc.darian_calendar import DarianCalendar
+from mars_dtc.mars_dtc import MarsDate
+from mars_dtc.pandas_ext import MarsDateArray
+
+
+def test_disabled_leaves_original_functions_in_place():
+    original = DarianCalendar.__dict__["to_ordinal"]
+    with mars_dtc.instrument():
+        assert DarianCalendar.__dict__["to_ordinal"] is not original
+    assert DarianCalendar.__dict__["to_ordinal"] is original
+    assert not instrumentation.enabled()
+
+
+def test_counts_calls_and_time():
+    with mars_dtc.instrument():
+        MarsDate(214, 1, 1).to_ordinal()
+        MarsDate.from_ordinal(100)
+    paths = mars_dtc.stats()["paths"]
+    assert paths["MarsDate.__init__"]["calls"] == 2
+    assert paths["DarianCalendar.to_ordinal"]["calls"] == 1
+    assert paths["MarsDate.from_ordinal"]["seconds"] >= 0
+
+    # Nothing is recorded once the block exits
+    MarsDate(214, 1, 1)
+    assert mars_dtc.stats()["paths"]["MarsDate.__init__"]["calls"] == 2
+
+
+def test_array_paths_and_cache_hit_rates():
+    arr = MarsDateArray([MarsDate(214, 1, 1), None, MarsDate(215, 2, 3)])
+    with mars_dtc.instrument():
+        list(arr)
+        arr.strftime("%Y %m %d")
+        arr.strftime("%Y %m %d")
+    report = mars_dtc.stats()
+    assert report["paths"]["MarsDateArray._box_values"]["calls"] == 1
+    assert report["paths"]["MarsDateArray.strftime"]["calls"] == 2
+    cache = report["caches"]["compile_format"]
+    assert cache["hits"] >= 1 and 0 < cache["hit_rate"] <= 1
+
+
+def test_callback_and_classmethods():
+    events = []
+    with mars_dtc.instrument(callback=lambda name, seconds: events.append(name)):
+        MarsDate.strptime("214-01-01", "%Y-%m-%d")
+        pd.Series(["214-01-02"]).astype("marsdate")
+    assert "MarsDate.strptime" in events
+    assert "MarsDateArray.from_strings" in events
+    assert isinstance(MarsDate.__dict__["strptime"], classmethod)
+
+
+def test_nested_blocks():
+    with mars_dtc.instrument():
+        with mars_dtc.instrument(reset_stats=False):
+            MarsDate(1, 1, 1)
+        assert instrumentation.enabled()
+        MarsDate(1, 1, 1)
+    assert mars_dtc.stats()["paths"]["MarsDate.__init__"]["calls"] == 2
@@ -0,0 +1,34 @@
+import pytest
+import pandas as pd
+import mars_dtc.mars_dtc as mdt
+
+pa = pytest.importorskip("pyarrow")
+
+
+def make_frame():
+    dates = mdt.MarsDateArray([mdt.MarsDate(214, 14, 28), None, mdt.MarsDate(-5, 24, 28)])
+    return pd.DataFrame({"darian_date": dates, "value": [1.0, 2.0, 3.0]})
+
+
+def test_arrow_array_uses_int32_ordinal_storage():
+    from mars_dtc.arrow_ext import MarsDateArrowType
+
+    df = make_frame()
+    arr = pa.array(df["darian_date"].array)
+    assert isinstance(arr.type, MarsDateArrowType)
+    assert arr.type.storage_type == pa.int32()
+    assert arr.type.calendar == "DarianCalendar"
+    assert arr.storage.to_pylist() == [mdt.MarsDate(214, 14, 28).to_ordinal(), None,
+                                       mdt.MarsDate(-5, 24, 28).to_ordinal()]
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "feather"])
+def test_file_roundtrip_keeps_marsdate_dtype(tmp_path, fmt):
+    df = make_frame()
+    path = tmp_path / f"dates.{fmt}"
+    getattr(df, f"to_{fmt}")(path)
+    restored = getattr(pd, f"read_{fmt}")(path)
+
+    assert str(restored["darian_date"].dtype) == "marsdate"
+    assert isinstance(restored["darian_date"].array, mdt.MarsDateArray)
+    assert list(restored["darian_date"]) == list(df["darian_date"])
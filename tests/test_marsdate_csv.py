@@ -0,0 +1,59 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mars_dtc
+import mars_dtc.mars_dtc as mdt
+
+CSV = """darian_date,darian_year,darian_month,darian_sol,temp
+214-14-20,214,14,20,-61.5
+,215,1,1,-70.0
++0215-01-02,,1,2,-65.2
+215/24/28,-3,24,28,-60.0
+"""
+
+
+def test_read_csv_with_marsdate_dtype():
+    df = pd.read_csv(io.StringIO(CSV), dtype={"darian_date": "marsdate"})
+    assert str(df["darian_date"].dtype) == "marsdate"
+    assert df["darian_date"][0] == mdt.MarsDate(214, 14, 20)
+    assert df["darian_date"].isna().tolist() == [False, True, False, False]
+    assert df["darian_date"][3] == mdt.MarsDate(215, 24, 28)
+
+
+def test_from_strings_parses_each_form_and_reports_bad_values():
+    arr = mdt.MarsDateArray.from_strings(
+        np.array(["214-14-20", "+0214-14-20", " 214.14.20 ", None, "NaT", ""], dtype=object))
+    assert arr.isna().tolist() == [False, False, False, True, True, True]
+    assert arr[0] == arr[1] == arr[2] == mdt.MarsDate(214, 14, 20)
+
+    with pytest.raises(ValueError, match="Invalid MarsDate string"):
+        mdt.MarsDateArray.from_strings(["214-14-20", "yesterday"])
+    with pytest.raises(ValueError, match="1 invalid date string"):
+        mdt.MarsDateArray.from_strings(["214-14-20", "214-25-01"])
+
+
+def test_read_mars_csv_in_chunks():
+    df = mars_dtc.read_mars_csv(
+        io.StringIO(CSV), date_columns="darian_date",
+        component_columns={"date": ("darian_year", "darian_month", "darian_sol")},
+        chunksize=2)
+    assert list(df.columns) == ["darian_date", "temp", "date"]
+    assert str(df["darian_date"].dtype) == str(df["date"].dtype) == "marsdate"
+    assert df.index.tolist() == [0, 1, 2, 3]
+    assert df["darian_date"].isna().tolist() == [False, True, False, False]
+    assert df["date"].isna().tolist() == [False, False, True, False]
+    assert df["date"][3] == mdt.MarsDate(-3, 24, 28)
+
+    chunks = list(mars_dtc.read_mars_csv(io.StringIO(CSV), date_columns=["darian_date"],
+                                         chunksize=3, iterator=True))
+    assert [len(c) for c in chunks] == [3, 1]
+
+
+def test_read_mars_csv_reports_chunk_of_invalid_row():
+    bad = "darian_year,darian_month,darian_sol\n214,1,1\n214,1,1\n2,24,28\n"
+    with pytest.raises(ValueError, match="chunk starting at row 2: 1 invalid date"):
+        mars_dtc.read_mars_csv(io.StringIO(bad), chunksize=2,
+                               component_columns={"d": ("darian_year", "darian_month", "darian_sol")})
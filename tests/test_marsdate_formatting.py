@@ -47,3 +47,48 @@ def test_dataframe_repr_does_not_fail_with_marsdate(monkeypatch):
 
     df_repr = repr(df)
     assert "214" in df_repr
+
+
+def test_format_is_compiled_once_and_cached():
+    from mars_dtc.mars_dtc import _compile_format
+
+    template, codes = _compile_format("%Y/%m/%d")
+    assert template == "{Y}/{m}/{d}"
+    assert codes == {"Y", "m", "d"}
+    assert _compile_format("%Y/%m/%d") is _compile_format("%Y/%m/%d")
+
+
+def test_format_literals_and_percent_escape():
+    mdate = mdt.MarsDate(214, 14, 28)
+    assert mdate.format("{%Y} 100%%") == "{214} 100%"
+    assert mdt.MarsDateTime(214, 14, 28, 7, 5, 9).format("%Y-%m-%d %H:%M:%S") == "214-14-28 07:05:09"
+
+
+def test_array_strftime_matches_scalar_format():
+    dates = [mdt.MarsDate(214, 14, 28), mdt.MarsDate(-5, 24, 28), mdt.MarsDate(3, 1, 1)]
+    arr = mdt.MarsDateArray(dates + [None])
+    fmt = "%A, %B %d, %Y (%a %b %y)"
+
+    out = arr.strftime(fmt)
+    assert list(out[:3]) == [d.format(fmt) for d in dates]
+    assert out[3] is None
+    assert list(arr.astype(str)) == ["214/14/28", "-005/24/28", "003/01/01", "NaT"]
+
+
+def test_to_csv_and_boxes_use_vectorized_rendering():
+    import io
+
+    import pandas as pd
+
+    dates = [mdt.MarsDate(214, 14, 28), None, mdt.MarsDate(-5, 24, 28), mdt.MarsDate(3, 1, 1)]
+    arr = mdt.MarsDateArray(dates)
+    boxed = arr.astype(object)
+    # str() comes pre-rendered from the ordinal buffer and matches the scalar
+    assert boxed[0]._str == "214/14/28" and boxed[1] is None
+    assert [None if d is None else str(d) for d in boxed] == \
+        [None if d is None else str(d) for d in dates]
+
+    csv = pd.DataFrame({"date": arr}).to_csv(index=False, na_rep="NaT")
+    assert csv.splitlines() == ["date", "214/14/28", "NaT", "-05/24/28", "003/01/01"]
+    # Same text as the array-level strftime for non-negative years
+    assert [csv.splitlines()[1], csv.splitlines()[4]] == list(arr.strftime()[[0, 3]])
@@ -45,3 +45,25 @@ def test_hash_stability_in_set():
     _ = d.to_ordinal() 
     h_after = hash(d)
     assert h_before == h_after
+
+def test_hash_is_computed_once_and_cached():
+    d = mdt.MarsDate(214, 14, 28)
+    calls = []
+    original = d.calendar.to_ordinal
+
+    def counting_to_ordinal(*args):
+        calls.append(args)
+        return original(*args)
+
+    d.calendar.to_ordinal = counting_to_ordinal
+    assert hash(d) == hash(d)
+    assert len(calls) == 1
+
+def test_hash_matches_across_construction_paths():
+    d1 = mdt.MarsDate(214, 14, 28)
+    d2 = mdt.MarsDate.from_ordinal(d1.to_ordinal())
+    d3 = mdt.MarsDateArray([d1])[0]
+
+    assert d1 == d2 == d3
+    assert hash(d1) == hash(d2) == hash(d3)
+    assert len({d1, d2, d3}) == 1
@@ -0,0 +1,89 @@
+import threading
+
+import numpy as np
+import pytest
+
+import mars_dtc
+import mars_dtc.mars_dtc as mdt
+
+
+@pytest.fixture
+def interning():
+    mars_dtc.set_intern_cache(4)
+    yield
+    mars_dtc.set_intern_cache(0)
+
+
+def test_off_by_default():
+    assert mdt.MarsDate.from_ordinal(10) is not mdt.MarsDate.from_ordinal(10)
+
+
+def test_shared_instances_from_ordinals_strings_and_arrays(interning):
+    d = mdt.MarsDate.from_ordinal(143000)
+    assert mdt.MarsDate.from_ordinal(143000) is d
+    assert mdt.MarsDate.from_string(d.format("%Y-%m-%d")) is d
+
+    arr = mdt.MarsDateArray.from_ordinals(np.array([143000, 143000, 5]))
+    assert arr[0] is d and arr[1] is d
+    boxed = list(arr)
+    assert boxed[0] is boxed[1] is d
+
+    # Datetimes and dates never share an entry
+    assert type(mdt.MarsDateTime.from_ordinal(143000)) is mdt.MarsDateTime
+
+
+def test_lru_eviction_and_validation(interning):
+    first = mdt.MarsDate.from_ordinal(0)
+    for o in range(1, 5):
+        mdt.MarsDate.from_ordinal(o)
+    assert mdt.MarsDate.from_ordinal(0) is not first
+    assert mdt._intern_cache.cache_info().currsize == 4
+
+    # Out-of-range sols must still raise rather than alias a cached date
+    mdt.MarsDate.from_string("214-02-01")
+    with pytest.raises(ValueError):
+        mdt.MarsDate.from_string("214-01-29")
+
+
+def test_thread_safety(interning):
+    mars_dtc.set_intern_cache(64)
+    results = []
+
+    def work():
+        results.append([mdt.MarsDate.from_ordinal(o % 50) for o in range(2000)])
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # Every thread got the same shared object for a given ordinal at the end
+    assert all(r[-1] is results[0][-1] for r in results)
+    assert all(r[-1].to_ordinal() == 1999 % 50 for r in results)
+
+
+def test_shared_dates_are_immutable(interning):
+    d = mdt.MarsDate.from_ordinal(143000)
+    h = hash(d)
+    with pytest.raises(AttributeError, match="immutable"):
+        d.year = 300
+    with pytest.raises(AttributeError, match="immutable"):
+        del d.sol
+    dt = mdt.MarsDateTime(214, 1, 1, 5, 6, 7)
+    with pytest.raises(AttributeError, match="immutable"):
+        dt.hour = 6
+    assert mdt.MarsDate.from_ordinal(143000) is d and hash(d) == h
+    assert d.to_ordinal() == 143000
+
+
+def test_replaced_cache_is_reported_to_instrumentation(interning):
+    old = mdt._intern_cache
+    mars_dtc.set_intern_cache(8)
+    with mars_dtc.instrument():
+        mdt.MarsDate.from_ordinal(1)
+        mdt.MarsDate.from_ordinal(1)
+        assert mars_dtc.stats()["caches"]["intern"]["hits"] == 1
+    assert mdt._intern_cache is not old
+
+    mars_dtc.set_intern_cache(0)
+    assert "intern" not in mars_dtc.stats()["caches"]
@@ -0,0 +1,63 @@
+import io
+
+import numpy as np
+import pytest
+
+import mars_dtc
+import mars_dtc.mars_dtc as mdt
+
+
+def test_save_and_memory_map_dates(tmp_path):
+    arr = mdt.MarsDateArray([mdt.MarsDate(214, 14, 20), None, mdt.MarsDate(-3, 24, 28)])
+    path = tmp_path / "dates.npy"
+    mars_dtc.save_npy(arr, path)
+
+    loaded = mars_dtc.load_npy(path)
+    assert isinstance(loaded, mdt.MarsDateArray)
+    assert list(loaded) == list(arr)
+    assert isinstance(loaded._calendar, mdt.DarianCalendar)
+    # Zero-copy, read-only view of the mapped file
+    assert isinstance(loaded._ordinals.base, np.memmap)
+    assert not loaded._ordinals.flags.writeable
+
+    in_memory = mars_dtc.load_npy(path, mmap_mode=None)
+    assert np.array_equal(in_memory._ordinals, arr._ordinals)
+    assert "marsdate[DarianCalendar]" in np.load(path).dtype.names
+
+
+def test_datetimes_round_trip_through_float_ordinals():
+    dts = [mdt.MarsDateTime(214, 14, 20, 6, 0, 0), None, mdt.MarsDateTime(-3, 24, 28, 18, 30, 15)]
+    buf = io.BytesIO()
+    mars_dtc.save_npy(dts, buf)
+    buf.seek(0)
+    assert np.load(buf).dtype.names == ("marsdatetime[DarianCalendar]",)
+
+    buf.seek(0)
+    loaded = mars_dtc.load_npy(buf, mmap_mode=None)
+    assert loaded.dtype == object and list(loaded) == dts
+    assert isinstance(loaded[0], mdt.MarsDateTime)
+
+
+def test_memory_mapped_datetimes_stay_float_ordinals(tmp_path):
+    dts = [mdt.MarsDateTime(214, 14, 20, 6, 0, 0), None]
+    path = tmp_path / "times.npy"
+    mars_dtc.save_npy(dts, path)
+
+    mapped = mars_dtc.load_npy(path)
+    assert mapped.dtype == np.float64 and isinstance(mapped.base, np.memmap)
+    assert mapped[0] == dts[0].to_ordinal_float() and np.isnan(mapped[1])
+
+
+def test_npz_archive_and_bad_files(tmp_path):
+    path = tmp_path / "archive.npz"
+    dates = mdt.MarsDateArray.from_ordinals(np.arange(100, dtype="int64"))
+    mars_dtc.save_npz({"date": dates, "time": np.array([0.25, np.nan])}, path, compressed=True)
+
+    columns = mars_dtc.load_npz(path)
+    assert (columns["date"] == dates).all() and len(columns["date"]) == 100
+    assert columns["time"][1] is None
+    assert columns["time"][0] == mdt.MarsDateTime(0, 1, 1, 6, 0, 0)
+
+    np.save(tmp_path / "plain.npy", np.arange(3))
+    with pytest.raises(ValueError, match="Not a Mars ordinal array"):
+        mars_dtc.load_npy(tmp_path / "plain.npy")
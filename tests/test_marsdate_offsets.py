@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import mars_dtc.mars_dtc as mdt
+from mars_dtc.offsets import (
+    MonthBegin, MonthEnd, Months, QuarterEnd, Quarters, Sols, Weeks, YearBegin, YearEnd, Years,
+)
+
+D = mdt.MarsDate
+
+
+@pytest.mark.parametrize("n", [-25, -1, 1, 5, 24])
+def test_month_and_year_shifts_clamp_like_scalars(n):
+    # Spans leap and regular years, so month 24 has 27 or 28 sols
+    arr = mdt.MarsDateArray.from_ordinals(np.arange(142000, 143500, dtype="int64"))
+    dates = list(arr)
+    assert list(Months(n).apply(arr)) == [d.add_months(n) for d in dates]
+    assert list(Years(n).apply(arr)) == [d.add_years(n) for d in dates]
+    assert list(Quarters(n).apply(arr)) == [d.add_months(6 * n) for d in dates]
+
+
+def test_anchored_offsets():
+    mid, start, year_end = D(214, 1, 5), D(214, 1, 1), D(214, 24, 27)
+    assert (mid + MonthBegin(), start + MonthBegin()) == (D(214, 2, 1), D(214, 2, 1))
+    assert (mid + MonthBegin(0), start + MonthBegin(0)) == (D(214, 2, 1), start)
+    assert (mid - MonthBegin(), start - MonthBegin()) == (start, D(213, 24, 1))
+    assert (mid + MonthEnd(), mid + MonthEnd(0)) == (D(214, 1, 28), D(214, 1, 28))
+    assert year_end + MonthEnd() == D(215, 1, 28)
+    assert year_end + QuarterEnd() == D(215, 6, 27)
+    assert (mid + YearEnd(), year_end + YearEnd(), year_end - YearEnd()) == \
+        (year_end, D(215, 24, 28), D(213, 24, 28))
+    assert mid + YearBegin() == D(215, 1, 1)
+
+
+def test_offsets_on_columns_and_scalars():
+    series = pd.Series(mdt.MarsDateArray([D(214, 1, 5), None]), name="date")
+    shifted = series + Months(1)
+    assert str(shifted.dtype) == "marsdate" and shifted.name == "date"
+    assert shifted[0] == D(214, 2, 5) and shifted[1] is None
+
+    index = pd.Index(series.array) + YearEnd(0)
+    assert index[0] == D(214, 24, 27)
+
+    assert D(214, 1, 5) - Weeks(1) == D(213, 24, 26)
+    assert 2 * Sols(3) == Sols(6) and -Sols(3) == Sols(-3)
+    assert mdt.MarsDateTime(214, 24, 27, 5, 6, 7) + Months(1) == mdt.MarsDateTime(215, 1, 27, 5, 6, 7)
+    with pytest.raises(TypeError, match="n must be an integer"):
+        Months(1.5)
@@ -0,0 +1,36 @@
+import pickle
+import numpy as np
+import mars_dtc.mars_dtc as mdt
+
+
+def test_scalar_pickle_roundtrip_is_compact():
+    d = mdt.MarsDate(214, 14, 28)
+    t = mdt.MarsDateTime(-3, 2, 1, 4, 5, 6)
+
+    for value in (d, t):
+        payload = pickle.dumps(value)
+        restored = pickle.loads(payload)
+        assert type(restored) is type(value)
+        assert restored == value
+        assert b"__dict__" not in payload and b"calendar" not in payload
+
+    restored = pickle.loads(pickle.dumps(t))
+    assert (restored.hour, restored.minute, restored.second) == (4, 5, 6)
+
+
+def test_unpickled_scalars_share_calendar_instance():
+    a, b = pickle.loads(pickle.dumps([mdt.MarsDate(1, 1, 1), mdt.MarsDate(2, 2, 2)]))
+    assert a.calendar is b.calendar
+
+
+def test_array_pickles_ordinal_buffer_out_of_band():
+    arr = mdt.MarsDateArray([mdt.MarsDate(214, 14, 28), None, mdt.MarsDate(-5, 24, 28)])
+
+    buffers = []
+    payload = pickle.dumps(arr, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    restored = pickle.loads(payload, buffers=buffers)
+
+    assert isinstance(restored, mdt.MarsDateArray)
+    assert list(restored) == list(arr)
+    np.testing.assert_array_equal(restored.isna(), [False, True, False])
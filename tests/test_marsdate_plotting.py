@@ -0,0 +1,95 @@
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+
+import mars_dtc.mars_dtc as mdt
+from mars_dtc.plotting import MarsAutoDateLocator, MarsAutoDateFormatter, MarsDateConverter
+
+
+def test_locator_picks_calendar_boundaries_by_span():
+    loc = MarsAutoDateLocator()
+    start = mdt.MarsDate(214, 1, 1).to_ordinal()
+
+    ticks = loc.tick_values(start, start + 5)
+    assert loc.unit == "sol"
+    assert list(np.diff(ticks)) == [1] * (len(ticks) - 1)
+
+    ticks = loc.tick_values(start, start + 300)
+    assert loc.unit == "month"
+    assert all(mdt.MarsDate.from_ordinal(int(t)).sol == 1 for t in ticks)
+
+    ticks = loc.tick_values(start, start + 20000)
+    assert loc.unit == "year"
+    assert all(mdt.MarsDate.from_ordinal(int(t)).format("%m/%d") == "01/01" for t in ticks)
+    assert len(ticks) <= loc.maxticks + 1
+
+
+def test_formatter_labels_follow_locator_unit_and_are_cached():
+    loc = MarsAutoDateLocator()
+    fmt = MarsAutoDateFormatter(loc)
+    start = mdt.MarsDate(214, 3, 1).to_ordinal()
+
+    loc.tick_values(start, start + 300)
+    assert fmt(start) == "214/03"
+    assert (start, "%Y/%m") in fmt._labels
+    assert fmt(np.nan) == "NaT"
+
+
+def test_converter_uses_ordinal_buffer_and_datetime_fractions():
+    arr = mdt.MarsDateArray([mdt.MarsDate(214, 1, 1), None])
+    out = MarsDateConverter.convert(arr, None, None)
+    assert out[0] == arr[0].to_ordinal() and np.isnan(out[1])
+
+    t = mdt.MarsDateTime(214, 1, 1, 12, 0, 0)
+    out = MarsDateConverter.convert([t, None], None, None)
+    assert out[0] == t.to_ordinal_float() and np.isnan(out[1])
+
+
+def test_downsamplers_keep_endpoints_and_peaks():
+    from mars_dtc.plotting import _minmax_indices, _lttb_indices
+
+    x = np.arange(100_000, dtype="float64")
+    y = np.sin(x / 1000)
+    y[54321] = 10.0
+
+    for pick in (_minmax_indices, _lttb_indices):
+        idx = pick(x, y, 200)
+        assert len(idx) <= 2 * 200 + 2
+        assert idx[0] == 0 and idx[-1] == len(x) - 1
+        assert np.all(np.diff(idx) > 0)
+        assert 54321 in idx
+
+
+def test_plot_downsample_redecimates_on_zoom():
+    import pandas as pd
+    import mars_dtc
+
+    start = mdt.MarsDate(214, 1, 1).to_ordinal()
+    n = 50_000
+    dates = mdt.MarsDateArray(list(range(start, start + n)))
+    df = pd.DataFrame({"darian_date": dates, "value": np.random.default_rng(0).random(n)})
+
+    ax = mars_dtc.plot(df, x="darian_date", y="value", downsample="minmax")
+    line = ax.lines[0]
+    assert len(line.get_xdata()) < n
+
+    ax.set_xlim(start + 100, start + 150)
+    xdata = line.get_xdata()
+    assert xdata.min() >= start + 99 and xdata.max() <= start + 151
+
+
+def test_plot_applies_axes_keywords_instead_of_passing_them_to_lines():
+    import pandas as pd
+    import matplotlib.pyplot as plt
+    import mars_dtc
+
+    dates = mdt.MarsDateArray([mdt.MarsDate(214, 1, s) for s in range(1, 11)])
+    df = pd.DataFrame({"darian_date": dates, "a": np.arange(10.0), "b": np.arange(10.0) * 2})
+    for downsample in (None, "minmax"):
+        ax = mars_dtc.plot(df, x="darian_date", y=["a", "b"], title="Temps", grid=False,
+                           ylabel="K", ylim=(0, 30), downsample=downsample, color="k")
+        assert ax.get_title() == "Temps" and ax.get_ylabel() == "K"
+        assert ax.get_ylim() == (0, 30) and ax.get_xlabel() == "darian_date"
+        assert not any(line.get_visible() for line in ax.get_xgridlines())
+        assert len(ax.lines) == 2 and ax.lines[0].get_color() == "k"
+        plt.close(ax.figure)
@@ -19,3 +19,55 @@ def test_json_and_yaml_roundtrip():
     parsed_yaml = yaml.safe_load(y)
     assert parsed_json["year"] == 214
     assert parsed_yaml["month"] == 14
+
+
+def test_bulk_encode_decode_representations():
+    from mars_dtc import encode_dates, decode_dates
+
+    arr = mdt.MarsDateArray([mdt.MarsDate(214, 14, 28), None, mdt.MarsDate(-5, 24, 28)])
+    assert encode_dates(arr) == ["+0214-14-28", None, "-0005-24-28"]
+    assert encode_dates(arr, "ordinal")[1] is None
+
+    for representation in ("iso", "ordinal", "dict"):
+        encoded = encode_dates(arr, representation)
+        assert encoded == encode_dates(list(arr), representation)
+        assert list(decode_dates(encoded)) == list(arr)
+
+
+def test_ndjson_streaming_roundtrip():
+    import io
+    from mars_dtc import write_ndjson, read_ndjson
+
+    values = [mdt.MarsDate(214, 14, 28), None, mdt.MarsDateTime(214, 1, 1, 3, 4, 5)]
+    for representation in ("iso", "ordinal", "dict"):
+        buf = io.StringIO()
+        assert write_ndjson(values, buf, representation=representation, chunksize=2) == 3
+        assert len(buf.getvalue().splitlines()) == 3
+        buf.seek(0)
+        restored = list(read_ndjson(buf))
+        assert restored[0] == values[0] and restored[1] is None
+        assert isinstance(restored[2], mdt.MarsDateTime) and restored[2] == values[2]
+
+
+def test_json_encoder_hook_and_yaml_bulk():
+    from mars_dtc import MarsJSONEncoder, mars_object_hook, dump_yaml, load_yaml
+
+    arr = mdt.MarsDateArray([mdt.MarsDate(214, 14, 28), mdt.MarsDate(1, 1, 1)])
+    payload = json.loads(json.dumps({"dates": arr, "dt": mdt.MarsTimedelta(2)}, cls=MarsJSONEncoder))
+    assert payload == {"dates": ["+0214-14-28", "+0001-01-01"], "dt": 2.0}
+
+    restored = json.loads(mdt.MarsDate(214, 14, 28).to_json(), object_hook=mars_object_hook)
+    assert restored == mdt.MarsDate(214, 14, 28)
+
+    assert list(load_yaml(dump_yaml(arr))) == list(arr)
+
+
+def test_datetimes_roundtrip_through_yaml_and_decode():
+    from mars_dtc import decode_dates, dump_yaml, encode_dates, load_yaml
+
+    values = [mdt.MarsDateTime(214, 1, 1, 3, 4, 5), None, mdt.MarsDate(214, 14, 28)]
+    restored = load_yaml(dump_yaml(values))
+    assert restored.dtype == object and list(restored) == values
+    assert isinstance(restored[0], mdt.MarsDateTime)
+    for representation in ("iso", "ordinal", "dict"):
+        assert list(decode_dates(encode_dates(values, representation))) == values
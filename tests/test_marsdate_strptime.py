@@ -0,0 +1,62 @@
+import pytest
+import mars_dtc.mars_dtc as mdt
+
+
+def test_strptime_roundtrips_format_codes():
+    d = mdt.MarsDate(214, 12, 12)
+    for fmt in ("%Y/%m/%d", "%A, %d %B %Y", "%a %b %d %Y", "%d.%m.%Y"):
+        assert mdt.MarsDate.strptime(d.format(fmt), fmt) == d
+
+    neg = mdt.MarsDate(-5, 24, 28)
+    assert mdt.MarsDate.strptime(neg.format("%Y-%m-%d"), "%Y-%m-%d") == neg
+
+
+def test_strptime_names_are_case_insensitive_and_whitespace_flexible():
+    d = mdt.MarsDate.strptime("sol martis,   12 RISHABHA 214", "%A, %d %B %Y")
+    assert d == mdt.MarsDate(214, 12, 12)
+
+
+def test_strptime_datetime_time_fields():
+    t = mdt.MarsDateTime.strptime("214-12-22T13:05:09", "%Y-%m-%dT%H:%M:%S")
+    assert isinstance(t, mdt.MarsDateTime)
+    assert (t.year, t.month, t.sol, t.hour, t.minute, t.second) == (214, 12, 22, 13, 5, 9)
+
+
+def test_strptime_rejects_mismatches():
+    with pytest.raises(ValueError):
+        mdt.MarsDate.strptime("214/12", "%Y/%m/%d")
+    with pytest.raises(ValueError):
+        mdt.MarsDate.strptime("14/12/12", "%y/%m/%d")
+
+
+def test_strptime_weekday_is_ignored_unless_strict():
+    fmt = "%A, %d %B %Y"
+    assert mdt.MarsDate.strptime("Sol Jovis, 12 Rishabha 214", fmt) == mdt.MarsDate(214, 12, 12)
+    assert list(mdt.MarsDateArray.strptime(["Sol Jovis, 12 Rishabha 214"], fmt)) == \
+        [mdt.MarsDate(214, 12, 12)]
+
+    with pytest.raises(ValueError, match="Weekday"):
+        mdt.MarsDate.strptime("Sol Jovis, 12 Rishabha 214", fmt, strict=True)
+    with pytest.raises(ValueError, match="Weekday"):
+        mdt.MarsDateTime.strptime("Sol Jovis, 12 Rishabha 214", fmt, strict=True)
+    with pytest.raises(ValueError, match="Weekday"):
+        mdt.MarsDateArray.strptime(["Sol Jovis, 12 Rishabha 214"], fmt, strict=True)
+    assert mdt.MarsDate.strptime("Sol Martis, 12 Rishabha 214", fmt, strict=True) == \
+        mdt.MarsDate(214, 12, 12)
+
+
+def test_parser_is_compiled_once_per_format():
+    from mars_dtc.mars_dtc import _compile_parser
+
+    first = _compile_parser("%Y-%m-%d", mdt.DarianCalendar)
+    assert _compile_parser("%Y-%m-%d", mdt.DarianCalendar) is first
+
+
+def test_array_strptime_bulk():
+    arr = mdt.MarsDateArray.strptime(
+        ["214 Rishabha 12", None, "-5 Vrishika 28", "214 Rishabha 12"], "%Y %B %d")
+    assert list(arr) == [mdt.MarsDate(214, 12, 12), None,
+                         mdt.MarsDate(-5, 24, 28), mdt.MarsDate(214, 12, 12)]
+
+    with pytest.raises(ValueError):
+        mdt.MarsDateArray.strptime(["214 Rishabha 29"], "%Y %B %d")
@@ -0,0 +1,141 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mars_dtc
+import mars_dtc.mars_dtc as mdt
+
+
+def _series():
+    ordinals = np.array([0, 1, 2, 5, 9, 10, 30])
+    index = pd.Index(mdt.MarsDateArray.from_ordinals(ordinals))
+    return pd.Series([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0], index=index), ordinals
+
+
+def _brute(ordinals, values, lo_off, hi_off, closed, func):
+    out = []
+    for t in ordinals:
+        lo, hi = t + lo_off, t + hi_off
+        left = ordinals > lo if closed in ("right", "neither") else ordinals >= lo
+        right = ordinals <= hi if closed in ("right", "both") else ordinals < hi
+        window = values[left & right]
+        out.append(func(window) if len(window) else np.nan)
+    return np.array(out)
+
+
+@pytest.mark.parametrize("closed", ["right", "left", "both", "neither"])
+@pytest.mark.parametrize("agg,func", [("sum", np.sum), ("mean", np.mean), ("min", np.min),
+                                      ("max", np.max), ("count", len)])
+def test_rolling_matches_brute_force(closed, agg, func):
+    s, ordinals = _series()
+    result = mars_dtc.rolling_sols(s, "5sol", agg=agg, closed=closed)
+    expected = _brute(ordinals, s.to_numpy(), -5, 0, closed, func)
+    if agg == "count":
+        # Like pandas, an empty window is below min_periods=1
+        expected = expected.astype(float)
+        expected[expected == 0] = np.nan
+    np.testing.assert_allclose(result.to_numpy(), expected)
+
+
+def test_rolling_centered_on_a_column():
+    s, ordinals = _series()
+    frame = pd.DataFrame({"date": s.index.array, "temp": s.to_numpy(), "label": list("abcdefg")})
+    result = mars_dtc.rolling_sols(frame, 4, agg="mean", on="date", center=True)
+    assert list(result.columns) == ["date", "temp"]
+    expected = _brute(ordinals, s.to_numpy(), -2, 2, "right", np.mean)
+    np.testing.assert_allclose(result["temp"].to_numpy(), expected)
+
+
+def test_rolling_rejects_bad_input():
+    s, _ = _series()
+    with pytest.raises(ValueError, match="sorted"):
+        mars_dtc.rolling_sols(s.iloc[::-1], 5)
+    with pytest.raises(ValueError, match="window"):
+        mars_dtc.rolling_sols(s, "5 days")
+
+
+@pytest.mark.parametrize("direction", ["backward", "forward", "nearest"])
+@pytest.mark.parametrize("tolerance", [None, 3])
+@pytest.mark.parametrize("exact", [True, False])
+def test_merge_asof_matches_pandas_on_ordinals(direction, tolerance, exact):
+    rng = np.random.default_rng(7)
+    left_ord = np.sort(rng.integers(0, 200, 60))
+    right_ord = np.sort(rng.choice(200, 25, replace=False))
+    left = pd.DataFrame({"date": mdt.MarsDateArray.from_ordinals(left_ord), "a": np.arange(60)})
+    right = pd.DataFrame({"date": mdt.MarsDateArray.from_ordinals(right_ord),
+                          "b": np.arange(25) * 10.0})
+
+    result = mars_dtc.merge_asof_sols(left, right, on="date", direction=direction,
+                                      tolerance=tolerance, allow_exact_matches=exact)
+    expected = pd.merge_asof(
+        pd.DataFrame({"k": left_ord, "a": np.arange(60)}),
+        pd.DataFrame({"k": right_ord, "b": np.arange(25) * 10.0}),
+        on="k", direction=direction, tolerance=tolerance, allow_exact_matches=exact)
+    assert list(result.columns) == ["date", "a", "b"]
+    np.testing.assert_array_equal(result["b"].to_numpy(), expected["b"].to_numpy())
+
+
+def test_merge_asof_unsorted_left_datetimes_and_suffixes():
+    left = pd.DataFrame({
+        "t": [mdt.MarsDateTime(214, 1, 3, 10), mdt.MarsDateTime(214, 1, 1, 6), None],
+        "v": [1, 2, 3],
+    })
+    right = pd.DataFrame({
+        "when": mdt.MarsDateArray([mdt.MarsDate(214, 1, 3), mdt.MarsDate(214, 1, 1), None]),
+        "v": [30, 10, 99],
+    })
+    result = mars_dtc.merge_asof_sols(left, right, left_on="t", right_on="when",
+                                      direction="nearest", tolerance="0.5sol")
+    assert list(result.columns) == ["t", "v_x", "when", "v_y"]
+    assert result["v_y"].tolist()[:2] == [30.0, 10.0]
+    assert np.isnan(result["v_y"][2])
+    assert result["when"][0] == mdt.MarsDate(214, 1, 3)
+    assert result["when"].isna().tolist() == [False, False, True]
+
+
+def test_find_sol_gaps():
+    dates = mdt.MarsDateArray.from_ordinals(np.array([10, 3, 4, 4, 9, 20]))
+    gaps = mars_dtc.find_sol_gaps(pd.Series(dates))
+    assert gaps["start"].tolist() == [mdt.MarsDate.from_ordinal(5), mdt.MarsDate.from_ordinal(11)]
+    assert gaps["end"].tolist() == [mdt.MarsDate.from_ordinal(8), mdt.MarsDate.from_ordinal(19)]
+    assert gaps["length"].tolist() == [4, 9]
+    assert len(mars_dtc.find_sol_gaps(dates, min_length=5)) == 1
+
+
+def test_reindex_sols_fills_missing_sols_and_months():
+    frame = pd.DataFrame({
+        "date": mdt.MarsDateArray.from_ordinals(np.array([3, 0, 1])),
+        "temp": [3.0, 0.0, 1.0],
+    })
+    dense = mars_dtc.reindex_sols(frame, on="date")
+    assert dense["date"].tolist() == [mdt.MarsDate.from_ordinal(o) for o in range(4)]
+    np.testing.assert_array_equal(dense["temp"].to_numpy(), [0.0, 1.0, np.nan, 3.0])
+
+    months = pd.Series([1.0, 2.0], index=pd.Index(mdt.MarsDateArray(
+        [mdt.MarsDate(214, 23, 1), mdt.MarsDate(215, 2, 1)])))
+    monthly = mars_dtc.reindex_sols(months, freq="month", fill_value=0.0)
+    assert [d.format("%Y-%m") for d in monthly.index] == ["214-23", "214-24", "215-01", "215-02"]
+    assert monthly.tolist() == [1.0, 0.0, 0.0, 2.0]
+
+
+def test_interpolate_sols_onto_datetime_grid():
+    frame = pd.DataFrame({
+        "t": [mdt.MarsDateTime(214, 1, 3), mdt.MarsDateTime(214, 1, 1), mdt.MarsDateTime(214, 1, 2)],
+        "temp": [-60.0, -80.0, np.nan],
+        "label": ["a", "b", "c"],
+    })
+    result = mars_dtc.interpolate_sols(frame, "0.5sol", on="t")
+    assert list(result.columns) == ["temp"]
+    assert result.index[1] == mdt.MarsDateTime(214, 1, 1, 12)
+    np.testing.assert_allclose(result["temp"].to_numpy(), [-80, -75, -70, -65, -60])
+
+
+def test_demo_weather_data_gaps():
+    weather = mars_dtc.read_mars_csv(
+        Path(__file__).parents[1] / "demo" / "mars_weather_data.csv", date_columns="darian_date")
+    gaps = mars_dtc.find_sol_gaps(weather["darian_date"])
+    dense = mars_dtc.reindex_sols(weather.drop_duplicates("darian_date").sort_values("darian_date"),
+                                  on="darian_date")
+    assert len(dense) == len(weather["darian_date"].unique()) + gaps["length"].sum()
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import mars_dtc.mars_dtc as mdt
+from mars_dtc.darian_calendar import DarianCalendar
+
+
+def test_from_components_matches_scalars():
+    arr = mdt.MarsDateArray.from_components(
+        np.array([214, -3, 0]), np.array([14, 24, 1]), np.array([20, 28, 1]))
+    assert list(arr) == [mdt.MarsDate(214, 14, 20), mdt.MarsDate(-3, 24, 28), mdt.MarsDate(0, 1, 1)]
+
+
+def test_from_components_reports_every_invalid_row():
+    # Year 2 is not a leap year, so 24/28 is invalid there
+    with pytest.raises(ValueError, match=r"3 invalid date\(s\) at rows 1: .*, 2: .*, 4: "):
+        mdt.MarsDateArray.from_components(
+            [214, 214, 2, 214, 214], [1, 25, 24, 6, 6], [1, 1, 28, 27, 28])
+
+
+def test_from_components_coerce_and_missing():
+    frame = pd.DataFrame({
+        "darian_year": pd.array([214, None, 214, 214], dtype="Int64"),
+        "darian_month": [1, 2, 0, 3],
+        "darian_sol": [5.0, 1.0, 1.0, 2.5],
+    })
+    arr = mdt.MarsDateArray.from_components(
+        frame["darian_year"], frame["darian_month"], frame["darian_sol"], errors="coerce")
+    assert arr[0] == mdt.MarsDate(214, 1, 5)
+    assert arr.isna().tolist() == [False, True, True, True]
+
+
+def test_valid_dates_mask_matches_validate_date():
+    cal = DarianCalendar()
+    years = np.repeat(np.arange(-12, 12), 26 * 30)
+    months = np.tile(np.repeat(np.arange(0, 26), 30), 24)
+    sols = np.tile(np.arange(0, 30), 24 * 26)
+    mask = cal.valid_dates(years, months, sols)
+    # Same answers as the generic scalar fallback
+    expected = super(DarianCalendar, cal).valid_dates(years, months, sols)
+    assert (mask == expected).all()
+    assert mask.sum() == sum(sum(cal.month_lengths(y)) for y in range(-12, 12))
+
+
+def test_from_ordinals_and_int_fast_paths():
+    ordinals = np.array([0, 143000, -5], dtype="int32")
+    arr = mdt.MarsDateArray.from_ordinals(ordinals)
+    assert arr._ordinals.dtype == np.int64
+    assert arr[1] == mdt.MarsDate.from_ordinal(143000)
+
+    with_nan = mdt.MarsDateArray.from_ordinals(np.array([1.0, np.nan]))
+    assert with_nan.isna().tolist() == [False, True]
+
+    series = pd.Series(np.arange(3), dtype="marsdate")
+    assert series.iloc[2] == mdt.MarsDate.from_ordinal(2)
+    assert (mdt.MarsDateArray(np.arange(3))._ordinals == np.arange(3)).all()
+
+
+def test_datetimes_are_rejected_rather_than_truncated():
+    with pytest.raises(TypeError, match="not MarsDateTime"):
+        mdt.MarsDateArray([mdt.MarsDate(214, 1, 1), mdt.MarsDateTime(214, 1, 2, 13, 0, 0)])
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import mars_dtc.mars_dtc as mdt
+
+D = mdt.MarsDate
+
+
+def make_array():
+    return mdt.MarsDateArray([D(214, 1, 5), None, D(214, 1, 2), D(214, 1, 5)])
+
+
+def test_sort_argsort_and_unique_put_missing_last():
+    arr = make_array()
+    assert list(np.sort(arr)) == [D(214, 1, 2), D(214, 1, 5), D(214, 1, 5), None]
+    assert np.argsort(arr).tolist() == [2, 0, 3, 1]
+
+    uniques, index, inverse, counts = np.unique(
+        arr, return_index=True, return_inverse=True, return_counts=True)
+    assert isinstance(uniques, mdt.MarsDateArray)
+    assert list(uniques) == [D(214, 1, 2), D(214, 1, 5), None]
+    assert index.tolist() == [2, 0, 1]
+    assert inverse.tolist() == [1, 2, 0, 1]
+    assert counts.tolist() == [1, 2, 1]
+
+
+def test_searchsorted_diff_and_extrema():
+    arr = np.sort(make_array())
+    assert np.searchsorted(arr, D(214, 1, 3)) == 1
+    assert arr.searchsorted([D(214, 1, 5)], side="right").tolist() == [3]
+
+    assert [d.sols if d else None for d in np.diff(arr)] == [3, 0, None]
+    with pytest.raises(TypeError, match="n=1"):
+        np.diff(arr, n=2)
+
+    other = mdt.MarsDateArray([D(214, 1, 1), D(214, 1, 9), None, None])
+    assert list(np.maximum(arr, other)) == [D(214, 1, 2), D(214, 1, 9), None, None]
+    assert list(np.fmax(arr, other)) == [D(214, 1, 2), D(214, 1, 9), D(214, 1, 5), None]
+    assert list(np.minimum(arr, D(214, 1, 3))) == [D(214, 1, 2), D(214, 1, 3), D(214, 1, 3), None]
+    assert np.maximum.reduce(arr) == np.max(arr) == D(214, 1, 5)
+    assert np.min(arr) == D(214, 1, 2)
+
+
+def test_integer_view_and_other_ufuncs():
+    arr = make_array()
+    ints = np.asarray(arr, dtype="int64")
+    assert np.shares_memory(ints, arr._ordinals)
+    assert not arr.asi8.flags.writeable
+    assert arr.asi8[0] == D(214, 1, 5).to_ordinal()
+
+    assert np.isnan(arr).tolist() == [False, True, False, False]
+    assert np.less(D(214, 1, 3), arr).tolist() == [True, False, False, True]
+    assert list(np.add(arr, mdt.MarsTimedelta(1)))[0] == D(214, 1, 6)
+    assert isinstance(np.concatenate([arr, arr]), mdt.MarsDateArray)
+    # Unhandled ufuncs still see float ordinals
+    assert np.isnan(np.sqrt(arr)[1])
+
+    series = np.maximum(pd.Series(arr), D(214, 1, 3))
+    assert str(series.dtype) == "marsdate"
+    assert series[2] == D(214, 1, 3)
+
+
+def test_conversions_with_missing_values_and_copy():
+    arr = make_array()
+    with pytest.raises(ValueError, match="missing values to int64"):
+        arr.to_numpy(dtype="int64")
+    assert arr.to_numpy(dtype="int64", na_value=-1)[1] == -1
+    assert np.isnan(pd.Series(arr).to_numpy()[1])
+
+    # Integer arrays expose the missing sentinel, as asi8 does
+    ints = np.array(arr, dtype=int)
+    assert ints[1] == np.iinfo(np.int64).min
+    assert not np.shares_memory(ints, arr._ordinals)
+    assert np.shares_memory(np.asarray(arr, dtype="int64", copy=False), arr._ordinals)
+    with pytest.raises(ValueError, match="avoid a copy"):
+        np.asarray(arr, copy=False)
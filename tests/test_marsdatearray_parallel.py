@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+import mars_dtc.mars_dtc as mdt
+
+
+def _mixed(n):
+    values = []
+    for i in range(n):
+        kind = i % 4
+        if kind == 0:
+            values.append(mdt.MarsDate.from_ordinal(143000 + i))
+        elif kind == 1:
+            values.append(mdt.MarsDate.from_ordinal(143000 + i).format("%Y-%m-%d"))
+        elif kind == 2:
+            values.append(143000 + i)
+        else:
+            values.append(None)
+    return values
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_parallel_matches_serial(processes):
+    values = _mixed(1000)
+    serial = mdt.MarsDateArray(values)
+    parallel = mdt.MarsDateArray.from_values(values, workers=3, chunksize=97, processes=processes)
+    np.testing.assert_array_equal(parallel._ordinals, serial._ordinals)
+
+
+def test_all_string_chunks_and_iterables():
+    strings = [mdt.MarsDate.from_ordinal(o).format("%Y/%m/%d") for o in range(-50, 50)]
+    arr = mdt.MarsDateArray.from_values(iter(strings), workers=2, chunksize=30)
+    np.testing.assert_array_equal(arr._ordinals, np.arange(-50, 50))
+    assert len(mdt.MarsDateArray.from_values([], workers=4)) == 0
+
+
+def test_error_reports_absolute_position():
+    values = _mixed(200)
+    values[157] = "not a date"
+    with pytest.raises(ValueError, match="position 157"):
+        mdt.MarsDateArray.from_values(values, workers=4, chunksize=50)
+    values[157] = object()
+    with pytest.raises(TypeError, match="position 157"):
+        mdt.MarsDateArray.from_values(values, workers=4, chunksize=50)
@@ -38,6 +38,16 @@ def test_to_and_from_ordinal_float():
     assert rebuilt == t
 
 
+def test_from_ordinal_float_negative_year():
+    t = mdt.MarsDateTime(-214, 14, 28, 12, 0, 0)
+    rebuilt = mdt.MarsDateTime.from_ordinal_float(t.to_ordinal_float())
+    assert rebuilt == t
+    # Just before ordinal 0 the sol is -1, not 0
+    prev = mdt.MarsDate.from_ordinal(-1)
+    assert mdt.MarsDateTime.from_ordinal_float(-0.25) == \
+        mdt.MarsDateTime(prev.year, prev.month, prev.sol, 18, 0, 0)
+
+
 def test_arithmetic_with_timedelta_and_datetime():
     t1 = mdt.MarsDateTime(214, 14, 28, 12, 0, 0)
     t2 = mdt.MarsDateTime(214, 14, 28, 15, 0, 0)
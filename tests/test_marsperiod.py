@@ -0,0 +1,70 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mars_dtc.mars_dtc as mdt
+
+D = mdt.MarsDate
+
+
+def test_period_scalar_bounds_and_arithmetic():
+    p = mdt.MarsPeriod(214, 24)
+    assert p.code == 214 * 24 + 23
+    assert str(p) == "214/24"
+    assert p.start_date() == D(214, 24, 1)
+    assert p.end_date() == D(214, 24, 27)
+    assert p.n_sols == 27
+    assert p + 1 == mdt.MarsPeriod(215, 1)
+    assert (p + 3) - p == 3
+    assert D(214, 24, 3) in p and D(215, 1, 1) not in p
+    assert pickle.loads(pickle.dumps(p)) == p
+
+    q = D(214, 14, 20).to_period("quarter")
+    assert str(q) == "214Q3"
+    assert (q.start_date(), q.end_date(), q.n_sols) == (D(214, 13, 1), D(214, 18, 27), 167)
+    assert mdt.MarsPeriod(-1, freq="year").start_date() == D(-1, 1, 1)
+
+    with pytest.raises(ValueError, match="between 1 and 24"):
+        mdt.MarsPeriod(214, 25)
+    with pytest.raises(TypeError, match="different freq"):
+        p < q
+
+
+def test_period_array_from_dates_and_bounds():
+    dates = mdt.MarsDateArray([D(214, 1, 5), None, D(214, 24, 27), D(215, 1, 1)])
+    periods = dates.to_period("month")
+    assert isinstance(periods, mdt.MarsPeriodArray)
+    assert str(periods.dtype) == "marsperiod[month]"
+    assert list(periods) == [mdt.MarsPeriod(214, 1), None, mdt.MarsPeriod(214, 24), mdt.MarsPeriod(215, 1)]
+    assert list(periods.start_dates()) == [D(214, 1, 1), None, D(214, 24, 1), D(215, 1, 1)]
+    assert list(periods.end_dates()) == [D(214, 1, 28), None, D(214, 24, 27), D(215, 1, 28)]
+    assert periods.n_sols().tolist() == [28, pd.NA, 27, 28]
+
+    assert list(periods + 1)[2] == mdt.MarsPeriod(215, 1)
+    assert (periods - periods[0]).tolist() == [0, pd.NA, 23, 24]
+    assert (periods >= mdt.MarsPeriod(214, 24)).tolist() == [False, False, True, True]
+    assert list(pickle.loads(pickle.dumps(periods))) == list(periods)
+
+
+def test_group_by_period_codes():
+    dates = mdt.MarsDateArray.from_ordinals(np.arange(0, 2000, dtype="int64"))
+    df = pd.DataFrame({"date": dates, "value": 1})
+    df["year"] = df["date"].array.to_period("year")
+    counts = df.groupby("year")["value"].sum()
+    assert counts.tolist() == [669, 669, 662]
+    assert counts.index[0] == mdt.MarsPeriod(0, freq="year")
+
+    series = pd.Series([mdt.MarsPeriod(214, 2), None, mdt.MarsPeriod(214, 2)], dtype="marsperiod[month]")
+    assert series.value_counts().tolist() == [2]
+    assert series.astype(str).tolist() == ["214/02", "NaT", "214/02"]
+
+
+def test_period_array_to_numpy_with_missing():
+    periods = mdt.MarsPeriodArray._from_sequence([mdt.MarsPeriod(214, 2), None])
+    codes = np.asarray(periods, dtype="float64")
+    assert codes[0] == mdt.MarsPeriod(214, 2).code and np.isnan(codes[1])
+    with pytest.raises(ValueError, match="missing values to int64"):
+        np.asarray(periods, dtype="int64")
+    assert np.asarray(periods[:1], dtype="int64").tolist() == [mdt.MarsPeriod(214, 2).code]
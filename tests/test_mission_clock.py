@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import mars_dtc
+import mars_dtc.mars_dtc as mdt
+import mars_dtc.missions
+from mars_dtc.missions import missions
+
+
+def test_curiosity_sols_match_demo_dates():
+    clock = mars_dtc.MissionClock.for_mission("curiosity")
+    sols = pd.Series([10, 11, None, 1000])
+    dates = clock.to_darian(sols)
+    assert isinstance(dates, mdt.MarsDateArray)
+    assert list(dates[:2]) == [mdt.MarsDate(214, 12, 22), mdt.MarsDate(214, 12, 23)]
+    assert dates.isna().tolist() == [False, False, True, False]
+    assert clock.to_darian(10) == mdt.MarsDate(214, 12, 22)
+
+    back = clock.to_mission_sol(dates)
+    assert back.tolist() == [10, 11, pd.NA, 1000]
+    assert clock.to_mission_sol(mdt.MarsDate(214, 12, 22)) == 10
+
+    for missing in (None, float("nan"), pd.NA):
+        assert clock.to_darian(missing) is None
+        assert clock.to_mission_sol(missing) is None
+    assert clock.to_mission_sol(mdt.MarsDate(214, 12, 22).to_ordinal() + 0.5, fractional=True) == 10.5
+
+
+def test_fractional_sols_and_local_times():
+    epoch = mdt.MarsDateTime(214, 12, 12, 12, 0, 0)
+    clock = mars_dtc.MissionClock(epoch, first_sol=1)
+    assert clock.to_ordinals([1])[0] == epoch.to_ordinal_float()
+    assert list(clock.to_darian([1.25, 1.5])) == [mdt.MarsDate(214, 12, 12), mdt.MarsDate(214, 12, 13)]
+
+    times = clock.to_datetimes([2, 3, None], local_time=["06:00", "18:00:00", "00:00"])
+    assert times[0] == mdt.MarsDateTime(214, 12, 13, 18, 0, 0)
+    assert times[1] == mdt.MarsDateTime(214, 12, 15, 6, 0, 0)
+    assert times[2] is None
+
+    ordinals = clock.to_ordinals([2.75])
+    assert clock.to_mission_sol(ordinals, fractional=True).tolist() == [2.75]
+    with pytest.raises(ValueError, match="Invalid local time"):
+        clock.to_ordinals([1], local_time=["noon"])
+
+
+def test_registry_and_cross_mission_alignment(monkeypatch):
+    assert {"curiosity", "perseverance", "spirit"} <= set(missions())
+    curiosity = mars_dtc.MissionClock.for_mission("MSL")
+    perseverance = mars_dtc.MissionClock.for_mission("perseverance")
+    assert perseverance.to_darian(0) == mdt.MarsDate(219, 1, 12)
+    assert mars_dtc.MissionClock.for_mission("spirit").to_darian(1) == mdt.MarsDate(209, 22, 25)
+
+    offset = perseverance.epoch.to_ordinal() - curiosity.epoch.to_ordinal()
+    assert curiosity.convert([offset, np.nan], perseverance).tolist() == [0, pd.NA]
+
+    monkeypatch.setattr(mars_dtc.missions, "_MISSIONS", dict(mars_dtc.missions._MISSIONS))
+    mars_dtc.register_mission("test-lander", mdt.MarsDate(220, 1, 1), first_sol=1)
+    assert mars_dtc.MissionClock.for_mission("test-lander").to_darian(2) == mdt.MarsDate(220, 1, 2)
+    with pytest.raises(ValueError, match="Unknown mission"):
+        mars_dtc.MissionClock.for_mission("beagle-2")